@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for JobScanner Pro, run from the project root.
+"""
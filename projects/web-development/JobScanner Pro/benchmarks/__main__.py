@@ -0,0 +1,77 @@
+"""
+Run the full benchmark suite: saved result pages through the scrapers'
+parsers, then the pipeline stages on synthetic result sets.
+
+Usage (from the project root):
+    python -m benchmarks [--sizes 1000 10000] [--save baseline.json]
+    python -m benchmarks --compare baseline.json [--tolerance 0.25]
+
+With --compare, the exit status is 1 if any case's throughput fell or its
+peak memory grew by more than the tolerance.
+"""
+
+import argparse
+import json
+import sys
+
+from . import parsers, pipeline
+from .measure import print_rows
+
+def regressions(rows, baseline, tolerance):
+    """
+    Cases that got slower or bigger than the baseline allows
+
+    Args:
+        rows (List[Dict]): Current results
+        baseline (List[Dict]): Saved results
+        tolerance (float): Allowed relative change, e.g. 0.25
+
+    Returns:
+        List[str]: One message per regression
+    """
+    previous = {(row["benchmark"], row["case"]): row for row in baseline}
+    messages = []
+    for row in rows:
+        old = previous.get((row["benchmark"], row["case"]))
+        if old is None:
+            continue
+        name = f"{row['benchmark']} {row['case']}"
+        if row["throughput"] < old["throughput"] * (1 - tolerance):
+            messages.append(
+                f"{name}: {row['throughput']:,.0f} {row['unit']} "
+                f"(baseline {old['throughput']:,.0f})"
+            )
+        if row["peak_mib"] and old.get("peak_mib") and row["peak_mib"] > old["peak_mib"] * (1 + tolerance):
+            messages.append(f"{name}: peak {row['peak_mib']:.1f} MiB (baseline {old['peak_mib']:.1f})")
+    return messages
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(pipeline.DEFAULT_SIZES), help="Synthetic result set sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best is reported")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory runs")
+    parser.add_argument("--save", metavar="PATH", help="Write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="Fail on regressions against saved results")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative change (default: 0.25)")
+    args = parser.parse_args()
+
+    memory = not args.no_memory
+    rows = parsers.replay(repeat=args.repeat, memory=memory)
+    rows += pipeline.run(args.sizes, args.repeat, memory)
+    print_rows(rows)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        found = regressions(rows, baseline, args.tolerance)
+        for message in found:
+            print(f"REGRESSION {message}")
+        if found:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Timing and peak-memory measurement shared by the benchmarks.
+"""
+
+import gc
+import time
+import tracemalloc
+
+def measure(run, setup=None, repeat=3, memory=True):
+    """
+    Time `run(setup())` and measure its peak allocated memory
+
+    `setup` builds fresh input for every call (outside the timing), so
+    stages that annotate their input, like the remote check, aren't
+    measured warm. The best of `repeat` timed calls is reported; peak
+    memory comes from one extra call under tracemalloc, which is slower
+    and so not timed.
+
+    Args:
+        run (callable): Code to measure, taking the setup result
+        setup (callable, optional): Builds the input for each call
+        repeat (int, optional): Timed calls
+        memory (bool, optional): Also measure peak memory
+
+    Returns:
+        dict: {"seconds": best time, "peak_mib": peak memory or None,
+            "result": return value of the last call}
+    """
+    setup = setup or (lambda: None)
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        data = setup()
+        gc.collect()
+        start = time.perf_counter()
+        result = run(data)
+        best = min(best, time.perf_counter() - start)
+
+    peak_mib = None
+    if memory:
+        data = setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run(data)
+            peak_mib = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        finally:
+            tracemalloc.stop()
+
+    return {"seconds": best, "peak_mib": peak_mib, "result": result}
+
+def print_rows(rows):
+    """Print benchmark rows as a table"""
+    print(f"{'benchmark':<10}{'case':<26}{'items':>8}{'seconds':>11}{'throughput':>14}{'':<8}{'peak MiB':>10}")
+    for row in rows:
+        peak = "-" if row["peak_mib"] is None else f"{row['peak_mib']:.1f}"
+        print(
+            f"{row['benchmark']:<10}{row['case']:<26}{row['items']:>8}{row['seconds']:>11.4f}"
+            f"{row['throughput']:>14,.0f} {row['unit']:<7}{peak:>10}"
+        )
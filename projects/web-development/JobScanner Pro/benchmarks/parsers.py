@@ -0,0 +1,95 @@
+"""
+Parse the saved search pages in debug_html/ with each installed HTML backend
+and report pages per second.
+
+Usage (from the project root):
+    python -m benchmarks.parsers [--seconds 1.0]
+
+`replay` runs the same pages through the configured backend only, with peak
+memory, for the full suite in `python -m benchmarks`.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from jobscanner.scrapers.craigslist import CraigslistScraper
+from jobscanner.scrapers.html_parser import BACKENDS, configure_parser
+from jobscanner.scrapers.jobbank import JobBankScraper
+from jobscanner.scrapers.kijiji import KijijiScraper
+
+from .measure import measure
+
+FIXTURES = Path(__file__).resolve().parent.parent / "debug_html"
+
+# Saved page -> function parsing it with the scraper's real parser
+PAGES = {
+    "jobbank.html": lambda html, scraper=JobBankScraper(): scraper._parse_search_page(html),
+    "kijiji.html": lambda html, scraper=KijijiScraper(): scraper._parse_search_page(html, "job", "art"),
+    "craigslist.html": lambda html, scraper=CraigslistScraper(): scraper._parse_search_page(html, "job"),
+}
+
+def pages_per_second(parse, html, seconds):
+    """Parse `html` repeatedly for about `seconds` and return the rate"""
+    count = 0
+    start = time.perf_counter()
+    while True:
+        parse(html)
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return count / elapsed
+
+def replay(pages=20, repeat=3, memory=True):
+    """
+    Parse each saved page `pages` times with the configured backend
+
+    Returns:
+        List[Dict]: One row per saved page (see measure.print_rows)
+    """
+    rows = []
+    for page, parse in PAGES.items():
+        path = FIXTURES / page
+        if not path.exists():
+            continue
+        html = path.read_text(encoding="utf-8")
+        result = measure(
+            lambda _: [parse(html) for _ in range(pages)][-1],
+            repeat=repeat,
+            memory=memory,
+        )
+        rows.append({
+            "benchmark": "parse",
+            "case": page,
+            "items": len(result["result"]),
+            "seconds": result["seconds"] / pages,
+            "throughput": pages / result["seconds"],
+            "unit": "pages/s",
+            "peak_mib": result["peak_mib"],
+        })
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=1.0, help="Time spent per backend and page")
+    args = parser.parse_args()
+
+    backends = sorted(BACKENDS)
+    print(f"{'page':<18}{'jobs':>6}" + "".join(f"{name + ' pages/s':>20}" for name in backends))
+    for page, parse in PAGES.items():
+        path = FIXTURES / page
+        if not path.exists():
+            print(f"{page:<18}  missing")
+            continue
+        html = path.read_text(encoding="utf-8")
+
+        rates = []
+        for name in backends:
+            configure_parser(name)
+            jobs = len(parse(html))
+            rates.append(pages_per_second(parse, html, args.seconds))
+        print(f"{page:<18}{jobs:>6}" + "".join(f"{rate:>20.1f}" for rate in rates))
+    configure_parser("auto")
+
+if __name__ == "__main__":
+    main()
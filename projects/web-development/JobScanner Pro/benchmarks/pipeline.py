@@ -0,0 +1,161 @@
+"""
+Run the post-scrape pipeline stages on synthetic result sets and report
+jobs per second and peak memory for each stage and size.
+
+Usage (from the project root):
+    python -m benchmarks.pipeline [--sizes 1000 10000 100000] [--repeat 3]
+"""
+
+import argparse
+import functools
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from jobscanner.core.filters import deduplicate_jobs, filter_jobs
+from jobscanner.core.scoring import score_jobs
+from jobscanner.core.search import JobSearch
+from jobscanner.utils.salary_parser import SalaryParser
+
+from .measure import measure, print_rows
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+LEVELS = ("Junior", "Senior", "Lead", "Freelance", "Contract", "Part-time", "")
+ROLES = (
+    "Graphic Designer", "Photographer", "Web Developer", "Video Editor",
+    "Illustrator", "Copywriter", "UX Designer", "Social Media Manager",
+    "Warehouse Associate", "Delivery Driver", "Event Staff", "Tutor",
+)
+COMPANY_WORDS = ("Maple", "Northern", "Peel", "Lakeshore", "Summit", "Pixel", "Harbour", "Credit Valley")
+COMPANY_SUFFIXES = ("Studios", "Media", "Logistics", "Inc.", "Group", "Agency")
+LOCATIONS = ("Brampton, ON", "Mississauga, ON", "Toronto, ON", "Oakville, ON", "Remote", "Canada")
+SOURCES = ("Job Bank", "Kijiji", "Craigslist", "Indeed")
+SALARIES = (
+    "$17.20 hourly", "$25.00 to $30.00 hourly", "$50,000 per year",
+    "$40K-60K", "$20/hr", "$4,500 monthly", "Negotiable", "", None,
+)
+DESCRIPTIONS = (
+    "Create visual concepts for print and digital campaigns.",
+    "Work from home with flexible hours; portfolio required.",
+    "On-site role at our downtown studio, weekends included.",
+    "Help with shoots and post-production for local events.",
+)
+
+def synthetic_jobs(count, seed=0, duplicate_rate=0.1):
+    """
+    Build a reproducible result set shaped like merged scraper output
+
+    About `duplicate_rate` of the jobs repost an earlier one under a new
+    URL with a reworded title, as cross-platform duplicates do.
+
+    Args:
+        count (int): Number of jobs
+        seed (int, optional): Random seed
+        duplicate_rate (float, optional): Share of reposted jobs
+
+    Returns:
+        List[Dict]: Job dicts
+    """
+    rng = random.Random(seed)
+    today = datetime.now().date()
+    companies = max(count // 20, 1)
+    # Numbered titles keep most postings distinct while still exercising
+    # the containment checks ("Tutor 12" in "Tutor 123")
+    titles = max(count // 10, 1)
+
+    jobs = []
+    for index in range(count):
+        if jobs and rng.random() < duplicate_rate:
+            job = dict(rng.choice(jobs))
+            job["title"] = f"{job['title']} - {job['location']}"
+            job["source"] = rng.choice(SOURCES)
+        else:
+            level = rng.choice(LEVELS)
+            job = {
+                "title": f"{level} {rng.choice(ROLES)} {rng.randrange(titles)}".strip(),
+                "company": (
+                    f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)} "
+                    f"{rng.randrange(companies)}"
+                ),
+                "location": rng.choice(LOCATIONS),
+                "type": "gig" if level in ("Freelance", "Contract") else "job",
+                "source": rng.choice(SOURCES),
+                "salary": rng.choice(SALARIES),
+                "posted_date": (today - timedelta(days=rng.randrange(7))).isoformat(),
+                "description": rng.choice(DESCRIPTIONS),
+            }
+        job["url"] = f"https://example.com/jobs/{index}"
+        job["id"] = f"bench_{index}"
+        jobs.append(job)
+    return jobs
+
+@functools.lru_cache(maxsize=None)
+def _exporter():
+    """A JobSearch without scrapers, built once outside the timings"""
+    return JobSearch({"search": {"platforms": {}}})
+
+def _export(jobs, format):
+    """Export through JobSearch.export_results into a throwaway file"""
+    with tempfile.TemporaryDirectory() as directory:
+        _exporter().export_results(jobs, str(Path(directory) / f"jobs.{format}"), format=format)
+    return jobs
+
+def _score(jobs):
+    """Rank against a title plus resume-style keywords, as the GUI does"""
+    score_jobs(jobs, ["graphic designer", "portfolio", "photoshop", "print"], [2.0, 1.0, 1.0, 1.0])
+    return jobs
+
+# Stage name -> function run on a fresh copy of the result set
+STAGES = {
+    "filter": lambda jobs: filter_jobs(jobs, new_only=True, remote_only=True),
+    "dedup": deduplicate_jobs,
+    "salary": lambda jobs: SalaryParser().filter_jobs_by_salary(jobs, min_salary=40000),
+    "score": _score,
+    "export_csv": lambda jobs: _export(jobs, "csv"),
+    "export_json": lambda jobs: _export(jobs, "json"),
+}
+
+def run(sizes=DEFAULT_SIZES, repeat=3, memory=True, stages=None):
+    """
+    Benchmark each pipeline stage at each result set size
+
+    Returns:
+        List[Dict]: One row per stage and size (see measure.print_rows)
+    """
+    _exporter()
+    rows = []
+    for size in sizes:
+        base = synthetic_jobs(size)
+        for name in stages or STAGES:
+            stage = STAGES[name]
+            result = measure(
+                stage,
+                setup=lambda: [dict(job) for job in base],
+                repeat=repeat,
+                memory=memory,
+            )
+            rows.append({
+                "benchmark": "pipeline",
+                "case": f"{name}/{size}",
+                "items": len(result["result"]),
+                "seconds": result["seconds"],
+                "throughput": size / result["seconds"],
+                "unit": "jobs/s",
+                "peak_mib": result["peak_mib"],
+            })
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Result set sizes")
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), help="Stages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage; the best is reported")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory run")
+    args = parser.parse_args()
+
+    print_rows(run(args.sizes, args.repeat, not args.no_memory, args.stages))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+Run the JobScanner Pro polling daemon: python -m jobscanner.auto
+"""
+
+from .daemon import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Background polling daemon for JobScanner Pro.
+Runs saved searches on their own intervals in one long-lived process.
+"""
+
+import logging
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+# Handle imports for both package and PyInstaller executable
+try:
+    from ..core.search import JobSearch
+    from ..scrapers.metrics import metrics
+    from .scheduler import SavedSearch, SearchScheduler
+except ImportError:
+    from jobscanner.core.search import JobSearch
+    from jobscanner.scrapers.metrics import metrics
+    from jobscanner.auto.scheduler import SavedSearch, SearchScheduler
+
+logger = logging.getLogger(__name__)
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """Serves /metrics (Prometheus text) and /metrics.json"""
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body = metrics.to_prometheus()
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        elif path == "/metrics.json":
+            body = metrics.to_json()
+            content_type = "application/json"
+        else:
+            self.send_error(404)
+            return
+
+        payload = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug("metrics %s - " + format, self.address_string(), *args)
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Serve scraper and search metrics from a background thread
+
+    Args:
+        port (int): Port to listen on (0 picks a free one)
+        host (str, optional): Interface to bind (default: localhost only)
+
+    Returns:
+        ThreadingHTTPServer: The running server; call shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_address[1]}/metrics")
+    return server
+
+class PollingDaemon:
+    """Runs saved searches incrementally, reusing one warm JobSearch"""
+
+    def __init__(self, config: Dict, searches: Optional[List[SavedSearch]] = None):
+        """
+        Args:
+            config (Dict): Loaded config.yml
+            searches (List[SavedSearch], optional): Searches to run
+                (default: the `auto.searches` config section)
+        """
+        self.config = config
+        if searches is None:
+            searches = [
+                SavedSearch.from_config(entry, config)
+                for entry in config.get("auto", {}).get("searches", [])
+            ]
+        self.searches = searches
+
+        # One JobSearch for the daemon's lifetime keeps scraper sessions,
+        # the response cache and the rate limiter warm between runs
+        self.job_search = JobSearch(config)
+        if self.job_search.store is None:
+            logger.warning("No database.path configured; every run will return all postings")
+
+        self._stop = threading.Event()
+        self.metrics_server = None
+
+    def start_metrics(self, port: Optional[int] = None):
+        """
+        Start the metrics endpoint if a port is given or configured
+
+        Args:
+            port (int, optional): Port overriding `auto.metrics.port`
+        """
+        settings = self.config.get("auto", {}).get("metrics") or {}
+        port = port if port is not None else settings.get("port")
+        if port is None or self.metrics_server is not None:
+            return
+        try:
+            self.metrics_server = start_metrics_server(port, settings.get("host", "127.0.0.1"))
+        except OSError as e:
+            logger.error(f"Could not start metrics server on port {port}: {e}")
+
+    def run_search(self, search: SavedSearch) -> List[Dict]:
+        """
+        Run one saved search, storing and returning only new postings
+
+        Args:
+            search (SavedSearch): Search to run
+
+        Returns:
+            List[Dict]: Postings not seen by earlier runs
+        """
+        start = time.monotonic()
+        try:
+            new_jobs = self.job_search.search(**search.search_kwargs(), incremental=True)
+        except Exception as e:
+            logger.error(f"Saved search '{search.name}' failed: {e}")
+            return []
+
+        logger.info(
+            f"Saved search '{search.name}': {len(new_jobs)} new postings "
+            f"in {time.monotonic() - start:.1f}s"
+        )
+        return new_jobs
+
+    def run_once(self) -> Dict[str, List[Dict]]:
+        """Run every saved search once, returning new postings by search name"""
+        return {search.name: self.run_search(search) for search in self.searches}
+
+    def run_forever(self):
+        """Run saved searches on their intervals until stop() is called"""
+        if not self.searches:
+            logger.warning("No saved searches configured under auto.searches")
+            return
+
+        scheduler = SearchScheduler(self.searches)
+        logger.info(f"Polling daemon started with {len(self.searches)} saved searches")
+
+        while not self._stop.is_set():
+            for search in scheduler.pop_due(time.monotonic()):
+                if self._stop.is_set():
+                    break
+                self.run_search(search)
+
+            self._stop.wait(scheduler.seconds_until_next(time.monotonic()))
+
+        logger.info("Polling daemon stopped")
+
+    def stop(self, *args):
+        """Stop the daemon after the current search (usable as a signal handler)"""
+        self._stop.set()
+        if self.metrics_server is not None:
+            # shutdown() waits for serve_forever, so don't block a signal handler on it
+            threading.Thread(target=self.metrics_server.shutdown, daemon=True).start()
+            self.metrics_server = None
+
+def main(argv=None):
+    """Entry point for `python -m jobscanner.auto`"""
+    import argparse
+
+    try:
+        from ..main import load_config
+        from ..utils.logger import setup_logger
+    except ImportError:
+        from jobscanner.main import load_config
+        from jobscanner.utils.logger import setup_logger
+
+    parser = argparse.ArgumentParser(
+        prog="python -m jobscanner.auto",
+        description="JobScanner Pro - run saved searches in the background"
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Run every saved search once and exit"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics on this port (default: auto.metrics.port)"
+    )
+    args = parser.parse_args(argv)
+
+    config = load_config()
+    setup_logger(config["logging"]["level"], config["logging"]["file"])
+
+    daemon = PollingDaemon(config)
+    if args.once:
+        daemon.run_once()
+        return
+
+    daemon.start_metrics(args.metrics_port)
+    signal.signal(signal.SIGTERM, daemon.stop)
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        daemon.stop()
@@ -0,0 +1,125 @@
+"""
+Scheduling of saved searches for the background polling daemon.
+"""
+
+import heapq
+import time
+from typing import Dict, List, Optional
+
+class SavedSearch:
+    """A search the daemon repeats on its own interval"""
+
+    def __init__(self, query: str, location: str, interval: float,
+                 radius: Optional[int] = None, gigs_only: bool = False,
+                 remote_only: bool = False, on_site_only: bool = False,
+                 name: Optional[str] = None):
+        """
+        Args:
+            query (str): Search query
+            location (str): Location to search in
+            interval (float): Minutes between runs, greater than 0
+            radius (int, optional): Search radius in km
+            gigs_only (bool): Only return gig postings
+            remote_only (bool): Only return remote jobs
+            on_site_only (bool): Only return on-site jobs
+            name (str, optional): Label used in logs
+
+        Raises:
+            ValueError: If the interval is not a positive number of minutes
+        """
+        if not interval or interval <= 0:
+            raise ValueError(f"Saved search {name or query!r} needs an interval above 0 minutes, got {interval!r}")
+        self.query = query
+        self.location = location
+        self.interval = interval
+        self.radius = radius
+        self.gigs_only = gigs_only
+        self.remote_only = remote_only
+        self.on_site_only = on_site_only
+        self.name = name or f"{query} ({location})"
+
+    @classmethod
+    def from_config(cls, entry: Dict, config: Dict) -> "SavedSearch":
+        """
+        Build a saved search from an `auto.searches` config entry
+
+        Missing values fall back to search.refresh_interval,
+        search.default_radius and user.location.
+        """
+        search_config = config.get("search", {})
+        return cls(
+            query=entry["query"],
+            location=entry.get("location", config.get("user", {}).get("location", "Brampton, ON")),
+            interval=entry.get("interval", search_config.get("refresh_interval", 60)),
+            radius=entry.get("radius", search_config.get("default_radius")),
+            gigs_only=entry.get("gigs_only", False),
+            remote_only=entry.get("remote_only", False),
+            on_site_only=entry.get("on_site_only", False),
+            name=entry.get("name")
+        )
+
+    def search_kwargs(self) -> Dict:
+        """Keyword arguments for JobSearch.search"""
+        return {
+            "query": self.query,
+            "location": self.location,
+            "radius": self.radius,
+            "gigs_only": self.gigs_only,
+            "remote_only": self.remote_only,
+            "on_site_only": self.on_site_only
+        }
+
+    def __repr__(self):
+        return f"SavedSearch({self.name!r}, every {self.interval} min)"
+
+class SearchScheduler:
+    """Min-heap of saved searches ordered by their next run time"""
+
+    def __init__(self, searches: List[SavedSearch], start: Optional[float] = None):
+        """
+        Searches are staggered evenly across the shortest interval so they
+        don't all hit the same hosts at once.
+
+        Args:
+            searches (List[SavedSearch]): Searches to schedule
+            start (float, optional): Monotonic time of the first run (default: now)
+        """
+        self.searches = list(searches)
+        start = time.monotonic() if start is None else start
+
+        self._heap = []
+        if self.searches:
+            stagger = min(s.interval for s in self.searches) * 60 / len(self.searches)
+            for index, search in enumerate(self.searches):
+                heapq.heappush(self._heap, (start + index * stagger, index))
+
+    def pop_due(self, now: float) -> List[SavedSearch]:
+        """
+        Take every search that is due and schedule its next run
+
+        A search that fell more than one interval behind (e.g. after a slow
+        run or a suspended machine) runs once and is rescheduled from now.
+
+        Args:
+            now (float): Current monotonic time
+
+        Returns:
+            List[SavedSearch]: Due searches in order of their scheduled time
+        """
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, index = heapq.heappop(self._heap)
+            search = self.searches[index]
+            due.append(search)
+
+            next_run = when + search.interval * 60
+            if next_run <= now:
+                next_run = now + search.interval * 60
+            heapq.heappush(self._heap, (next_run, index))
+        return due
+
+    def seconds_until_next(self, now: float) -> Optional[float]:
+        """Seconds until the next search is due, or None if nothing is scheduled"""
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - now)
@@ -0,0 +1,238 @@
+"""
+Columnar history archive of search results.
+
+Every search appends the postings it scraped to a Parquet dataset
+partitioned by search date and source (`date=2024-05-01/source=Kijiji/`),
+so trend questions like postings per source per day or salary ranges by
+title are answered by a columnar scan of only the partitions involved.
+Needs the optional pyarrow package.
+"""
+
+import logging
+import time
+import uuid
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+from urllib.parse import quote
+
+try:
+    from ..utils.salary_parser import SalaryParser
+except ImportError:
+    # Loaded as a top-level package (tests run from jobscanner/)
+    from utils.salary_parser import SalaryParser
+
+logger = logging.getLogger(__name__)
+
+def _pyarrow():
+    """Import pyarrow on first use, since it is optional and slow to load"""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("The search archive needs the pyarrow package (pip install pyarrow)") from None
+    return pa, pc, ds, pq
+
+def _day(value) -> Optional[str]:
+    """ISO date string for a date, datetime or string"""
+    if value is None:
+        return None
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+class JobArchive:
+    """Append-only Parquet dataset of scraped postings"""
+
+    # Posting fields stored as string columns
+    COLUMNS = ["url", "title", "company", "location", "type", "salary", "posted_date", "description", "category"]
+
+    # Directory levels, outermost first; not repeated inside the files
+    PARTITIONS = ["date", "source"]
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Dataset directory (the `archive.path` config value)
+        """
+        self.pa, self.pc, self.ds, self.pq = _pyarrow()
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        pa = self.pa
+        self.schema = pa.schema(
+            [(column, pa.string()) for column in self.COLUMNS]
+            + [
+                ("query", pa.string()),
+                ("searched_at", pa.timestamp("s")),
+                ("min_annual", pa.float64()),
+                ("max_annual", pa.float64()),
+                ("salary_period", pa.string()),
+            ]
+        )
+        partition_schema = pa.schema([(name, pa.string()) for name in self.PARTITIONS])
+        self.partitioning = self.ds.partitioning(partition_schema, flavor="hive")
+        self._dataset_schema = pa.schema(list(self.schema) + list(partition_schema))
+        self._salary_parser = SalaryParser()
+
+    def append(self, jobs: List[Dict], query: Union[str, Sequence[str], None] = None,
+               searched_at: Optional[float] = None) -> int:
+        """
+        Write postings from one search as new files, one per partition
+
+        Args:
+            jobs (List[Dict]): Scraped postings
+            query (str | Sequence[str], optional): The search query, or one
+                query per job
+            searched_at (float, optional): Search time (default: now)
+
+        Returns:
+            int: Number of postings written
+        """
+        jobs = [job for job in jobs if job.get("url")]
+        if not jobs:
+            return 0
+
+        searched_at = searched_at or time.time()
+        queries = [query] * len(jobs) if query is None or isinstance(query, str) else list(query)
+        salaries = self._salary_parser.salary_columns(jobs)
+        day = _day(datetime.fromtimestamp(searched_at))
+
+        # Row numbers per source partition
+        groups = {}
+        for row, job in enumerate(jobs):
+            groups.setdefault(job.get("source") or "unknown", []).append(row)
+
+        part = f"part-{int(searched_at)}-{uuid.uuid4().hex[:8]}.parquet"
+        for source, rows in groups.items():
+            columns = {
+                column: [self._text(jobs[row].get(column)) for row in rows]
+                for column in self.COLUMNS
+            }
+            columns["query"] = [queries[row] for row in rows]
+            columns["searched_at"] = [datetime.fromtimestamp(int(searched_at))] * len(rows)
+            columns["min_annual"] = [self._amount(salaries["min_annual"][row]) for row in rows]
+            columns["max_annual"] = [self._amount(salaries["max_annual"][row]) for row in rows]
+            columns["salary_period"] = [salaries["period"][row] for row in rows]
+
+            directory = self.path / f"date={day}" / f"source={quote(source, safe='')}"
+            directory.mkdir(parents=True, exist_ok=True)
+            self.pq.write_table(self.pa.table(columns, schema=self.schema), directory / part)
+
+        logger.info(f"Archived {len(jobs)} postings in {len(groups)} partitions")
+        return len(jobs)
+
+    @staticmethod
+    def _text(value) -> Optional[str]:
+        return None if value is None else str(value)
+
+    @staticmethod
+    def _amount(value) -> Optional[float]:
+        """Float salary amount, None for NaN"""
+        return None if value != value else float(value)
+
+    @staticmethod
+    def _rename(table, names: Dict[str, str]):
+        """Rename aggregate columns, e.g. url_count_distinct -> postings"""
+        return table.rename_columns([names.get(name, name) for name in table.column_names])
+
+    def _dataset(self):
+        return self.ds.dataset(
+            self.path, schema=self._dataset_schema, format="parquet", partitioning=self.partitioning
+        )
+
+    def scan(self, columns: Optional[List[str]] = None, since=None, until=None,
+             sources: Optional[Iterable[str]] = None):
+        """
+        Read archived postings, pruning partitions outside the filters
+
+        Args:
+            columns (List[str], optional): Columns to read (default: all)
+            since (date | str, optional): First search date to include
+            until (date | str, optional): Last search date to include
+            sources (Iterable[str], optional): Sources to include
+
+        Returns:
+            pyarrow.Table: The matching rows, with `date` and `source` columns
+        """
+        field = self.ds.field
+        condition = None
+        for expression in (
+            field("date") >= _day(since) if since else None,
+            field("date") <= _day(until) if until else None,
+            field("source").isin(list(sources)) if sources else None,
+        ):
+            if expression is not None:
+                condition = expression if condition is None else condition & expression
+        return self._dataset().to_table(columns=columns, filter=condition)
+
+    def postings_per_day(self, since=None, until=None, sources: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        Distinct postings seen per search date and source
+
+        Returns:
+            List[Dict]: {"date", "source", "postings"} rows by date and source
+        """
+        table = self.scan(["date", "source", "url"], since, until, sources)
+        counts = table.group_by(["date", "source"]).aggregate([("url", "count_distinct")])
+        counts = self._rename(counts, {"url_count_distinct": "postings"})
+        return counts.sort_by([("date", "ascending"), ("source", "ascending")]).to_pylist()
+
+    def salary_distribution(self, by: str = "title", since=None, until=None,
+                            sources: Optional[Iterable[str]] = None, min_postings: int = 1) -> List[Dict]:
+        """
+        Annual salary statistics per group of distinct postings
+
+        Each posting counts once, however many searches archived it.
+
+        Args:
+            by (str): Column to group by, e.g. "title", "company" or "source"
+            min_postings (int): Leave out groups with fewer salaried postings
+
+        Returns:
+            List[Dict]: {by, "postings", "min", "median", "mean", "max"} rows,
+                most postings first
+        """
+        pc = self.pc
+        table = self.scan(["url", by, "min_annual"], since, until, sources)
+        table = table.filter(pc.is_valid(table["min_annual"]))
+        postings = table.group_by(["url", by]).aggregate([("min_annual", "max")])
+
+        stats = postings.group_by(by).aggregate([
+            ("url", "count"),
+            ("min_annual_max", "min"),
+            ("min_annual_max", "approximate_median"),
+            ("min_annual_max", "mean"),
+            ("min_annual_max", "max"),
+        ])
+        stats = self._rename(stats, {
+            "url_count": "postings",
+            "min_annual_max_min": "min",
+            "min_annual_max_approximate_median": "median",
+            "min_annual_max_mean": "mean",
+            "min_annual_max_max": "max",
+        })
+        stats = stats.filter(pc.greater_equal(stats["postings"], min_postings))
+        return stats.sort_by([("postings", "descending"), (by, "ascending")]).to_pylist()
+
+    def compact(self) -> int:
+        """
+        Merge each partition's files into one, e.g. after many small searches
+
+        Returns:
+            int: Number of partitions rewritten
+        """
+        rewritten = 0
+        for directory in sorted(self.path.glob("date=*/source=*")):
+            parts = sorted(directory.glob("*.parquet"))
+            if len(parts) < 2:
+                continue
+            table = self.pa.concat_tables(self.pq.read_table(part, partitioning=None) for part in parts)
+            merged = directory / f"part-{int(time.time())}-{uuid.uuid4().hex[:8]}.parquet"
+            self.pq.write_table(table, merged)
+            for part in parts:
+                part.unlink()
+            rewritten += 1
+        return rewritten
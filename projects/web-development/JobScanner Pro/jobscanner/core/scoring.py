@@ -0,0 +1,182 @@
+"""
+Relevance scoring of search results against the search terms.
+
+All results are tokenized once into a sparse document-term matrix with
+BM25 weights, and scored against the weighted query (job title, related
+terms, resume keywords) with one sparse matrix-vector product. The matrix
+is kept as coordinate arrays and multiplied with NumPy, so scoring
+thousands of results needs no per-job Python arithmetic.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Words, keeping skill spellings like "c++", "c#" and "node.js" intact
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[+#]+|\.[a-z0-9]+)*")
+
+# Joins the texts of all jobs so each field is tokenized in one pass
+SEPARATOR = "\x00"
+_TOKENS_AND_SEPARATORS = re.compile(TOKEN_PATTERN.pattern + "|" + SEPARATOR)
+
+# Job fields scored and the weight of a term occurring in each
+FIELD_WEIGHTS = {"title": 3.0, "company": 1.0, "description": 1.0}
+
+# BM25 term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+# Score given to every job when there is nothing to match against
+NEUTRAL_SCORE = 50
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word tokens of `text`"""
+    return TOKEN_PATTERN.findall(str(text).lower()) if text else []
+
+class TermMatrix:
+    """
+    Sparse weighted term counts of a result set
+
+    Row `rows[i]` (a job) holds `counts[i]` weighted occurrences of term
+    `vocabulary[columns[i]]`, with one entry per job and term.
+    """
+
+    def __init__(self, jobs: Sequence[Dict], field_weights: Optional[Dict[str, float]] = None):
+        """
+        Args:
+            jobs (Sequence[Dict]): Jobs or job dicts
+            field_weights (Dict[str, float], optional): Field -> weight of a
+                term found there (default: FIELD_WEIGHTS)
+        """
+        field_weights = field_weights or FIELD_WEIGHTS
+        self.size = len(jobs)
+
+        # Term -> id, with id 0 for the separator between jobs
+        index = {SEPARATOR: 0}
+        docs, terms, weights = [], [], []
+        for field, weight in field_weights.items():
+            # One regex pass over the field of every job; separators count
+            # off the jobs, so token i belongs to the job numbered by the
+            # separators before it
+            text = SEPARATOR.join(
+                str(job.get(field) or "").replace(SEPARATOR, " ") for job in jobs
+            ).lower()
+            tokens = _TOKENS_AND_SEPARATORS.findall(text)
+            for token in dict.fromkeys(tokens):
+                index.setdefault(token, len(index))
+            ids = np.fromiter(map(index.__getitem__, tokens), dtype=np.intp, count=len(tokens))
+
+            separators = ids == 0
+            docs.append(np.cumsum(separators)[~separators])
+            terms.append(ids[~separators] - 1)
+            weights.append(np.full(len(terms[-1]), weight))
+
+        del index[SEPARATOR]
+        self._index = {token: id - 1 for token, id in index.items()}
+        self.vocabulary = np.array(list(self._index), dtype=object)
+        docs, terms, weights = (np.concatenate(arrays) for arrays in (docs, terms, weights))
+
+        # One entry per distinct (job, term) pair, sorted by job
+        pairs, pair_index = np.unique(docs * len(self.vocabulary) + terms, return_inverse=True)
+        self.rows, self.columns = np.divmod(pairs, max(len(self.vocabulary), 1))
+        self.counts = np.bincount(pair_index.ravel(), weights=weights, minlength=len(pairs))
+
+        self.lengths = np.bincount(docs, weights=weights, minlength=self.size)
+        self.document_frequency = np.bincount(self.columns, minlength=len(self.vocabulary))
+
+    def term_ids(self, tokens: Sequence[str]) -> np.ndarray:
+        """
+        Vocabulary index of each token, -1 for tokens no job contains
+
+        Args:
+            tokens (Sequence[str]): Lowercase tokens
+
+        Returns:
+            np.ndarray: Term ids
+        """
+        return np.array([self._index.get(token, -1) for token in tokens], dtype=np.intp)
+
+    def idf(self, document_frequency: np.ndarray) -> np.ndarray:
+        """BM25 inverse document frequency for the given job counts"""
+        return np.log1p((self.size - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def bm25(self, k1: float = K1, b: float = B) -> np.ndarray:
+        """
+        BM25 weight of every entry
+
+        Returns:
+            np.ndarray: Weights aligned with `rows` and `columns`
+        """
+        average_length = self.lengths.mean() if self.size else 0.0
+        relative_length = self.lengths / average_length if average_length else np.ones(self.size)
+        saturation = self.counts + k1 * (1 - b + b * relative_length[self.rows])
+        return self.idf(self.document_frequency)[self.columns] * self.counts * (k1 + 1) / saturation
+
+    def dot(self, entries: np.ndarray, vector: np.ndarray) -> np.ndarray:
+        """
+        Product of the matrix with entry values `entries` and a term vector
+
+        Args:
+            entries (np.ndarray): Value of each entry, e.g. from bm25()
+            vector (np.ndarray): One value per vocabulary term
+
+        Returns:
+            np.ndarray: One value per job
+        """
+        return np.bincount(self.rows, weights=entries * vector[self.columns], minlength=self.size)
+
+def score_jobs(jobs: List[Dict], terms: Sequence[str], term_weights: Optional[Sequence[float]] = None,
+               k1: float = K1, b: float = B) -> np.ndarray:
+    """
+    Score jobs 0-100 by BM25 relevance to the search terms
+
+    A job of average length scores 100 when every query word that occurs
+    in the results appears once in its title (or more often elsewhere).
+    Query words no result contains, e.g. resume skills no posting asks
+    for, don't count against any job. Each job's `match_score` is set to
+    its rounded score.
+
+    Args:
+        jobs (List[Dict]): Search results
+        terms (Sequence[str]): Search terms, e.g. the job title and resume
+            keywords; multi-word terms match word by word
+        term_weights (Sequence[float], optional): Weight of each term
+            (default: 1.0 each)
+        k1 (float): BM25 term frequency saturation
+        b (float): BM25 length normalization
+
+    Returns:
+        np.ndarray: Scores in job order (NEUTRAL_SCORE for all without terms)
+    """
+    term_weights = [1.0] * len(terms) if term_weights is None else term_weights
+    query_tokens, query_weights = [], []
+    for term, weight in zip(terms, term_weights):
+        for token in dict.fromkeys(tokenize(term)):
+            query_tokens.append(token)
+            query_weights.append(weight)
+
+    if not query_tokens:
+        scores = np.full(len(jobs), float(NEUTRAL_SCORE))
+    else:
+        matrix = TermMatrix(jobs)
+        words = list(dict.fromkeys(query_tokens))
+        word_index = [words.index(token) for token in query_tokens]
+        word_weights = np.bincount(word_index, weights=query_weights, minlength=len(words))
+
+        ids = matrix.term_ids(words)
+        known = ids >= 0
+        query = np.bincount(ids[known], weights=word_weights[known], minlength=len(matrix.vocabulary))
+
+        # Reference score: every known word once in the title of a job of
+        # average length
+        title = FIELD_WEIGHTS["title"]
+        idf = matrix.idf(matrix.document_frequency[ids[known]])
+        ideal = (word_weights[known] * idf).sum() * title * (k1 + 1) / (title + k1)
+
+        scores = matrix.dot(matrix.bm25(k1, b), query)
+        scores = np.minimum(100.0 * scores / ideal, 100.0) if ideal else scores
+
+    for job, score in zip(jobs, np.rint(scores).astype(int).tolist()):
+        job["match_score"] = score
+    return scores
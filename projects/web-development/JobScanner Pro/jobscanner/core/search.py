@@ -3,35 +3,64 @@ Core search functionality for JobScanner Pro.
 Coordinates job searches across multiple platforms.
 """
 
+import asyncio
+import functools
+import importlib
 import logging
-from concurrent.futures import ThreadPoolExecutor
-import pandas as pd
-from pathlib import Path
+import queue
+import threading
 
 # Import scrapers - handle both development and PyInstaller
 try:
-    from ..scrapers.indeed import IndeedScraper
-    from ..scrapers.jobbank import JobBankScraper
-    from ..scrapers.craigslist import CraigslistScraper
-    from ..scrapers.kijiji import KijijiScraper
-    from .filters import deduplicate_jobs, filter_jobs
+    from ..scrapers.pool import PLATFORMS, scraper_pool
+    from ..scrapers.rate_limiter import rate_limiter
+    from ..scrapers.html_parser import configure_parser
+    from ..scrapers.job import Job
+    from ..scrapers.metrics import scraper_seconds, stage_seconds
+    from ..utils.dedup import DedupIndex
 except ImportError:
     # Fallback for PyInstaller executable
     import sys
     if getattr(sys, 'frozen', False):
         # Running as PyInstaller executable
-        from jobscanner.scrapers.indeed import IndeedScraper
-        from jobscanner.scrapers.jobbank import JobBankScraper
-        from jobscanner.scrapers.craigslist import CraigslistScraper
-        from jobscanner.scrapers.kijiji import KijijiScraper
-        from jobscanner.core.filters import deduplicate_jobs, filter_jobs
+        from jobscanner.scrapers.pool import PLATFORMS, scraper_pool
+        from jobscanner.scrapers.rate_limiter import rate_limiter
+        from jobscanner.scrapers.html_parser import configure_parser
+        from jobscanner.scrapers.job import Job
+        from jobscanner.scrapers.metrics import scraper_seconds, stage_seconds
+        from jobscanner.utils.dedup import DedupIndex
     else:
-        # Try absolute imports
-        from jobscanner.scrapers.indeed import IndeedScraper
-        from jobscanner.scrapers.jobbank import JobBankScraper
-        from jobscanner.scrapers.craigslist import CraigslistScraper
-        from jobscanner.scrapers.kijiji import KijijiScraper
-        from jobscanner.core.filters import deduplicate_jobs, filter_jobs
+        try:
+            # Try absolute imports
+            from jobscanner.scrapers.pool import PLATFORMS, scraper_pool
+            from jobscanner.scrapers.rate_limiter import rate_limiter
+            from jobscanner.scrapers.html_parser import configure_parser
+            from jobscanner.scrapers.job import Job
+            from jobscanner.scrapers.metrics import scraper_seconds, stage_seconds
+            from jobscanner.utils.dedup import DedupIndex
+        except ImportError:
+            # Loaded as a top-level package (tests run from jobscanner/)
+            from scrapers.pool import PLATFORMS, scraper_pool
+            from scrapers.rate_limiter import rate_limiter
+            from scrapers.html_parser import configure_parser
+            from scrapers.job import Job
+            from scrapers.metrics import scraper_seconds, stage_seconds
+            from utils.dedup import DedupIndex
+
+# Package holding core/, scrapers/ and utils/ ("jobscanner", or "" when
+# they were imported as top-level packages)
+_PACKAGE = Job.__module__.rpartition("scrapers.job")[0].rstrip(".")
+
+@functools.lru_cache(maxsize=None)
+def _lazy(module, name):
+    """
+    Import `name` from a jobscanner module on first use
+
+    The scraping engine (requests, BeautifulSoup), filters (NumPy), export
+    and storage backends load only when a search needs them, so importing
+    this module or building a JobSearch stays cheap.
+    """
+    return getattr(importlib.import_module(f"{_PACKAGE}.{module}" if _PACKAGE else module), name)
 
 logger = logging.getLogger(__name__)
 
@@ -41,26 +70,65 @@ class JobSearch:
     def __init__(self, config):
         """Initialize with configuration"""
         self.config = config
+        
+        # All scrapers share one per-host request budget
+        rate_limits = self.config.get("search", {}).get("rate_limits")
+        if rate_limits:
+            rate_limiter.configure(rate_limits)
+        
+        # Scraper sessions mount the shared response cache when enabled
+        cache_settings = self.config.get("search", {}).get("cache")
+        if cache_settings:
+            _lazy("scrapers.http_cache", "configure_http_cache")(cache_settings)
+        
+        # HTML parsing engine for the scrapers
+        configure_parser(self.config.get("search", {}).get("parser", "auto"))
+        
+        # Persistent posting store (enables incremental searches)
+        db_path = self.config.get("database", {}).get("path")
+        self.store = _lazy("core.store", "JobStore")(db_path) if db_path else None
+        
+        # Columnar history of every search's postings
+        self.archive = self._open_archive(self.config.get("archive", {}).get("path"))
+        
         self.scrapers = self._initialize_scrapers()
         
+    @staticmethod
+    def _open_archive(path):
+        """The search archive, or None if disabled or pyarrow is missing"""
+        if not path:
+            return None
+        try:
+            return _lazy("core.archive", "JobArchive")(path)
+        except ImportError as e:
+            logger.info(f"Search history not archived: {e}")
+            return None
+    
+    def _archive_jobs(self, jobs, query):
+        """Append scraped postings to the archive; failures don't fail the search"""
+        if self.archive is None or not jobs:
+            return
+        try:
+            with stage_seconds.time(stage="archive"):
+                self.archive.append(jobs, query=query)
+        except Exception as e:
+            logger.error(f"Could not archive search results: {e}")
+    
     def _initialize_scrapers(self):
-        """Initialize enabled scrapers from config"""
-        scrapers = []
+        """Get enabled scrapers from the process-wide pool"""
         platform_config = self.config["search"]["platforms"]
         
-        if platform_config["indeed"]:
-            scrapers.append(IndeedScraper(config=self.config))  # Pass config for API credentials
-        if platform_config["jobbank"]:
-            scrapers.append(JobBankScraper())
-        if platform_config["craigslist"]:
-            scrapers.append(CraigslistScraper())
-        if platform_config["kijiji"]:
-            scrapers.append(KijijiScraper())
-            
-        return scrapers
+        # Pooled scrapers keep their sessions (and the Indeed token) warm
+        # across searches
+        return [
+            scraper_pool.get(platform, self.config)
+            for platform in PLATFORMS
+            if platform_config.get(platform)
+        ]
     
     def _add_source_info(self, jobs, source):
         """Add source information to job listings"""
+        jobs = [Job.from_dict(job) for job in jobs]
         for job in jobs:
             job["source"] = source
             # Add source-specific prefix to job ID if not present
@@ -69,10 +137,12 @@ class JobSearch:
         return jobs
     
     def search(self, query, location, radius=None, gigs_only=False, new_only=False,
-               remote_only=False, on_site_only=False):
+               remote_only=False, on_site_only=False, incremental=False):
         """
         Search for jobs across all enabled platforms
         
+        Blocking wrapper around asearch for synchronous callers (CLI, GUI thread).
+        
         Args:
             query (str): Search query (e.g., "graphic designer")
             location (str): Location to search in
@@ -81,53 +151,98 @@ class JobSearch:
             new_only (bool): Only return new postings
             remote_only (bool): Only return remote jobs
             on_site_only (bool): Only return on-site jobs
+            incremental (bool): Only return postings not stored by earlier searches
             
         Returns:
             list: List of job dictionaries
         """
-        logger.info(f"Searching for '{query}' in {location}")
-        
-        # Search all platforms in parallel
-        with ThreadPoolExecutor() as executor:
-            future_to_scraper = {
-                executor.submit(
-                    scraper.search,
-                    query=query,
-                    location=location,
-                    radius=radius
-                ): scraper for scraper in self.scrapers
-            }
-            
-            # Collect all results
-            all_jobs = []
-            for future in future_to_scraper:
-                try:
-                    scraper = future_to_scraper[future]
-                    jobs = future.result()
-                    
-                    # Add source information
-                    source = scraper.__class__.__name__.replace("Scraper", "").lower()
-                    jobs_with_source = self._add_source_info(jobs, source)
-                    
-                    all_jobs.extend(jobs_with_source)
-                    logger.info(f"Found {len(jobs)} jobs from {source}")
-                except Exception as e:
-                    scraper = future_to_scraper[future]
-                    logger.error(f"Error with {scraper.__class__.__name__}: {e}")
-        
-        # Apply filters
-        filtered_jobs = filter_jobs(
-            all_jobs,
+        return asyncio.run(self.asearch(
+            query,
+            location,
+            radius=radius,
             gigs_only=gigs_only,
             new_only=new_only,
             remote_only=remote_only,
             on_site_only=on_site_only,
-            location=location,
-            max_radius=radius  # Apply radius filtering
+            incremental=incremental
+        ))
+    
+    async def asearch(self, query, location, radius=None, gigs_only=False, new_only=False,
+                      remote_only=False, on_site_only=False, incremental=False):
+        """
+        Search for jobs across all enabled platforms concurrently
+        
+        Every page and category of every platform is in flight at once,
+        limited only by each scraper's per-host politeness settings.
+        
+        Args:
+            query (str): Search query (e.g., "graphic designer")
+            location (str): Location to search in
+            radius (int, optional): Search radius in km
+            gigs_only (bool): Only return gig postings
+            new_only (bool): Only return new postings
+            remote_only (bool): Only return remote jobs
+            on_site_only (bool): Only return on-site jobs
+            incremental (bool): Only return postings not stored by earlier
+                searches; date-sorted sources stop paginating at the first
+                stored posting
+            
+        Returns:
+            list: List of job dictionaries
+        """
+        logger.info(f"Searching for '{query}' in {location}")
+        
+        is_known = self._known_url_check(incremental)
+        
+        # Search all platforms concurrently
+        results = await asyncio.gather(
+            *(self._run_scraper(scraper, query, location, radius, is_known) for scraper in self.scrapers),
+            return_exceptions=True
         )
         
+        # Collect all results
+        all_jobs = []
+        for scraper, jobs in zip(self.scrapers, results):
+            if isinstance(jobs, Exception):
+                logger.error(f"Error with {scraper.__class__.__name__}: {jobs}")
+                continue
+            
+            # Add source information
+            source = self._source_name(scraper)
+            jobs_with_source = self._add_source_info(jobs, source)
+            
+            all_jobs.extend(jobs_with_source)
+            logger.info(f"Found {len(jobs)} jobs from {source}")
+        
+        self._archive_jobs(all_jobs, query)
+        
+        # Record postings; incremental searches only keep unseen ones
+        if self.store is not None:
+            with stage_seconds.time(stage="store"):
+                new_jobs = self.store.add_jobs(all_jobs)
+            if is_known:
+                all_jobs = new_jobs
+        
+        # Apply filters; with enrichment, remote preferences are checked
+        # against the full descriptions afterwards
+        enrich = self._enrich_enabled()
+        filter_jobs = _lazy("core.filters", "filter_jobs")
+        with stage_seconds.time(stage="filter"):
+            filtered_jobs = filter_jobs(
+                all_jobs,
+                gigs_only=gigs_only,
+                new_only=new_only,
+                remote_only=remote_only and not enrich,
+                on_site_only=on_site_only and not enrich,
+                location=location,
+                max_radius=radius  # Apply radius filtering
+            )
+        
         # Remove duplicates
-        unique_jobs = deduplicate_jobs(filtered_jobs)
+        with stage_seconds.time(stage="dedup"):
+            unique_jobs = _lazy("core.filters", "deduplicate_jobs")(filtered_jobs)
+        if enrich:
+            unique_jobs = await self._enrich_results(unique_jobs, remote_only, on_site_only)
         
         # Log source breakdown
         source_counts = {}
@@ -141,21 +256,420 @@ class JobSearch:
         logger.info(f"Found {len(unique_jobs)} total unique jobs")
         return unique_jobs
     
-    def export_results(self, jobs, output_file, format="csv"):
-        """Export job results to file"""
-        # Convert to DataFrame for easy export
-        df = pd.DataFrame(jobs)
+    def search_many(self, queries, location, **kwargs):
+        """
+        Search for several queries at once across all enabled platforms
+        
+        Blocking wrapper around asearch_many for synchronous callers.
+        
+        Args:
+            queries (list): Search queries, most important first
+            location (str): Location to search in
+            **kwargs: Same options as search()
+            
+        Returns:
+            list: Unique jobs, each with the queries that found it in
+                job["matched_queries"]
+        """
+        return asyncio.run(self.asearch_many(queries, location, **kwargs))
+    
+    async def asearch_many(self, queries, location, **kwargs):
+        """
+        Search for several queries concurrently with one shared dedup index
+        
+        Every query runs on every platform at the same time, so the search
+        takes about as long as a single query instead of one round per query.
+        Responses go through the shared HTTP cache and rate limiter, and a
+        posting found by several queries is returned once.
+        
+        Args:
+            queries (list): Search queries, most important first
+            location (str): Location to search in
+            **kwargs: Same options as asearch()
+            
+        Returns:
+            list: Unique jobs ordered by the first query that found them,
+                each with the queries that found it in job["matched_queries"]
+        """
+        queries = self._unique_queries(queries)
+        
+        # With enrichment, remote preferences are checked afterwards
+        enrich = self._enrich_enabled()
+        options = dict(kwargs, remote_only=False, on_site_only=False) if enrich else kwargs
+        jobs = [job async for job in self._astream(queries, location, attribute=True, **options)]
+        
+        # Results of the primary query first, then each related query
+        rank = {query: position for position, query in enumerate(queries)}
+        jobs.sort(key=lambda job: min(rank[query] for query in job["matched_queries"]))
+        if enrich:
+            jobs = await self._enrich_results(
+                jobs, kwargs.get("remote_only", False), kwargs.get("on_site_only", False)
+            )
+        
+        logger.info(f"Found {len(jobs)} total unique jobs for {len(queries)} queries")
+        return jobs
+    
+    def enrich(self, jobs, top_n=None):
+        """
+        Fill in details of the first jobs from their posting pages
+        
+        Blocking wrapper around aenrich for synchronous callers.
+        
+        Args:
+            jobs (list): Search results, updated in place
+            top_n (int, optional): Number of jobs to enrich
+            
+        Returns:
+            list: The same jobs
+        """
+        return asyncio.run(self.aenrich(jobs, top_n=top_n))
+    
+    async def aenrich(self, jobs, top_n=None):
+        """
+        Fill in company, full description and salary from posting pages
+        
+        Detail pages of the first `top_n` jobs are fetched through the
+        scraper that found them, at most `search.enrich.max_workers` at a
+        time on top of each scraper's per-host limits. Scrapers remember
+        parsed pages by URL, and responses go through the HTTP cache.
+        
+        Args:
+            jobs (list): Search results, updated in place
+            top_n (int, optional): Number of jobs to enrich, defaulting to
+                `search.enrich.top_n` (20)
+            
+        Returns:
+            list: The same jobs
+        """
+        settings = self.config.get("search", {}).get("enrich") or {}
+        if top_n is None:
+            top_n = settings.get("top_n", 20)
+        workers = asyncio.Semaphore(settings.get("max_workers", 4))
+        scrapers = {
+            self._source_name(scraper): scraper
+            for scraper in self.scrapers
+            if isinstance(scraper, _lazy("scrapers.async_base", "AsyncBaseScraper"))
+        }
+        
+        async def enrich_job(job):
+            scraper = scrapers.get(job.get("source"))
+            if scraper is None or not job.get("url"):
+                return False
+            async with workers:
+                try:
+                    details = await scraper.afetch_details(job["url"])
+                except Exception as e:
+                    logger.warning(f"Could not fetch details for {job['url']}: {e}")
+                    return False
+            _lazy("scrapers.details", "merge_details")(job, details)
+            return bool(details)
+        
+        with stage_seconds.time(stage="enrich"):
+            enriched = await asyncio.gather(*(enrich_job(job) for job in jobs[:top_n]))
+        logger.info(f"Enriched {sum(enriched)} of {len(enriched)} jobs from posting pages")
+        return jobs
+    
+    def _enrich_enabled(self):
+        """Whether searches enrich their results (`search.enrich.enabled`)"""
+        return bool((self.config.get("search", {}).get("enrich") or {}).get("enabled"))
+    
+    async def _enrich_results(self, jobs, remote_only, on_site_only, top_n=None):
+        """Enrich results, then apply remote preferences to the full details"""
+        if top_n is None or top_n > 0:
+            await self.aenrich(jobs, top_n)
+        if remote_only or on_site_only:
+            filter_jobs = _lazy("core.filters", "filter_jobs")
+            jobs = filter_jobs(jobs, remote_only=remote_only, on_site_only=on_site_only)
+        return jobs
+    
+    def stream(self, query, location, **kwargs):
+        """
+        Yield filtered, deduplicated jobs as scrapers parse each page
+        
+        Blocking wrapper around astream for synchronous callers; the search
+        runs on its own event loop in a worker thread. Closing the generator
+        early cancels the remaining requests.
+        
+        Args:
+            query (str): Search query
+            location (str): Location to search in
+            **kwargs: Same options as search()
+            
+        Yields:
+            Job: Jobs in the order their pages arrive
+        """
+        return self._stream_sync(lambda: self.astream(query, location, **kwargs))
+    
+    def stream_many(self, queries, location, **kwargs):
+        """
+        Yield jobs for several queries as scrapers parse each page
         
-        # Create output directory if it doesn't exist
-        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        Blocking wrapper around astream_many, see stream().
         
-        # Export based on format
-        if format == "csv":
-            df.to_csv(output_file, index=False)
-        elif format == "json":
-            df.to_json(output_file, orient="records", indent=2)
+        Args:
+            queries (list): Search queries, most important first
+            location (str): Location to search in
+            **kwargs: Same options as search()
             
-        logger.info(f"Exported {len(jobs)} jobs to {output_file}")
+        Yields:
+            Job: Jobs in the order their pages arrive, with the queries that
+                found them in job["matched_queries"]
+        """
+        return self._stream_sync(lambda: self.astream_many(queries, location, **kwargs))
+    
+    def _stream_sync(self, make_stream):
+        """
+        Run an async job stream in a worker thread and yield its jobs
+        
+        Closing the generator cancels the stream's task on its loop, which
+        cancels the scrapers' outstanding requests right away.
+        """
+        results = queue.Queue()
+        done = object()
+        lock = threading.Lock()
+        stopped = False
+        running = None  # (loop, task) of the stream once it has started
+        
+        async def pump():
+            nonlocal running
+            with lock:
+                if stopped:
+                    return
+                running = (asyncio.get_running_loop(), asyncio.current_task())
+            async for job in make_stream():
+                results.put(job)
+        
+        def run():
+            try:
+                asyncio.run(pump())
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                results.put(e)
+            finally:
+                results.put(done)
+        
+        threading.Thread(target=run, name="JobSearchStream", daemon=True).start()
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            with lock:
+                stopped = True
+                if running is not None:
+                    loop, task = running
+                    try:
+                        loop.call_soon_threadsafe(task.cancel)
+                    except RuntimeError:
+                        pass  # The stream already finished and closed its loop
+    
+    async def astream(self, query, location, **kwargs):
+        """
+        Asynchronously yield filtered, deduplicated jobs as pages are parsed
+        
+        Each page is stored, filtered and checked against one incremental
+        dedup index as soon as a scraper parses it, so the first results are
+        available after the fastest page rather than the slowest source.
+        Blocking scrapers deliver all their jobs when they finish. With
+        `search.enrich` enabled, the first `top_n` jobs are enriched from
+        their posting pages before they are yielded.
+        
+        Args:
+            query (str): Search query
+            location (str): Location to search in
+            **kwargs: Same options as asearch()
+            
+        Yields:
+            Job: Jobs in the order their pages arrive
+        """
+        async for job in self._astream([query], location, **kwargs):
+            yield job
+    
+    async def astream_many(self, queries, location, **kwargs):
+        """
+        Asynchronously yield jobs for several queries as pages are parsed
+        
+        All queries run on all platforms concurrently and share one dedup
+        index. job["matched_queries"] lists every query whose results
+        contained the posting's URL; the list is shared with jobs already
+        yielded, so it keeps growing while other queries are still running.
+        
+        Args:
+            queries (list): Search queries, most important first
+            location (str): Location to search in
+            **kwargs: Same options as asearch()
+            
+        Yields:
+            Job: Jobs in the order their pages arrive
+        """
+        async for job in self._astream(self._unique_queries(queries), location, attribute=True, **kwargs):
+            yield job
+    
+    async def _astream(self, queries, location, radius=None, gigs_only=False, new_only=False,
+                       remote_only=False, on_site_only=False, incremental=False, attribute=False):
+        """Stream jobs for one or more queries, see astream_many()"""
+        logger.info(f"Streaming search for {', '.join(repr(query) for query in queries)} in {location}")
+        
+        # URLs first stored by this run, so one query's pages don't look
+        # like earlier results to another query
+        fresh = set()
+        is_known = self._known_url_check(incremental, fresh)
+        pages = asyncio.Queue()
+        page_sink = _lazy("scrapers.async_base", "page_sink")
+        filter_jobs = _lazy("core.filters", "filter_jobs")
+        streamed = set()  # (query, scraper) pairs that delivered their own pages
+        
+        def on_page(query, scraper, jobs):
+            streamed.add((query, scraper))
+            pages.put_nowait((query, scraper, jobs))
+        
+        async def run(query, scraper):
+            # The page sink is per task, so pages keep their query
+            page_sink.set(lambda scraper, jobs: on_page(query, scraper, jobs))
+            try:
+                jobs = await self._run_scraper(scraper, query, location, radius, is_known)
+                if (query, scraper) not in streamed:
+                    pages.put_nowait((query, scraper, jobs))
+            except Exception as e:
+                logger.error(f"Error with {scraper.__class__.__name__} for '{query}': {e}")
+            finally:
+                pages.put_nowait((query, scraper, None))
+        
+        tasks = [
+            asyncio.ensure_future(run(query, scraper))
+            for query in queries
+            for scraper in self.scrapers
+        ]
+        
+        # With enrichment, the first `search.enrich.top_n` unique jobs are
+        # enriched before they are yielded, and remote preferences are
+        # checked against their full descriptions
+        enrich = self._enrich_enabled()
+        enrich_left = (self.config.get("search", {}).get("enrich") or {}).get("top_n", 20)
+        
+        index = DedupIndex()
+        matched_queries = {}  # URL -> queries whose results contained it
+        scraped, scraped_queries = [], []  # Every posting delivered, for the archive
+        remaining = len(tasks)
+        try:
+            while remaining:
+                query, scraper, jobs = await pages.get()
+                if jobs is None:
+                    remaining -= 1
+                    continue
+                
+                jobs = self._add_source_info(jobs, self._source_name(scraper))
+                scraped.extend(jobs)
+                scraped_queries.extend([query] * len(jobs))
+                if attribute:
+                    for job in jobs:
+                        if job.get("url"):
+                            found_by = matched_queries.setdefault(job["url"], [])
+                            if query not in found_by:
+                                found_by.append(query)
+                
+                if self.store is not None:
+                    with stage_seconds.time(stage="store"):
+                        new_jobs = self.store.add_jobs(jobs)
+                    if is_known:
+                        fresh.update(job["url"] for job in new_jobs)
+                        jobs = [job for job in jobs if job.get("url") in fresh]
+                
+                with stage_seconds.time(stage="filter"):
+                    filtered_jobs = filter_jobs(
+                        jobs,
+                        gigs_only=gigs_only,
+                        new_only=new_only,
+                        remote_only=remote_only and not enrich,
+                        on_site_only=on_site_only and not enrich,
+                        location=location,
+                        max_radius=radius
+                    )
+                with stage_seconds.time(stage="dedup"):
+                    unique_jobs = [job for job in filtered_jobs if job.get("url") and index.add_if_new(job)]
+                if enrich:
+                    found = len(unique_jobs)
+                    unique_jobs = await self._enrich_results(unique_jobs, remote_only, on_site_only, enrich_left)
+                    enrich_left = max(0, enrich_left - found)
+                for job in unique_jobs:
+                    if attribute:
+                        job["matched_queries"] = matched_queries[job["url"]]
+                    yield job
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._archive_jobs(scraped, scraped_queries)
+        
+        logger.info(f"Streamed {len(index)} total unique jobs")
+    
+    @staticmethod
+    def _unique_queries(queries):
+        """Non-empty queries in order, without case-insensitive repeats"""
+        unique = {}
+        for query in queries:
+            query = query.strip()
+            if query and query.lower() not in unique:
+                unique[query.lower()] = query
+        if not unique:
+            raise ValueError("At least one search query is required")
+        return list(unique.values())
+    
+    def _known_url_check(self, incremental, fresh=()):
+        """
+        URL check for incremental searches, or None for a full search
+        
+        Args:
+            incremental (bool): Whether the search is incremental
+            fresh (set, optional): URLs stored by the running search itself,
+                which still count as unseen
+        """
+        if not incremental:
+            return None
+        if self.store is None:
+            logger.warning("Incremental search needs database.path in config, running a full search")
+            return None
+        return lambda url: url not in fresh and url in self.store
+    
+    @staticmethod
+    def _source_name(scraper):
+        """Source label for a scraper, e.g. "jobbank" for JobBankScraper"""
+        return scraper.__class__.__name__.replace("Scraper", "").lower()
+    
+    async def _run_scraper(self, scraper, query, location, radius, is_known=None):
+        """Run a scraper without blocking the event loop"""
+        with scraper_seconds.time(scraper=scraper.__class__.__name__):
+            if isinstance(scraper, _lazy("scrapers.async_base", "AsyncBaseScraper")):
+                return await scraper.asearch(query, location, radius=radius, is_known=is_known)
+            
+            # Blocking scrapers (e.g. the Indeed API client) run in a worker thread
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                lambda: scraper.search(query=query, location=location, radius=radius)
+            )
+    
+    def export_results(self, jobs, output_file, format="csv", compression=None):
+        """
+        Export job results to file
+        
+        Jobs are written as they are read, so `jobs` may be a stream().
+        
+        Args:
+            jobs: Jobs to export (list or iterable)
+            output_file (str): Output path; its directory is created
+            format (str): "csv", "json", "jsonl" or "parquet"
+            compression (str, optional): "gzip" or "zstd"
+            
+        Returns:
+            int: Number of jobs written
+        """
+        export_jobs = _lazy("utils.export", "export_jobs")
+        return export_jobs(jobs, output_file, format=format, compression=compression)
     
     def display_results(self, jobs):
         """Display job results in the console"""
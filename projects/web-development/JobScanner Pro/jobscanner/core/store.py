@@ -0,0 +1,291 @@
+"""
+Persistent job posting store.
+Keeps every posting seen by a search so later searches can skip known ones,
+with a full-text index for searching stored postings offline.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+class JobStore:
+    """SQLite store of job postings keyed by URL"""
+
+    # Columns kept alongside the full JSON record for querying
+    COLUMNS = ["title", "company", "location", "type", "source", "salary", "posted_date", "description"]
+
+    # Full-text indexed columns and their BM25 weights
+    TEXT_COLUMNS = {"title": 10.0, "company": 3.0, "location": 3.0, "description": 1.0}
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): SQLite database file (the `database.path` config value)
+        """
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS postings (
+                url TEXT PRIMARY KEY,
+                title TEXT,
+                company TEXT,
+                location TEXT,
+                type TEXT,
+                source TEXT,
+                salary TEXT,
+                posted_date TEXT,
+                description TEXT,
+                data TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_postings_source ON postings (source, posted_date)"
+        )
+        self.full_text = self._create_text_index()
+        self._conn.commit()
+
+    def _create_text_index(self) -> bool:
+        """
+        Create the FTS5 index over the postings, kept current by triggers
+
+        Returns:
+            bool: False if this SQLite build lacks FTS5 (search() then falls
+                back to substring matching)
+        """
+        columns = ", ".join(self.TEXT_COLUMNS)
+        new_values = ", ".join(f"new.{column}" for column in self.TEXT_COLUMNS)
+        old_values = ", ".join(f"old.{column}" for column in self.TEXT_COLUMNS)
+        changed = " OR ".join(f"old.{column} IS NOT new.{column}" for column in self.TEXT_COLUMNS)
+
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'postings_fts'"
+        ).fetchone() is not None
+        try:
+            self._conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS postings_fts USING fts5("
+                f"{columns}, content='postings', content_rowid='rowid', "
+                f"tokenize='porter unicode61 remove_diacritics 2')"
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite full-text search unavailable ({e}); stored searches use substring matching")
+            return False
+
+        self._conn.executescript(f"""
+            CREATE TRIGGER IF NOT EXISTS postings_fts_insert AFTER INSERT ON postings BEGIN
+                INSERT INTO postings_fts (rowid, {columns}) VALUES (new.rowid, {new_values});
+            END;
+            CREATE TRIGGER IF NOT EXISTS postings_fts_delete AFTER DELETE ON postings BEGIN
+                INSERT INTO postings_fts (postings_fts, rowid, {columns})
+                VALUES ('delete', old.rowid, {old_values});
+            END;
+            CREATE TRIGGER IF NOT EXISTS postings_fts_update AFTER UPDATE ON postings
+            WHEN {changed} BEGIN
+                INSERT INTO postings_fts (postings_fts, rowid, {columns})
+                VALUES ('delete', old.rowid, {old_values});
+                INSERT INTO postings_fts (rowid, {columns}) VALUES (new.rowid, {new_values});
+            END;
+        """)
+        if not exists:
+            # Index postings stored before the index existed
+            self.rebuild_text_index()
+        return True
+
+    def rebuild_text_index(self):
+        """Re-index every stored posting, e.g. after a VACUUM renumbered rows"""
+        with self._lock:
+            self._conn.execute("INSERT INTO postings_fts (postings_fts) VALUES ('rebuild')")
+            self._conn.commit()
+
+    def __contains__(self, url: str) -> bool:
+        """Check whether a posting URL has been stored"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM postings WHERE url = ?", (url,)
+            ).fetchone() is not None
+
+    def __len__(self) -> int:
+        """Number of stored postings"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM postings").fetchone()[0]
+
+    def known_urls(self, urls: Iterable[str]) -> Set[str]:
+        """
+        Find which URLs are already stored
+
+        Args:
+            urls (Iterable[str]): Posting URLs to check
+
+        Returns:
+            Set[str]: The subset of URLs already in the store
+        """
+        urls = list({url for url in urls if url})
+        known = set()
+        with self._lock:
+            # Stay under SQLite's bound parameter limit
+            for i in range(0, len(urls), 500):
+                chunk = urls[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                known.update(row[0] for row in self._conn.execute(
+                    f"SELECT url FROM postings WHERE url IN ({placeholders})", chunk
+                ))
+        return known
+
+    def add_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Store postings, refreshing last_seen for ones already stored
+
+        Args:
+            jobs (List[Dict]): Job records or dictionaries with a url key
+
+        Returns:
+            List[Dict]: The jobs that were not stored before
+        """
+        jobs = [job for job in jobs if job.get("url")]
+        known = self.known_urls(job["url"] for job in jobs)
+        new_jobs = []
+
+        now = time.time()
+        rows = []
+        for job in jobs:
+            if job["url"] not in known:
+                new_jobs.append(job)
+                known.add(job["url"])
+            rows.append(
+                [job["url"]]
+                + [job.get(column) for column in self.COLUMNS]
+                + [json.dumps(dict(job), default=str), now, now]
+            )
+
+        columns = ", ".join(self.COLUMNS)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in self.COLUMNS)
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT INTO postings (url, {columns}, data, first_seen, last_seen) "
+                f"VALUES ({','.join('?' * (len(self.COLUMNS) + 4))}) "
+                f"ON CONFLICT(url) DO UPDATE SET {updates}, "
+                f"data = excluded.data, last_seen = excluded.last_seen",
+                rows
+            )
+            self._conn.commit()
+
+        logger.info(f"Stored {len(jobs)} postings ({len(new_jobs)} new)")
+        return new_jobs
+
+    def get_jobs(self, source: Optional[str] = None, since: Optional[float] = None) -> List[Dict]:
+        """
+        Load stored postings, newest first
+
+        Args:
+            source (str, optional): Only postings from this source
+            since (float, optional): Only postings first seen after this timestamp
+
+        Returns:
+            List[Dict]: Stored job dictionaries
+        """
+        query = "SELECT data FROM postings WHERE 1 = 1"
+        params = []
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        if since is not None:
+            query += " AND first_seen > ?"
+            params.append(since)
+        query += " ORDER BY first_seen DESC"
+
+        with self._lock:
+            return [json.loads(row[0]) for row in self._conn.execute(query, params)]
+
+    @staticmethod
+    def _match_expression(text: str, any_term: bool = False) -> Optional[str]:
+        """
+        FTS5 query for free text: every word as a quoted prefix term
+
+        Args:
+            text (str): e.g. "motion graphics remote Brampton"
+            any_term (bool): Match any word instead of all of them
+
+        Returns:
+            str: e.g. '"motion"* AND "graphics"*', or None without words
+        """
+        words = re.findall(r"\w+", text.lower())
+        if not words:
+            return None
+        return (" OR " if any_term else " AND ").join(f'"{word}"*' for word in words)
+
+    def search(self, text: str, limit: int = 50, source: Optional[str] = None) -> List[Dict]:
+        """
+        Full-text search over stored postings, best matches first
+
+        Title, company, location and description are searched with BM25
+        ranking (title matches weigh most). Postings must contain every word
+        (word prefixes match, so "design" finds "designer"); if none do,
+        postings with any of the words are returned instead.
+
+        Args:
+            text (str): Search words
+            limit (int): Maximum results
+            source (str, optional): Only postings from this source
+
+        Returns:
+            List[Dict]: Stored job dictionaries with a `rank` (lower is better)
+        """
+        if not self.full_text:
+            return self._search_substring(text, limit, source)
+
+        weights = ", ".join(str(weight) for weight in self.TEXT_COLUMNS.values())
+        query = (
+            f"SELECT p.data, bm25(postings_fts, {weights}) AS rank "
+            f"FROM postings_fts JOIN postings p ON p.rowid = postings_fts.rowid "
+            f"WHERE postings_fts MATCH ?"
+        )
+        if source:
+            query += " AND p.source = ?"
+        query += " ORDER BY rank LIMIT ?"
+
+        for any_term in (False, True):
+            expression = self._match_expression(text, any_term)
+            if expression is None:
+                return []
+            params = [expression] + ([source] if source else []) + [limit]
+            with self._lock:
+                rows = self._conn.execute(query, params).fetchall()
+            if rows:
+                break
+
+        jobs = []
+        for data, rank in rows:
+            job = json.loads(data)
+            job["rank"] = rank
+            jobs.append(job)
+        return jobs
+
+    def _search_substring(self, text: str, limit: int, source: Optional[str]) -> List[Dict]:
+        """search() without FTS5: postings containing every word, newest first"""
+        words = re.findall(r"\w+", text.lower())
+        if not words:
+            return []
+        haystack = " || ' ' || ".join(f"COALESCE({column}, '')" for column in self.TEXT_COLUMNS)
+        query = "SELECT data FROM postings WHERE " + " AND ".join(
+            f"LOWER({haystack}) LIKE ?" for _ in words
+        )
+        params = [f"%{word}%" for word in words]
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        query += " ORDER BY first_seen DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            return [json.loads(row[0]) for row in self._conn.execute(query, params)]
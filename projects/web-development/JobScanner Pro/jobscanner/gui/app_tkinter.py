@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
-import csv
 import webbrowser
 import threading
+import time
 import subprocess
 import platform
 import os
@@ -15,7 +15,10 @@ import re
 # Handle imports for both development and PyInstaller executable
 try:
     from ..core.search import JobSearch
-    from ..core.filters import filter_jobs, deduplicate_jobs
+    from ..core.filters import is_remote_job
+    from ..core.scoring import score_jobs
+    from ..core.store import JobStore
+    from ..utils.export import export_jobs
 except ImportError:
     # Fallback for PyInstaller executable
     import sys
@@ -32,7 +35,10 @@ except ImportError:
     sys.path.insert(0, str(app_path))
     
     from jobscanner.core.search import JobSearch
-    from jobscanner.core.filters import filter_jobs, deduplicate_jobs
+    from jobscanner.core.filters import is_remote_job
+    from jobscanner.core.scoring import score_jobs
+    from jobscanner.core.store import JobStore
+    from jobscanner.utils.export import export_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -112,10 +118,23 @@ class JobScannerGUI:
                     "jobbank": True,
                     "craigslist": True,
                     "kijiji": True
+                },
+                "cache": {
+                    "enabled": True,
+                    "path": "outputs/http_cache.db",
+                    "ttl": 900
                 }
+            },
+            # Postings from every search are stored and full-text indexed
+            "database": {
+                "path": "outputs/applied_jobs.db"
             }
         }
         
+        # Saved postings search
+        self.stored_query_var = tk.StringVar()
+        self.store = None
+        
         self.setup_gui()
         self.results: List[Dict] = []
         
@@ -307,6 +326,13 @@ class JobScannerGUI:
         self.results_summary_var = tk.StringVar(value="No search performed yet")
         ttk.Label(summary_frame, textvariable=self.results_summary_var, font=('TkDefaultFont', 11, 'bold')).pack(side=tk.LEFT)
         
+        # Offline search over postings saved by earlier searches
+        ttk.Button(summary_frame, text="🔎 Search Saved", command=self.search_saved_postings).pack(side=tk.RIGHT)
+        stored_query_entry = ttk.Entry(summary_frame, textvariable=self.stored_query_var, width=35)
+        stored_query_entry.pack(side=tk.RIGHT, padx=(0, 5))
+        stored_query_entry.bind("<Return>", lambda event: self.search_saved_postings())
+        ttk.Label(summary_frame, text="Saved postings:").pack(side=tk.RIGHT, padx=(0, 5))
+        
         # Results table with enhanced columns
         table_frame = ttk.Frame(self.results_frame)
         table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
@@ -494,34 +520,24 @@ class JobScannerGUI:
             remote_only = self.remote_pref_var.get() == "remote"
             on_site_only = self.remote_pref_var.get() == "on-site"
             
-            # Perform primary search
-            self.results = job_search.search(
-                query=primary_search,
+            # Search the primary and top 2 related terms together, showing
+            # jobs as each page arrives
+            queries = search_terms[:3] or [primary_search]
+            self.results = []
+            self.root.after(0, self._clear_tree)
+            for job in job_search.stream_many(
+                queries,
                 location=self.location_var.get(),
                 radius=self.radius_var.get(),
                 gigs_only=self.gigs_only_var.get(),
                 new_only=self.new_only_var.get(),
                 remote_only=remote_only,
                 on_site_only=on_site_only
-            )
+            ):
+                self.results.append(job)
+                self.root.after(0, self._show_streamed_job, job)
             
-            # Perform additional searches for related terms
-            if len(search_terms) > 1:
-                for term in search_terms[1:3]:  # Search top 2 additional terms
-                    self.status_var.set(f"Searching related term: {term}...")
-                    additional_results = job_search.search(
-                        query=term,
-                        location=self.location_var.get(),
-                        radius=self.radius_var.get(),
-                        gigs_only=self.gigs_only_var.get(),
-                        new_only=self.new_only_var.get(),
-                        remote_only=remote_only,
-                        on_site_only=on_site_only
-                    )
-                    self.results.extend(additional_results)
-            
-            # Remove duplicates and apply salary filtering
-            self.results = deduplicate_jobs(self.results)
+            # Apply salary filtering
             self.results = self._apply_salary_filter(self.results)
             self._calculate_match_scores(search_terms)
             
@@ -536,20 +552,10 @@ class JobScannerGUI:
             self.root.after(0, lambda msg=error_msg: self.search_error(msg))
     
     def _calculate_match_scores(self, search_terms):
-        """Calculate match scores for jobs based on search terms"""
-        for job in self.results:
-            score = 0
-            job_text = f"{job.get('title', '')} {job.get('description', '')} {job.get('company', '')}".lower()
-            
-            for term in search_terms:
-                if term.lower() in job_text:
-                    score += 1
-            
-            # Bonus for exact title match
-            if search_terms and search_terms[0].lower() in job.get('title', '').lower():
-                score += 2
-            
-            job['match_score'] = min(100, int((score / len(search_terms)) * 100)) if search_terms else 50
+        """Score results 0-100 by BM25 relevance, weighting the job title double"""
+        job_title = self.job_title_var.get().strip().lower()
+        weights = [2.0 if term.strip().lower() == job_title else 1.0 for term in search_terms]
+        score_jobs(self.results, search_terms, weights)
     
     def _apply_salary_filter(self, results):
         """Apply salary filtering to search results"""
@@ -594,12 +600,12 @@ class JobScannerGUI:
         self.search_btn.configure(text="🔍 Search Jobs", state="normal")
         self.is_searching.set(False)
         
-        # Clear existing results
-        self.clear_results()
+        # Clear rows shown while streaming
+        self._clear_tree()
         
         # Update summary
         total_jobs = len(self.results)
-        remote_jobs = len([j for j in self.results if 'remote' in j.get('location', '').lower()])
+        remote_jobs = sum(1 for j in self.results if is_remote_job(j))
         avg_match = sum(j.get('match_score', 0) for j in self.results) / len(self.results) if self.results else 0
         
         summary = f"Found {total_jobs} jobs ({remote_jobs} remote) • Avg. Match: {avg_match:.0f}%"
@@ -607,34 +613,71 @@ class JobScannerGUI:
         
         # Populate results table
         for job in self.results:
-            # Format salary
-            salary = job.get('salary', 'Not specified')
-            if salary and len(salary) > 20:
-                salary = salary[:17] + "..."
-            
-            # Format posting date
-            posted = job.get('posted_date', 'N/A')
-            
-            # Add job type indicator
-            job_type = job.get('type', '').capitalize()
-            if 'remote' in job.get('location', '').lower():
-                job_type += " (Remote)"
-            
-            self.tree.insert("", tk.END, values=(
-                job.get("title", "")[:40] + ("..." if len(job.get("title", "")) > 40 else ""),
-                job.get("company", "")[:25] + ("..." if len(job.get("company", "")) > 25 else ""),
-                job.get("location", "")[:20] + ("..." if len(job.get("location", "")) > 20 else ""),
-                job_type,
-                salary,
-                posted,
-                job.get("source", "").capitalize(),
-                f"{job.get('match_score', 0)}%"
-            ))
+            self._insert_job_row(job)
         
         # Switch to results tab
         self.notebook.select(self.results_frame)
         self.status_var.set(f"Search completed - {total_jobs} jobs found")
     
+    def _insert_job_row(self, job, match="{}%"):
+        """Add one job to the results table"""
+        # Format salary
+        salary = job.get('salary', 'Not specified')
+        if salary and len(salary) > 20:
+            salary = salary[:17] + "..."
+        
+        # Format posting date
+        posted = job.get('posted_date', 'N/A')
+        
+        # Add job type indicator
+        job_type = job.get('type', '').capitalize()
+        if is_remote_job(job):
+            job_type += " (Remote)"
+        
+        self.tree.insert("", tk.END, values=(
+            job.get("title", "")[:40] + ("..." if len(job.get("title", "")) > 40 else ""),
+            job.get("company", "")[:25] + ("..." if len(job.get("company", "")) > 25 else ""),
+            job.get("location", "")[:20] + ("..." if len(job.get("location", "")) > 20 else ""),
+            job_type,
+            salary,
+            posted,
+            job.get("source", "").capitalize(),
+            match.format(job.get('match_score', 0))
+        ))
+    
+    def _show_streamed_job(self, job):
+        """Show a job from a running search before results are scored"""
+        if not self.tree.get_children():
+            self.notebook.select(self.results_frame)
+        self._insert_job_row(job, match="…")
+        
+        count = len(self.tree.get_children())
+        self.results_summary_var.set(f"Found {count} jobs so far...")
+        self.status_var.set(f"Searching... {count} jobs found so far")
+    
+    def search_saved_postings(self):
+        """Show stored postings matching the saved-postings search box"""
+        text = self.stored_query_var.get().strip()
+        if not text:
+            return
+        
+        try:
+            if self.store is None:
+                self.store = JobStore(self.config["database"]["path"])
+            start = time.perf_counter()
+            self.results = self.store.search(text, limit=200)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        except Exception as e:
+            messagebox.showerror("Search Error", f"Could not search saved postings: {str(e)}")
+            return
+        
+        self._clear_tree()
+        for job in self.results:
+            self._insert_job_row(job, match="–")
+        
+        self.results_summary_var.set(f"{len(self.results)} saved postings match \"{text}\"")
+        self.status_var.set(f"Searched saved postings in {elapsed_ms:.0f} ms")
+    
     def search_error(self, error_msg):
         """Handle search errors"""
         self.progress_bar.stop()
@@ -675,28 +718,26 @@ class JobScannerGUI:
             # Export to CSV with enhanced details
             csv_file = output_dir / f"job_search_results_{timestamp}.csv"
             
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    'title', 'company', 'location', 'type', 'salary', 'posted_date', 
-                    'source', 'url', 'match_score', 'description'
-                ])
-                writer.writeheader()
-                
-                for job in self.results:
-                    # Clean up data for CSV
-                    cleaned_job = {
-                        'title': job.get('title', ''),
-                        'company': job.get('company', ''),
-                        'location': job.get('location', ''),
-                        'type': job.get('type', ''),
-                        'salary': job.get('salary', ''),
-                        'posted_date': job.get('posted_date', ''),
-                        'source': job.get('source', ''),
-                        'url': job.get('url', ''),
-                        'match_score': job.get('match_score', 0),
-                        'description': job.get('description', '')[:500]  # Limit description length
-                    }
-                    writer.writerow(cleaned_job)
+            # Clean up data for CSV as rows are written
+            cleaned_jobs = (
+                {
+                    'title': job.get('title', ''),
+                    'company': job.get('company', ''),
+                    'location': job.get('location', ''),
+                    'type': job.get('type', ''),
+                    'salary': job.get('salary', ''),
+                    'posted_date': job.get('posted_date', ''),
+                    'source': job.get('source', ''),
+                    'url': job.get('url', ''),
+                    'match_score': job.get('match_score', 0),
+                    'description': (job.get('description') or '')[:500]  # Limit description length
+                }
+                for job in self.results
+            )
+            export_jobs(cleaned_jobs, csv_file, fields=[
+                'title', 'company', 'location', 'type', 'salary', 'posted_date', 
+                'source', 'url', 'match_score', 'description'
+            ])
             
             # Also export search parameters for reference
             params_file = output_dir / f"search_parameters_{timestamp}.json"
@@ -744,10 +785,14 @@ class JobScannerGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open exports folder: {str(e)}")
     
-    def clear_results(self):
-        """Clear all search results"""
+    def _clear_tree(self):
+        """Remove all rows from the results table"""
         for item in self.tree.get_children():
             self.tree.delete(item)
+    
+    def clear_results(self):
+        """Clear all search results"""
+        self._clear_tree()
         self.results = []
         self.results_summary_var.set("No results")
 
@@ -8,36 +8,42 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-import yaml
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-from rich import print as rprint
-
-# Local imports
-from .core.search import JobSearch
+
+# Local imports; yaml, rich and the search stack (requests, bs4, numpy, the
+# scrapers) are imported on first use so `--help` and argument errors
+# return without loading them
 from .utils.logger import setup_logger
 
-# Initialize rich console
-console = Console()
+_console = None
+
+def get_console():
+    """The shared rich console, created on first use"""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
 
 def load_config():
     """Load configuration from config.yml"""
+    import yaml
+    
     config_path = Path(__file__).parent / "config.yml"
     try:
         with open(config_path) as f:
             return yaml.safe_load(f)
     except FileNotFoundError:
-        console.print(f"[red]Error:[/red] config.yml not found at {config_path}")
+        get_console().print(f"[red]Error:[/red] config.yml not found at {config_path}")
         sys.exit(1)
     except yaml.YAMLError as e:
-        console.print(f"[red]Error parsing config.yml:[/red] {e}")
+        get_console().print(f"[red]Error parsing config.yml:[/red] {e}")
         sys.exit(1)
 
 def setup_argparse():
     """Setup command line argument parsing"""
     parser = argparse.ArgumentParser(
-        description="JobScanner Pro - Find and apply to creative jobs in Canada"
+        description="JobScanner Pro - Find and apply to creative jobs in Canada",
+        epilog="Use `jobscanner query WORDS...` to search stored postings offline."
     )
     
     parser.add_argument(
@@ -81,6 +87,12 @@ def setup_argparse():
         help="Only show on-site jobs"
     )
     
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only show postings not seen by previous searches"
+    )
+    
     parser.add_argument(
         "--source",
         choices=["indeed", "jobbank", "craigslist", "kijiji"],
@@ -96,8 +108,27 @@ def setup_argparse():
     
     parser.add_argument(
         "--export",
-        choices=["csv", "json"],
-        help="Export results to specified format"
+        choices=["csv", "json", "jsonl", "parquet"],
+        help="Export results to specified format (parquet needs pyarrow)"
+    )
+    
+    parser.add_argument(
+        "--compress",
+        choices=["gzip", "zstd"],
+        help="Compress the export (zstd needs zstandard)"
+    )
+    
+    parser.add_argument(
+        "--enrich",
+        type=int,
+        metavar="N",
+        help="Fetch posting pages of the top N results for full details"
+    )
+    
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Show or export results as each page arrives (ignores --sort)"
     )
     
     parser.add_argument(
@@ -114,13 +145,10 @@ def sort_jobs(jobs, sort_by):
         return sorted(jobs, key=lambda x: x.get("posted_date", ""), reverse=True)
     return sorted(jobs, key=lambda x: x.get(sort_by, "").lower())
 
-def display_results_table(jobs, verbose=False):
-    """Display job results in a formatted table"""
-    if not jobs:
-        console.print("\n[yellow]No jobs found matching your criteria.[/yellow]")
-        return
-        
-    # Create table
+def _results_table(verbose=False):
+    """Create an empty results table"""
+    from rich.table import Table
+    
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Title", style="cyan")
     table.add_column("Company", style="green")
@@ -131,37 +159,152 @@ def display_results_table(jobs, verbose=False):
         table.add_column("Description", style="white", no_wrap=False)
     table.add_column("Posted", style="green")
     table.add_column("Salary", style="yellow")
+    return table
+
+def _job_row(job, verbose=False):
+    """Table cells for one job"""
+    row = [
+        job["title"],
+        job["company"],
+        job["location"],
+        job["type"].capitalize(),
+        job.get("source", "Unknown").capitalize(),
+    ]
+    if verbose:
+        desc = job.get("description", "")
+        row.append(desc[:200] + "..." if len(desc) > 200 else desc)
+    row.extend([
+        job.get("posted_date", "N/A"),
+        job.get("salary", "Not specified")
+    ])
+    return row
+
+def _print_urls(jobs):
+    """Print URLs separately for easy copying"""
+    get_console().print("\n[bold]Job URLs:[/bold]")
+    for i, job in enumerate(jobs, 1):
+        get_console().print(f"{i}. {job['url']}")
+
+def display_results_table(jobs, verbose=False):
+    """Display job results in a formatted table"""
+    if not jobs:
+        get_console().print("\n[yellow]No jobs found matching your criteria.[/yellow]")
+        return
+        
+    # Create table
+    table = _results_table(verbose)
     
     # Add rows
     for job in jobs:
-        row = [
-            job["title"],
-            job["company"],
-            job["location"],
-            job["type"].capitalize(),
-            job.get("source", "Unknown").capitalize(),
-        ]
-        if verbose:
-            desc = job.get("description", "")
-            row.append(desc[:200] + "..." if len(desc) > 200 else desc)
-        row.extend([
-            job.get("posted_date", "N/A"),
-            job.get("salary", "Not specified")
-        ])
-        table.add_row(*row)
+        table.add_row(*_job_row(job, verbose))
     
     # Print results
-    console.print(f"\n[bold]Found {len(jobs)} jobs:[/bold]")
-    console.print(table)
+    get_console().print(f"\n[bold]Found {len(jobs)} jobs:[/bold]")
+    get_console().print(table)
     
     # Print URLs separately for easy copying
     if verbose:
-        console.print("\n[bold]Job URLs:[/bold]")
-        for i, job in enumerate(jobs, 1):
-            console.print(f"{i}. {job['url']}")
+        _print_urls(jobs)
+
+def stream_results_table(results, source=None, verbose=False):
+    """
+    Display jobs in a live table as they arrive
+    
+    Args:
+        results: Iterable of jobs, e.g. JobSearch.stream(...)
+        source (str, optional): Only show results from this source
+        verbose (bool): Show descriptions and URLs
+        
+    Returns:
+        list: The jobs that were displayed
+    """
+    from rich.live import Live
+    
+    table = _results_table(verbose)
+    jobs = []
+    
+    with Live(table, console=get_console(), refresh_per_second=8):
+        for job in results:
+            if source and job.get("source") != source:
+                continue
+            jobs.append(job)
+            table.add_row(*_job_row(job, verbose))
+    
+    if not jobs:
+        get_console().print("\n[yellow]No jobs found matching your criteria.[/yellow]")
+        return jobs
+    
+    get_console().print(f"\n[bold]Found {len(jobs)} jobs[/bold]")
+    if verbose:
+        _print_urls(jobs)
+    return jobs
+
+def setup_query_argparse():
+    """Setup argument parsing for `jobscanner query`"""
+    parser = argparse.ArgumentParser(
+        prog="jobscanner query",
+        description="Search postings stored by earlier searches, without going online"
+    )
+    
+    parser.add_argument(
+        "text",
+        nargs="+",
+        help="Words to find in titles, companies, locations and descriptions"
+    )
+    
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Maximum number of results (default: 20)"
+    )
+    
+    parser.add_argument(
+        "--source",
+        choices=["indeed", "jobbank", "craigslist", "kijiji"],
+        help="Only show results from specific source"
+    )
+    
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Show detailed job descriptions"
+    )
+    
+    return parser
+
+def query_main(argv):
+    """Search the local posting store (`jobscanner query ...`)"""
+    import time
+    
+    args = setup_query_argparse().parse_args(argv)
+    config = load_config()
+    
+    db_path = config.get("database", {}).get("path")
+    if not db_path or not Path(db_path).exists():
+        get_console().print("[yellow]No stored postings yet - run a search first (needs database.path in config.yml)[/yellow]")
+        sys.exit(1)
+    
+    from .core.store import JobStore
+    
+    start = time.perf_counter()
+    results = JobStore(db_path).search(" ".join(args.text), limit=args.limit, source=args.source)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    display_results_table(results, verbose=args.verbose)
+    get_console().print(f"[dim]{len(results)} stored matches in {elapsed_ms:.0f} ms[/dim]")
 
 def main():
     """Main execution function"""
+    # `jobscanner query ...` searches stored postings instead of scraping
+    if sys.argv[1:2] == ["query"]:
+        query_main(sys.argv[2:])
+        return
+    
+    # Parse arguments first so --help and usage errors skip the setup below
+    parser = setup_argparse()
+    args = parser.parse_args()
+    
     # Load configuration
     config = load_config()
     
@@ -169,32 +312,62 @@ def main():
     setup_logger(config["logging"]["level"], config["logging"]["file"])
     logger = logging.getLogger(__name__)
     
-    # Parse arguments
-    parser = setup_argparse()
-    args = parser.parse_args()
-    
     try:
-        # Initialize job search
+        from .core.search import JobSearch
+        
+        if args.enrich:
+            enrich = config["search"].setdefault("enrich", {})
+            enrich.update(enabled=True, top_n=args.enrich)
+        
+        # Initialize job search; only enabled platforms' scrapers are loaded
         search = JobSearch(config)
         
+        search_options = dict(
+            query=args.query,
+            location=args.location,
+            radius=args.radius or config["search"]["default_radius"],
+            gigs_only=args.gigs_only,
+            new_only=args.new_only,
+            remote_only=args.remote_only,
+            on_site_only=args.on_site_only,
+            incremental=args.incremental
+        )
+        
+        # Render rows as scrapers deliver them
+        if args.stream and not args.export:
+            stream_results_table(
+                search.stream(**search_options),
+                source=args.source,
+                verbose=args.verbose
+            )
+            return
+        
+        if args.export:
+            # Parquet compresses internally, so its file name keeps one suffix
+            suffix = "" if args.export == "parquet" else {"gzip": ".gz", "zstd": ".zst"}.get(args.compress, "")
+            output_file = f"outputs/jobs.{args.export}{suffix}"
+        
+        # Write rows to the export as scrapers deliver them
+        if args.stream:
+            results = search.stream(**search_options)
+            if args.source:
+                results = (job for job in results if job.get("source") == args.source)
+            count = search.export_results(results, output_file, format=args.export, compression=args.compress)
+            get_console().print(f"\n[green]{count} results exported to {output_file}[/green]")
+            return
+        
         # Show progress during search
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console
+            console=get_console()
         ) as progress:
             task = progress.add_task("Searching for jobs...", total=None)
             
             # Perform search
-            results = search.search(
-                query=args.query,
-                location=args.location,
-                radius=args.radius or config["search"]["default_radius"],
-                gigs_only=args.gigs_only,
-                new_only=args.new_only,
-                remote_only=args.remote_only,
-                on_site_only=args.on_site_only
-            )
+            results = search.search(**search_options)
             
             progress.update(task, completed=True)
         
@@ -207,18 +380,17 @@ def main():
         
         # Export or display results
         if args.export:
-            output_file = f"outputs/jobs.{args.export}"
-            search.export_results(results, output_file, format=args.export)
-            console.print(f"\n[green]Results exported to {output_file}[/green]")
+            search.export_results(results, output_file, format=args.export, compression=args.compress)
+            get_console().print(f"\n[green]Results exported to {output_file}[/green]")
         else:
             display_results_table(results, verbose=args.verbose)
             
     except KeyboardInterrupt:
-        console.print("\n[yellow]Search cancelled by user[/yellow]")
+        get_console().print("\n[yellow]Search cancelled by user[/yellow]")
         sys.exit(0)
     except Exception as e:
         logger.error(f"Error during job search: {e}")
-        console.print(f"\n[red]Error during job search:[/red] {str(e)}")
+        get_console().print(f"\n[red]Error during job search:[/red] {str(e)}")
         sys.exit(1)
 
 if __name__ == "__main__":
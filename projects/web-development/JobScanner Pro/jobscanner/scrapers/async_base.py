@@ -0,0 +1,172 @@
+"""
+Asynchronous base scraper that keeps every page and category request in flight
+concurrently while respecting per-host politeness limits.
+"""
+
+import asyncio
+import contextvars
+import functools
+import weakref
+from abc import abstractmethod
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+from .base import BaseScraper
+from .details import parse_job_posting
+from .http_cache import is_cached
+
+# Receives (scraper, jobs) for every parsed page while a stream is active
+# (see JobSearch.astream); tasks started inside the stream inherit it
+page_sink = contextvars.ContextVar("page_sink", default=None)
+
+class AsyncBaseScraper(BaseScraper):
+    """Abstract base class for scrapers built on asyncio"""
+
+    # Politeness settings (request rate per host comes from the rate limiter)
+    MAX_CONCURRENCY = 4   # Maximum requests in flight per host
+    REQUEST_TIMEOUT = 30  # Timeout for each request in seconds
+
+    DETAIL_CACHE_SIZE = 1024  # Parsed detail pages remembered by URL
+
+    def __init__(self):
+        """Initialize scraper with per-loop host semaphores"""
+        super().__init__()
+        # Semaphores belong to an event loop, so keep one set per loop
+        self._host_semaphores = weakref.WeakKeyDictionary()
+        self._details = OrderedDict()
+
+    def search(self, query, location, radius=None):
+        """
+        Blocking wrapper around asearch for synchronous callers
+
+        Args:
+            query (str): Search query
+            location (str): Location to search in
+            radius (int, optional): Search radius in km
+
+        Returns:
+            list: List of job dictionaries
+        """
+        return asyncio.run(self.asearch(query, location, radius=radius))
+
+    @abstractmethod
+    async def asearch(self, query, location, radius=None, is_known=None):
+        """
+        Search for jobs concurrently
+
+        Args:
+            query (str): Search query
+            location (str): Location to search in
+            radius (int, optional): Search radius in km
+            is_known (callable, optional): Returns True for posting URLs that
+                are already stored; scrapers that paginate by date stop at the
+                first known posting
+
+        Returns:
+            list: List of job dictionaries (see BaseScraper.search)
+        """
+        pass
+
+    def _emit_page(self, jobs):
+        """
+        Hand a freshly parsed page of jobs to the active stream, if any
+
+        Args:
+            jobs (list): Jobs parsed from one page
+        """
+        sink = page_sink.get()
+        if sink is not None and jobs:
+            sink(self, jobs)
+
+    async def afetch_details(self, url):
+        """
+        Fetch and parse a posting's detail page
+
+        Parsed details are kept per URL (least recently used evicted), so
+        postings found again by later searches cost no request.
+
+        Args:
+            url (str): Posting URL
+
+        Returns:
+            dict: Any of company, description and salary
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        details = self._details.get(url)
+        if details is None:
+            response = await self._fetch(url)
+            details = self._parse_detail_page(response.text)
+            self._details[url] = details
+            if len(self._details) > self.DETAIL_CACHE_SIZE:
+                self._details.popitem(last=False)
+        else:
+            self._details.move_to_end(url)
+        return dict(details)
+
+    def _parse_detail_page(self, html):
+        """Read details from a posting page (schema.org JobPosting data)"""
+        return parse_job_posting(html)
+
+    @staticmethod
+    def _take_unseen(jobs, seen):
+        """
+        Drop jobs whose URL was already collected, e.g. by another category
+
+        Args:
+            jobs (list): Jobs parsed from one page
+            seen (set): URLs collected so far in this search; updated in place
+
+        Returns:
+            list: Jobs not seen before, in page order
+        """
+        unseen = []
+        for job in jobs:
+            url = job.get("url")
+            if url not in seen:
+                seen.add(url)
+                unseen.append(job)
+        return unseen
+
+    def _host_semaphore(self, url):
+        """Get the semaphore limiting concurrent requests to the URL's host"""
+        loop = asyncio.get_running_loop()
+        semaphores = self._host_semaphores.setdefault(loop, {})
+        host = urlparse(url).netloc
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        return semaphores[host]
+
+    async def _fetch(self, url, params=None):
+        """
+        Fetch a URL with the scraper's session without blocking the event loop
+
+        Args:
+            url (str): URL to fetch
+            params (dict, optional): Query string parameters
+
+        Returns:
+            requests.Response: Response with a successful status code
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+        """
+        async with self._host_semaphore(url):
+            # Cached pages don't touch the host, so they don't spend its budget
+            if not is_cached(url, params):
+                await self.rate_limiter.acquire_async(url)
+
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.session.get,
+                    url,
+                    params=params,
+                    timeout=self.REQUEST_TIMEOUT
+                )
+            )
+
+        response.raise_for_status()
+        return response
@@ -5,12 +5,15 @@ Base scraper class that defines the interface for all job scrapers.
 from abc import ABC, abstractmethod
 import logging
 
+from .rate_limiter import rate_limiter
+
 class BaseScraper(ABC):
     """Abstract base class for job scrapers"""
     
     def __init__(self):
-        """Initialize scraper with logging"""
+        """Initialize scraper with logging and the shared rate limiter"""
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.rate_limiter = rate_limiter
     
     @abstractmethod
     def search(self, query, location, radius=None):
@@ -23,7 +26,7 @@ class BaseScraper(ABC):
             radius (int, optional): Search radius in km
             
         Returns:
-            list: List of job dictionaries with the following keys:
+            list: List of Job records (dict-compatible) with the following keys:
                 - title (str): Job title
                 - company (str): Company name
                 - location (str): Job location
@@ -4,15 +4,19 @@ Handles both jobs and gigs sections.
 """
 
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import re
 from urllib.parse import urljoin, quote_plus
-import time
+import asyncio
 
-from .base import BaseScraper
+from .async_base import AsyncBaseScraper
+from .details import PLACEHOLDER_COMPANY, parse_job_posting
+from .html_parser import Selector, parse_html
+from .http_cache import mount_http_cache
+from .metrics import instrument_session, observe_parse
+from .job import Job
 
-class CraigslistScraper(BaseScraper):
+class CraigslistScraper(AsyncBaseScraper):
     """Scraper for Craigslist Toronto"""
     
     BASE_URL = "https://toronto.craigslist.org"
@@ -37,6 +41,17 @@ class CraigslistScraper(BaseScraper):
         "art": "art"
     }
     
+    # Search result page selectors
+    ROW = Selector("li.result-row")
+    TITLE = Selector("a.result-title")
+    HOOD = Selector("span.result-hood")
+    DATE = Selector("time.result-date")
+    PRICE = Selector("span.result-price")
+    
+    # Posting page selectors
+    POSTING_BODY = Selector("section#postingbody")
+    ATTRIBUTES = Selector(".attrgroup")
+    
     def __init__(self):
         """Initialize Craigslist scraper"""
         super().__init__()
@@ -45,131 +60,148 @@ class CraigslistScraper(BaseScraper):
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept-Language": "en-CA,en;q=0.9"
         })
+        mount_http_cache(self.session)
+        instrument_session(self.session)
     
-    def search(self, query, location, radius=None):
+    async def asearch(self, query, location, radius=None, is_known=None):
         """
         Search Craigslist Toronto for jobs and gigs
         
         Args:
             query (str): Search query
             location (str): Location to search in (will focus on Toronto area)
-            radius (int, optional): Search radius in km (used for location filtering)
+            radius (int, optional): Search radius in km (applied by the
+                JobSearch location filter)
+            is_known (callable, optional): Unused; each category is a single
+                page, so known postings are dropped by JobSearch
             
         Returns:
             list: List of job dictionaries
         """
         jobs = []
+        seen = set()  # Listings often appear in several categories
         
-        # Search both jobs and gigs sections
+        # Search both jobs and gigs sections concurrently
         try:
-            # Get jobs
-            jobs.extend(self._search_section(
-                self.JOBS_URL,
-                query,
-                self.JOB_CATEGORIES,
-                "job"
-            ))
-            
-            # Slight delay to avoid rate limiting
-            time.sleep(2)
-            
-            # Get gigs
-            jobs.extend(self._search_section(
-                self.GIGS_URL,
-                query,
-                self.GIG_CATEGORIES,
-                "gig"
-            ))
+            sections = await asyncio.gather(
+                self._search_section(
+                    self.JOBS_URL,
+                    query,
+                    self.JOB_CATEGORIES,
+                    "job",
+                    seen
+                ),
+                self._search_section(
+                    self.GIGS_URL,
+                    query,
+                    self.GIG_CATEGORIES,
+                    "gig",
+                    seen
+                )
+            )
+            for section_jobs in sections:
+                jobs.extend(section_jobs)
             
         except Exception as e:
             self.logger.error(f"Error during Craigslist search: {e}")
         
-        # Filter by location if radius specified
-        if radius and location.lower().startswith("brampton"):
-            jobs = self._filter_by_distance(jobs, radius)
-        
         return jobs
     
-    def _search_section(self, base_url, query, categories, job_type):
-        """Search a specific section (jobs or gigs) of Craigslist"""
-        results = []
+    async def _search_section(self, base_url, query, categories, job_type, seen=None):
+        """
+        Search a specific section (jobs or gigs) of Craigslist
         
-        # Search each relevant category
-        for category in categories.values():
-            try:
-                params = {
-                    "query": query,
-                    "sort": "date",  # Sort by newest first
-                }
-                
-                # Add category filter
-                url = f"{base_url}/{category}" if category else base_url
-                
-                # Get search results
-                response = self.session.get(
-                    url,
-                    params=params,
-                    timeout=30
-                )
-                response.raise_for_status()
-                
-                # Parse results
-                page_results = self._parse_search_page(
-                    response.text,
-                    job_type
-                )
-                results.extend(page_results)
-                
-                # Slight delay between categories
-                time.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(
-                    f"Error searching category {category}: {e}"
-                )
-                continue
+        `seen` holds the URLs collected so far, shared between sections
+        (default: a new set for this section).
+        """
+        if seen is None:
+            seen = set()
         
+        # Search every relevant category concurrently
+        pages = await asyncio.gather(*(
+            self._search_category(base_url, query, category, job_type, seen)
+            for category in categories.values()
+        ))
+        
+        results = []
+        for page_results in pages:
+            results.extend(page_results)
         return results
     
+    async def _search_category(self, base_url, query, category, job_type, seen):
+        """
+        Search a single category of a section
+        
+        Listings already collected from another category (URLs in `seen`)
+        are dropped as soon as the page is parsed.
+        """
+        try:
+            params = {
+                "query": query,
+                "sort": "date",  # Sort by newest first
+            }
+            
+            # Add category filter
+            url = f"{base_url}/{category}" if category else base_url
+            
+            # Get search results
+            response = await self._fetch(url, params=params)
+            
+            # Parse results
+            jobs = self._parse_search_page(
+                response.text,
+                job_type
+            )
+            jobs = self._take_unseen(jobs, seen)
+            self._emit_page(jobs)
+            return jobs
+            
+        except Exception as e:
+            self.logger.error(
+                f"Error searching category {category}: {e}"
+            )
+            return []
+    
+    @observe_parse
     def _parse_search_page(self, html, job_type):
         """Parse jobs/gigs from a search results page"""
-        soup = BeautifulSoup(html, "html.parser")
+        page = parse_html(html)
         results = []
         
         # Find all result rows
-        for row in soup.find_all("li", class_="result-row"):
+        for row in page.select(self.ROW):
             try:
                 # Get title and URL
-                title_elem = row.find("a", class_="result-title")
+                title_elem = row.select_one(self.TITLE)
                 if not title_elem:
                     continue
                     
                 # Get basic job info
-                job = {
-                    "title": self._clean_text(title_elem.get_text()),
-                    "url": title_elem["href"],
-                    "type": job_type
-                }
+                job = Job(
+                    title=self._clean_text(title_elem.get_text()),
+                    url=title_elem["href"],
+                    type=job_type
+                )
                 
                 # Get location
-                location_elem = row.find("span", class_="result-hood")
+                location_elem = row.select_one(self.HOOD)
                 job["location"] = self._clean_text(
                     location_elem.get_text().strip("()") if location_elem
                     else "Toronto, ON"
                 )
                 
                 # Set company (Craigslist often doesn't show this)
-                job["company"] = "See posting for details"
+                job["company"] = PLACEHOLDER_COMPANY
                 
                 # Get posting date
-                date_elem = row.find("time", class_="result-date")
+                date_elem = row.select_one(self.DATE)
                 if date_elem:
                     job["posted_date"] = self._parse_date(
                         date_elem["datetime"]
                     )
                 
                 # Get compensation if available
-                price_elem = row.find("span", class_="result-price")
+                price_elem = row.select_one(self.PRICE)
                 if price_elem:
                     job["salary"] = self._clean_text(price_elem.get_text())
                 
@@ -183,6 +215,24 @@ class CraigslistScraper(BaseScraper):
         
         return results
     
+    def _parse_detail_page(self, html):
+        """Read the posting body and compensation from a posting page"""
+        page = parse_html(html)
+        details = parse_job_posting(html, page=page)
+        
+        body = page.select_one(self.POSTING_BODY)
+        if body:
+            text = self._clean_text(body.get_text().replace("QR Code Link to This Post", ""))
+            if len(text) > len(details.get("description", "")):
+                details["description"] = text
+        
+        for group in page.select(self.ATTRIBUTES):
+            match = re.search(r"compensation:\s*([^\n]+)", group.get_text(), re.IGNORECASE)
+            if match and not details.get("salary"):
+                details["salary"] = self._clean_text(match.group(1))
+        
+        return details
+    
     def _parse_date(self, date_str):
         """Parse Craigslist date string to YYYY-MM-DD format"""
         try:
@@ -192,30 +242,3 @@ class CraigslistScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error parsing date '{date_str}': {e}")
             return None
-    
-    def _filter_by_distance(self, jobs, radius_km):
-        """
-        Filter jobs by distance from Brampton
-        Very basic filtering - only includes jobs with specific locations
-        """
-        brampton_locations = {
-            "brampton",
-            "mississauga",  # Include nearby cities within typical radius
-            "etobicoke",
-            "woodbridge",
-            "vaughan"
-        }
-        
-        filtered = []
-        for job in jobs:
-            location = job["location"].lower()
-            
-            # Include if in Brampton or nearby cities
-            if any(city in location for city in brampton_locations):
-                filtered.append(job)
-                
-            # Include if no specific location (might be remote)
-            elif location == "toronto, on":
-                filtered.append(job)
-        
-        return filtered 
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""
+Posting details from job detail pages.
+
+Detail pages describe the posting with schema.org JobPosting data, either as
+JSON-LD or as microdata/RDFa attributes. `parse_job_posting` reads the
+company, full description and salary from either form; `merge_details`
+fills them into a search result.
+"""
+
+import html
+import json
+import logging
+import re
+from typing import Dict, Optional
+
+from .html_parser import Selector, parse_html
+
+logger = logging.getLogger(__name__)
+
+# Company shown by scrapers whose result pages don't name the employer
+PLACEHOLDER_COMPANY = "See posting for details"
+
+LD_JSON = Selector("script[type=application/ld+json]")
+
+# Microdata (itemprop) and RDFa (property) forms of each JobPosting field
+ORGANIZATION = (Selector("[itemprop=hiringOrganization]"), Selector("[property=hiringOrganization]"))
+NAME = (Selector("[itemprop=name]"), Selector("[property=name]"))
+DESCRIPTION = (Selector("[itemprop=description]"), Selector("[property=description]"))
+BASE_SALARY = (Selector("[itemprop=baseSalary]"), Selector("[property=baseSalary]"))
+
+# schema.org unitText -> salary parser period wording
+SALARY_UNITS = {"HOUR": "hourly", "DAY": "daily", "WEEK": "weekly", "MONTH": "monthly", "YEAR": "annually"}
+
+def _clean(text: Optional[str]) -> str:
+    """Collapse whitespace"""
+    return re.sub(r"\s+", " ", text or "").strip()
+
+def _first(node, selectors):
+    """First element matching any of the selectors"""
+    for selector in selectors:
+        match = node.select_one(selector)
+        if match is not None:
+            return match
+    return None
+
+def _job_postings(data):
+    """JobPosting objects in a JSON-LD document (object, list or @graph)"""
+    if isinstance(data, list):
+        for item in data:
+            yield from _job_postings(item)
+    elif isinstance(data, dict):
+        types = data.get("@type")
+        if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+            yield data
+        yield from _job_postings(data.get("@graph"))
+
+def _format_amount(value) -> Optional[str]:
+    """Dollar amount like "$25.00" or "$55,000.00" """
+    try:
+        return f"${float(str(value).replace(',', '')):,.2f}"
+    except (TypeError, ValueError):
+        return None
+
+def _format_salary(salary) -> Optional[str]:
+    """
+    Salary text in the format the salary parser reads, e.g.
+    "$25.00 to $30.00 hourly", from a schema.org MonetaryAmount
+    """
+    if not isinstance(salary, dict):
+        return _clean(str(salary)) if salary else None
+
+    value = salary.get("value")
+    if not isinstance(value, dict):
+        value = {"value": value}
+    low = _format_amount(value.get("minValue", value.get("value")))
+    high = _format_amount(value.get("maxValue"))
+    if not low:
+        return None
+
+    text = f"{low} to {high}" if high and high != low else low
+    unit = SALARY_UNITS.get(str(value.get("unitText") or salary.get("unitText") or "").upper())
+    return f"{text} {unit}" if unit else text
+
+def _from_json_ld(posting: Dict) -> Dict:
+    """Detail fields from a JSON-LD JobPosting"""
+    details = {}
+
+    organization = posting.get("hiringOrganization")
+    if isinstance(organization, dict):
+        organization = organization.get("name")
+    if organization:
+        details["company"] = _clean(str(organization))
+
+    description = posting.get("description")
+    if description:
+        # Descriptions are often HTML fragments; keep paragraphs apart
+        details["description"] = _clean(html.unescape(re.sub(r"<[^>]+>", " ", str(description))))
+
+    salary = _format_salary(posting.get("baseSalary"))
+    if salary:
+        details["salary"] = salary
+
+    return details
+
+def _from_microdata(page) -> Dict:
+    """Detail fields from microdata or RDFa attributes"""
+    details = {}
+
+    organization = _first(page, ORGANIZATION)
+    if organization is not None:
+        name = _first(organization, NAME)
+        company = _clean((name or organization).get_text())
+        if company:
+            details["company"] = company
+
+    description = _first(page, DESCRIPTION)
+    if description is not None:
+        details["description"] = _clean(description.get_text())
+
+    salary = _first(page, BASE_SALARY)
+    if salary is not None and _clean(salary.get_text()):
+        details["salary"] = _clean(salary.get_text())
+
+    return {key: value for key, value in details.items() if value}
+
+def parse_job_posting(markup: str, page=None) -> Dict:
+    """
+    Read posting details from a job detail page
+
+    JSON-LD values take precedence; microdata fills in what they lack.
+
+    Args:
+        markup (str): Detail page markup
+        page (Node, optional): The already parsed page
+
+    Returns:
+        Dict: Any of company, description and salary that the page provides
+    """
+    page = page or parse_html(markup)
+
+    details = {}
+    for script in page.select(LD_JSON):
+        try:
+            data = json.loads(script.get_text())
+        except ValueError:
+            continue
+        for posting in _job_postings(data):
+            for key, value in _from_json_ld(posting).items():
+                details.setdefault(key, value)
+
+    for key, value in _from_microdata(page).items():
+        details.setdefault(key, value)
+    return details
+
+def merge_details(job, details: Dict):
+    """
+    Fill posting details into a search result
+
+    A missing or placeholder company and a missing salary are filled in,
+    and the description is replaced when the detail page's is longer.
+
+    Args:
+        job (Job): Search result, updated in place
+        details (Dict): Fields from parse_job_posting
+    """
+    if details.get("company") and job.get("company") in (None, "", PLACEHOLDER_COMPANY):
+        job["company"] = details["company"]
+    if details.get("salary") and not job.get("salary"):
+        job["salary"] = details["salary"]
+    if len(details.get("description") or "") > len(job.get("description") or ""):
+        job["description"] = details["description"]
@@ -0,0 +1,287 @@
+"""
+Pluggable HTML parsing backends for the scrapers.
+
+Scrapers describe the elements they need with precompiled `Selector`s and
+parse pages with `parse_html`, which uses the fastest available engine:
+selectolax (optional), lxml, or BeautifulSoup's html.parser as the
+fallback. Pages a fast engine can't parse are retried with BeautifulSoup.
+Each engine's library is imported when it first parses a page, so choosing
+a backend doesn't load any of them.
+"""
+
+import logging
+import re
+from abc import ABC, abstractmethod
+from importlib.util import find_spec
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# A tag and/or one class, id or [attribute=value] condition
+_SELECTOR_PATTERN = re.compile(
+    r'(?P<tag>[\w-]+)?'
+    r'(?:\.(?P<class_name>[\w-]+)|#(?P<id>[\w-]+)'
+    r'|\[(?P<attr>[\w:-]+)=(?P<quote>["\']?)(?P<value>[^"\'\]]+)(?P=quote)\])?'
+)
+
+class Selector:
+    """
+    A simple CSS selector compiled once per backend
+
+    Supports "tag", ".class", "tag.class", "tag#id" and "tag[attr=value]".
+    Matches descendants like BeautifulSoup's find_all(tag, class_=...).
+    """
+
+    __slots__ = ("css", "tag", "class_name", "attr", "_compiled")
+
+    def __init__(self, css: str):
+        """
+        Args:
+            css (str): Selector such as "article.action-buttons"
+        """
+        match = _SELECTOR_PATTERN.fullmatch(css)
+        if not match or not css:
+            raise ValueError(f"Unsupported selector: {css!r}")
+        self.css = css
+        self.tag = match.group("tag")
+        self.class_name = match.group("class_name")
+        # (name, value) of an attribute condition, ids included
+        if match.group("id"):
+            self.attr = ("id", match.group("id"))
+        elif match.group("attr"):
+            self.attr = (match.group("attr"), match.group("value"))
+        else:
+            self.attr = None
+        self._compiled = {}
+
+    def compiled(self, backend: "ParserBackend"):
+        """The selector in the backend's own precompiled form"""
+        compiled = self._compiled.get(backend.name)
+        if compiled is None:
+            compiled = self._compiled[backend.name] = backend.compile(self)
+        return compiled
+
+    def __repr__(self):
+        return f"Selector({self.css!r})"
+
+class Node:
+    """Backend-independent view of a parsed element"""
+
+    __slots__ = ("_backend", "_node")
+
+    def __init__(self, backend: "ParserBackend", node):
+        self._backend = backend
+        self._node = node
+
+    def select(self, selector: Selector) -> List["Node"]:
+        """All matching descendants in document order"""
+        backend = self._backend
+        return [Node(backend, node) for node in backend.select(self._node, selector)]
+
+    def select_one(self, selector: Selector) -> Optional["Node"]:
+        """The first matching descendant, or None"""
+        node = self._backend.select_one(self._node, selector)
+        return None if node is None else Node(self._backend, node)
+
+    def get_text(self) -> str:
+        """Text of the element and all its descendants"""
+        return self._backend.text(self._node)
+
+    def get(self, name: str, default=None):
+        """Attribute value, or `default` if missing"""
+        value = self._backend.attr(self._node, name)
+        return default if value is None else value
+
+    def __getitem__(self, name: str) -> str:
+        value = self._backend.attr(self._node, name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+class ParserBackend(ABC):
+    """Interface implemented by each parsing engine"""
+
+    name = None
+
+    @abstractmethod
+    def parse(self, html: str):
+        """Parse a page into the engine's document root"""
+        pass
+
+    @abstractmethod
+    def compile(self, selector: Selector):
+        """Precompile a selector for select() and select_one()"""
+        pass
+
+    @abstractmethod
+    def select(self, node, selector: Selector) -> list:
+        """All descendants of `node` matching the selector"""
+        pass
+
+    @abstractmethod
+    def select_one(self, node, selector: Selector):
+        """The first matching descendant, or None"""
+        pass
+
+    @abstractmethod
+    def text(self, node) -> str:
+        """Text of the element and all its descendants"""
+        pass
+
+    @abstractmethod
+    def attr(self, node, name: str) -> Optional[str]:
+        """Attribute value, or None if missing"""
+        pass
+
+class BeautifulSoupBackend(ParserBackend):
+    """The original BeautifulSoup html.parser path"""
+
+    name = "bs4"
+
+    def parse(self, html):
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(html, "html.parser")
+
+    def compile(self, selector):
+        kwargs = {}
+        if selector.class_name:
+            kwargs["class_"] = selector.class_name
+        if selector.attr:
+            kwargs["attrs"] = dict([selector.attr])
+        return selector.tag, kwargs
+
+    def select(self, node, selector):
+        tag, kwargs = selector.compiled(self)
+        return node.find_all(tag, **kwargs)
+
+    def select_one(self, node, selector):
+        tag, kwargs = selector.compiled(self)
+        return node.find(tag, **kwargs)
+
+    def text(self, node):
+        return node.get_text()
+
+    def attr(self, node, name):
+        return node.get(name)
+
+class LxmlBackend(ParserBackend):
+    """libxml2 parsing with selectors precompiled to XPath"""
+
+    name = "lxml"
+
+    def parse(self, html):
+        import lxml.html
+        return lxml.html.document_fromstring(html)
+
+    def compile(self, selector):
+        from lxml import etree
+        condition = ""
+        if selector.class_name:
+            condition = (
+                "[contains(concat(' ', normalize-space(@class), ' '), "
+                f"' {selector.class_name} ')]"
+            )
+        elif selector.attr:
+            name, value = selector.attr
+            condition = f"[@{name}='{value}']"
+        path = f"descendant::{selector.tag or '*'}{condition}"
+        return etree.XPath(path), etree.XPath(f"({path})[1]")
+
+    def select(self, node, selector):
+        return selector.compiled(self)[0](node)
+
+    def select_one(self, node, selector):
+        matches = selector.compiled(self)[1](node)
+        return matches[0] if matches else None
+
+    def text(self, node):
+        return str(node.text_content())
+
+    def attr(self, node, name):
+        return node.get(name)
+
+class SelectolaxBackend(ParserBackend):
+    """Lexbor-based parsing via the optional selectolax package"""
+
+    name = "selectolax"
+
+    def parse(self, html):
+        from selectolax.parser import HTMLParser
+        return HTMLParser(html)
+
+    def compile(self, selector):
+        if selector.attr:
+            name, value = selector.attr
+            return f'{selector.tag or ""}[{name}="{value}"]'
+        return selector.css
+
+    def select(self, node, selector):
+        return node.css(selector.compiled(self))
+
+    def select_one(self, node, selector):
+        return node.css_first(selector.compiled(self))
+
+    def text(self, node):
+        return node.text(deep=True)
+
+    def attr(self, node, name):
+        return node.attributes.get(name)
+
+# Installed engines, found without importing them
+BACKENDS: Dict[str, ParserBackend] = {"bs4": BeautifulSoupBackend()}
+if find_spec("lxml") is not None:
+    BACKENDS["lxml"] = LxmlBackend()
+if find_spec("selectolax") is not None:
+    BACKENDS["selectolax"] = SelectolaxBackend()
+
+# Preference order for "auto"
+FAST_BACKENDS = ("selectolax", "lxml")
+
+def resolve_backend(name: Optional[str] = "auto") -> ParserBackend:
+    """
+    Get a parsing backend by name
+
+    Args:
+        name (str, optional): "auto", "selectolax", "lxml" or "bs4"
+
+    Returns:
+        ParserBackend: The backend; unavailable engines fall back to "auto"
+    """
+    if name and name != "auto":
+        if name in BACKENDS:
+            return BACKENDS[name]
+        logger.warning(f"HTML parser '{name}' is not installed, choosing automatically")
+    for fast_name in FAST_BACKENDS:
+        if fast_name in BACKENDS:
+            return BACKENDS[fast_name]
+    return BACKENDS["bs4"]
+
+# Backend used by parse_html, set from the `search.parser` config option
+html_backend = resolve_backend()
+
+def configure_parser(name: Optional[str] = "auto") -> ParserBackend:
+    """Select the backend used by parse_html"""
+    global html_backend
+    html_backend = resolve_backend(name)
+    return html_backend
+
+def parse_html(html: str, backend: Optional[str] = None) -> Node:
+    """
+    Parse an HTML page
+
+    Args:
+        html (str): Page markup
+        backend (str, optional): Backend name overriding the configured one
+
+    Returns:
+        Node: The document root
+    """
+    engine = resolve_backend(backend) if backend else html_backend
+    if engine.name != "bs4":
+        try:
+            return Node(engine, engine.parse(html))
+        except Exception as e:
+            # e.g. empty pages or strings with an encoding declaration
+            logger.debug(f"{engine.name} could not parse page ({e}), using BeautifulSoup")
+    fallback = BACKENDS["bs4"]
+    return Node(fallback, fallback.parse(html))
@@ -0,0 +1,283 @@
+"""
+Persistent HTTP response cache for scraper sessions.
+
+Responses are stored in SQLite keyed by the full request URL (including query
+parameters). Fresh entries are served from disk, stale entries are revalidated
+with ETag/Last-Modified, and the least recently used entries are evicted once
+the cache grows past its size limit. Requests carrying credentials and
+responses that vary on every request (`Vary: *`) are never cached.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from requests.adapters import HTTPAdapter
+from requests.models import Request, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+class HTTPCache:
+    """SQLite-backed response store with TTL and size-bounded LRU eviction"""
+
+    def __init__(self, path: str, ttl: float = 900, max_size: int = 64 * 1024 * 1024):
+        """
+        Args:
+            path (str): SQLite database file
+            ttl (float): Seconds a response is served without revalidation
+            max_size (int): Maximum total size of stored bodies in bytes
+        """
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_size = max_size
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a stored response and mark it as recently used
+
+        Returns:
+            dict: Stored entry with status, headers, body, etag, last_modified,
+                stored_at and fresh keys, or None if not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key)
+            )
+            self._conn.commit()
+
+        status, headers, body, etag, last_modified, stored_at = row
+        return {
+            "status": status,
+            "headers": json.loads(headers),
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": stored_at,
+            "fresh": time.time() - stored_at < self.ttl
+        }
+
+    def is_fresh(self, key: str) -> bool:
+        """
+        Whether a response is stored and still within the TTL
+
+        Read-only: unlike get(), it doesn't mark the entry as used, so a
+        check before the actual fetch costs no write.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+        return row is not None and time.time() - row[0] < self.ttl
+
+    def set(self, key: str, status: int, headers: Dict, body: bytes):
+        """Store a response, evicting old entries if the cache is too large"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, status, headers, body, etag, last_modified, stored_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    status,
+                    json.dumps(dict(headers)),
+                    body,
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    now,
+                    now,
+                    len(body)
+                )
+            )
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, key: str):
+        """Mark an entry as fresh again after a 304 Not Modified"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """Remove every stored response"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def size(self) -> int:
+        """Total size of stored bodies in bytes"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def _evict(self):
+        """Delete least recently used entries until under max_size (lock held)"""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        evicted = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} cached responses")
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that serves GET requests through an HTTPCache"""
+
+    def __init__(self, cache: HTTPCache, **kwargs):
+        """
+        Args:
+            cache (HTTPCache): Response store shared between sessions
+            **kwargs: Passed to HTTPAdapter (e.g. max_retries)
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        """Send a request, answering from the cache where possible"""
+        # A response to an authenticated request may be private to its caller
+        if request.method != "GET" or "Authorization" in request.headers:
+            return super().send(request, **kwargs)
+
+        key = request.url
+        entry = self.cache.get(key)
+        if entry and entry["fresh"]:
+            return self._build_response(request, entry)
+
+        # Revalidate stale entries instead of downloading them again
+        if entry:
+            if entry["etag"]:
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.cache.refresh(key)
+            return self._build_response(request, entry)
+
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        vary = response.headers.get("Vary", "")
+        if (response.status_code == 200 and "no-store" not in cache_control
+                and vary.strip() != "*"):
+            self.cache.set(key, response.status_code, response.headers, response.content)
+
+        return response
+
+    def _build_response(self, request, entry: Dict) -> Response:
+        """Rebuild a requests Response from a cache entry"""
+        response = Response()
+        response.status_code = entry["status"]
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry["body"]
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        return response
+
+# Shared cache, created by configure_http_cache when caching is enabled
+http_cache = None
+
+def configure_http_cache(settings: Optional[Dict]) -> Optional[HTTPCache]:
+    """
+    Create or update the shared cache from the `search.cache` config section
+
+    Args:
+        settings (dict, optional): Keys enabled, path, ttl (seconds), max_size_mb
+
+    Returns:
+        HTTPCache: The shared cache, or None if caching is disabled
+    """
+    global http_cache
+
+    if not settings or not settings.get("enabled", True):
+        http_cache = None
+        return None
+
+    path = settings.get("path", "outputs/http_cache.db")
+    ttl = settings.get("ttl", 900)
+    max_size = int(settings.get("max_size_mb", 64) * 1024 * 1024)
+
+    if http_cache is not None and http_cache.path == str(path):
+        http_cache.ttl = ttl
+        http_cache.max_size = max_size
+    else:
+        http_cache = HTTPCache(path, ttl=ttl, max_size=max_size)
+    return http_cache
+
+def is_cached(url: str, params: Optional[Dict] = None) -> bool:
+    """Check whether a GET would be answered from the cache without a request"""
+    if http_cache is None:
+        return False
+    return http_cache.is_fresh(Request("GET", url, params=params).prepare().url)
+
+def mount_http_cache(session, max_retries=0):
+    """
+    Route a session's requests through the shared cache, if one is configured
+
+    Args:
+        session (requests.Session): Session to mount the caching adapter on
+        max_retries: Retry configuration for the adapter (int or urllib3 Retry)
+    """
+    if http_cache is None:
+        return session
+
+    adapter = CachingAdapter(http_cache, max_retries=max_retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -10,6 +10,9 @@ import requests
 from urllib.parse import urljoin
 
 from .base import BaseScraper
+from .job import Job
+from .http_cache import mount_http_cache
+from .metrics import instrument_session
 
 class IndeedScraper(BaseScraper):
     """Scraper for Indeed.ca using official API"""
@@ -46,6 +49,8 @@ class IndeedScraper(BaseScraper):
             
         # Initialize session
         self.session = requests.Session()
+        mount_http_cache(self.session)
+        instrument_session(self.session)
         self.access_token = None
         self.token_expires_at = None
         
@@ -67,6 +72,7 @@ class IndeedScraper(BaseScraper):
             client_id = str(self.client_id) if self.client_id else ""
             client_secret = str(self.client_secret) if self.client_secret else ""
             
+            self.rate_limiter.acquire(self.API_BASE_URL)
             response = self.session.post(
                 f"{self.API_BASE_URL}/tokens",
                 auth=(client_id, client_secret),
@@ -121,6 +127,7 @@ class IndeedScraper(BaseScraper):
                     params['radius'] = radius
                 
                 # Make API request
+                self.rate_limiter.acquire(self.SEARCH_API_URL)
                 response = self.session.get(
                     self.SEARCH_API_URL,
                     params=params,
@@ -139,16 +146,16 @@ class IndeedScraper(BaseScraper):
                 # Process jobs
                 for result in results:
                     try:
-                        job = {
-                            'title': result['jobtitle'],
-                            'company': result['company'],
-                            'location': result['formattedLocation'],
-                            'url': result['url'],
-                            'type': 'job',  # Indeed listings are typically jobs
-                            'source': 'Indeed',
-                            'description': result.get('snippet', ''),
-                            'posted_date': self._parse_date(result['date'])
-                        }
+                        job = Job(
+                            title=result['jobtitle'],
+                            company=result['company'],
+                            location=result['formattedLocation'],
+                            url=result['url'],
+                            type='job',  # Indeed listings are typically jobs
+                            source='Indeed',
+                            description=result.get('snippet', ''),
+                            posted_date=self._parse_date(result['date'])
+                        )
                         
                         # Add salary if available
                         if result.get('salary'):
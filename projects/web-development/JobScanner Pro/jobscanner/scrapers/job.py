@@ -0,0 +1,113 @@
+"""
+Compact job posting records.
+
+Scrapers emit `Job` records instead of plain dicts. A `Job` stores the
+standard posting fields in slots and behaves like a dict, so existing code
+using job["title"], job.get("salary") or "url" in job keeps working.
+"""
+
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, Optional, Union
+
+class Job(MutableMapping):
+    """
+    A single job posting stored in slots with a dict-compatible interface
+
+    Standard fields live in slots; an unset slot behaves like a missing
+    dict key. Any other keys (e.g. parsed_salary, match_score) go into a
+    small overflow dict created on first use. The private `_remote` slot
+    caches the remote check of core.filters and is reset whenever a
+    standard field changes; it is not part of the record.
+    """
+
+    FIELDS = (
+        "title", "company", "location", "url", "type", "source",
+        "salary", "posted_date", "description", "category", "id"
+    )
+
+    __slots__ = FIELDS + ("_extra", "_remote")
+
+    _FIELD_SET = frozenset(FIELDS)
+
+    def __init__(self, data: Optional[Dict] = None, **fields):
+        """
+        Args:
+            data (Dict, optional): Initial fields, e.g. a scraped job dict
+            **fields: More fields, overriding `data`
+        """
+        self._extra = None
+        self._remote = None
+        if data:
+            for key, value in data.items():
+                self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Union[Dict, "Job"]) -> "Job":
+        """Return `data` as a Job, converting plain dicts"""
+        return data if isinstance(data, cls) else cls(data)
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+            self._remote = None
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            self._remote = None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        count = sum(1 for key in self.FIELDS if hasattr(self, key))
+        return count + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key) -> bool:
+        if key in self._FIELD_SET:
+            return hasattr(self, key)
+        return bool(self._extra) and key in self._extra
+
+    def get(self, key, default=None):
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def copy(self) -> "Job":
+        return Job(self)
+
+    def to_dict(self) -> Dict:
+        """Plain dict copy of the posting"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"Job({self.to_dict()!r})"
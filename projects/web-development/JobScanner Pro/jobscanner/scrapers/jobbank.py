@@ -3,27 +3,45 @@ Canada Job Bank scraper implementation.
 """
 
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import re
-from urllib.parse import urljoin, urlencode
-import time
+from urllib.parse import urljoin, urlencode, urlparse
+import asyncio
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
-from .base import BaseScraper
+from .async_base import AsyncBaseScraper
+from .html_parser import Selector, parse_html
+from .http_cache import mount_http_cache
+from .metrics import instrument_session, observe_parse, retries_total
+from .job import Job
 
-class JobBankScraper(BaseScraper):
+class JobBankScraper(AsyncBaseScraper):
     """Scraper for jobbank.gc.ca"""
     
     BASE_URL = "https://www.jobbank.gc.ca"
     SEARCH_URL = f"{BASE_URL}/jobsearch"
     
     # Rate limiting settings
-    REQUEST_DELAY = 2  # Delay between requests in seconds
+    MAX_CONCURRENCY = 2  # Requests in flight at once
+    MAX_PAGES = 5      # Stop after 5 pages to avoid excessive requests
+    RESULTS_PER_PAGE = 25  # Postings on a full search results page
     MAX_RETRIES = 3    # Maximum number of retries for failed requests
     RETRY_DELAY = 5    # Delay between retries in seconds
     
+    # Search result page selectors
+    NO_RESULTS = Selector("div.no-results")
+    RESULTS_COUNT = Selector("span.found")
+    RESULT = Selector("article.action-buttons")
+    TITLE = Selector("span.noctitle")
+    COMPANY = Selector("li.business")
+    LOCATION = Selector("li.location")
+    JOB_LINK = Selector("a.resultJobItem")
+    SUMMER_JOB_ICON = Selector("span.job-source-icon-21")
+    SALARY = Selector("li.salary")
+    DATE = Selector("li.date")
+    SUMMARY = Selector("p.summary")
+    
     def __init__(self):
         """Initialize Job Bank scraper with retry mechanism"""
         super().__init__()
@@ -40,6 +58,8 @@ class JobBankScraper(BaseScraper):
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        mount_http_cache(self.session, max_retries=retry_strategy)
+        instrument_session(self.session)
         
         # Set headers
         self.session.headers.update({
@@ -49,7 +69,7 @@ class JobBankScraper(BaseScraper):
             "DNT": "1"
         })
     
-    def search(self, query, location, radius=None):
+    async def asearch(self, query, location, radius=None, is_known=None):
         """
         Search jobbank.gc.ca for jobs including Canada Summer Jobs
         
@@ -57,26 +77,36 @@ class JobBankScraper(BaseScraper):
             query (str): Search query
             location (str): Location to search in
             radius (int, optional): Search radius in km
+            is_known (callable, optional): Returns True for stored posting URLs;
+                enables incremental (newest-first) pagination
             
         Returns:
             list: List of job dictionaries
         """
-        jobs = []
-        
-        # Search regular jobs
-        regular_jobs = self._search_jobs(query, location, radius, job_type="regular")
-        jobs.extend(regular_jobs)
-        
-        # Search Canada Summer Jobs (youth jobs)
-        youth_jobs = self._search_jobs(query, location, radius, job_type="youth")
-        jobs.extend(youth_jobs)
+        # Search regular jobs and Canada Summer Jobs (youth jobs) concurrently
+        if is_known:
+            searches = [
+                self._search_new_jobs(query, location, radius, job_type, is_known)
+                for job_type in ("regular", "youth")
+            ]
+        else:
+            searches = [
+                self._search_jobs(query, location, radius, job_type=job_type)
+                for job_type in ("regular", "youth")
+            ]
+        regular_jobs, youth_jobs = await asyncio.gather(*searches)
         
+        jobs = regular_jobs + youth_jobs
         self.logger.info(f"Total jobs found: {len(jobs)} (regular: {len(regular_jobs)}, youth: {len(youth_jobs)})")
         return jobs
     
-    def _search_jobs(self, query, location, radius=None, job_type="regular"):
+    async def _search_jobs(self, query, location, radius=None, job_type="regular"):
         """
-        Search for jobs of a specific type
+        Search for jobs of a specific type in two round-trips
+        
+        The first page tells how many results there are; the remaining
+        pages are then fetched concurrently, so only pages that exist are
+        requested.
         
         Args:
             query (str): Search query
@@ -87,137 +117,218 @@ class JobBankScraper(BaseScraper):
         Returns:
             list: List of job dictionaries
         """
-        jobs = []
-        page = 1
+        jobs, total = await self._fetch_page(query, location, radius, job_type, 1)
+        if not jobs:
+            return []
+        self._emit_page(jobs)
+        
+        last_page = self._last_page(total)
+        pages = [
+            asyncio.ensure_future(self._fetch_page(query, location, radius, job_type, page))
+            for page in range(2, last_page + 1)
+        ]
+        
+        # Take pages in order as they complete, stopping where a sequential
+        # walk would have; each accepted page is streamed right away
         consecutive_empty_pages = 0
+        try:
+            for page in pages:
+                page_jobs, _ = await page
+                if page_jobs is None:  # Request failed
+                    break
+                if not page_jobs:
+                    consecutive_empty_pages += 1
+                    if consecutive_empty_pages >= 2:  # Stop if 2 empty pages in a row
+                        self.logger.info("No more results found")
+                        break
+                else:
+                    consecutive_empty_pages = 0
+                    jobs.extend(page_jobs)
+                    self._emit_page(page_jobs)
+        finally:
+            # Pages past the stopping point are no longer needed
+            for page in pages:
+                page.cancel()
         
-        while True:
-            # Construct search URL with parameters
-            params = {
-                "searchstring": query,
-                "location": location,
-                "page": page,
-                "sort": "M"  # Sort by match
-            }
+        return jobs
+    
+    def _last_page(self, total):
+        """
+        Last page worth fetching for a search with `total` results
+        
+        Args:
+            total (int, optional): Result count from the first page
             
-            # Add youth-specific parameter for Canada Summer Jobs
-            if job_type == "youth":
-                params["fsrc"] = "21"  # Filter for Canada Summer Jobs
+        Returns:
+            int: Page number, at most MAX_PAGES (MAX_PAGES if unknown)
+        """
+        if total is None:
+            return self.MAX_PAGES
+        pages = -(-total // self.RESULTS_PER_PAGE)  # Round up
+        return max(1, min(pages, self.MAX_PAGES))
+    
+    async def _search_new_jobs(self, query, location, radius, job_type, is_known):
+        """
+        Search newest-first, stopping at the first page with a known posting
+        
+        Every later page only holds older postings, so an incremental search
+        usually costs a single page per job type.
+        
+        Args:
+            query (str): Search query
+            location (str): Location to search in  
+            radius (int, optional): Search radius in km
+            job_type (str): Type of jobs to search ("regular" or "youth")
+            is_known (callable): Returns True for stored posting URLs
             
-            if radius:
-                params["distance"] = min(radius, 100)  # Cap at 100km
+        Returns:
+            list: List of job dictionaries not yet stored
+        """
+        jobs = []
+        for page in range(1, self.MAX_PAGES + 1):
+            page_jobs, _ = await self._fetch_page(query, location, radius, job_type, page, sort="D")
+            if not page_jobs:
+                break
             
+            new_jobs = [job for job in page_jobs if not is_known(job["url"])]
+            jobs.extend(new_jobs)
+            self._emit_page(new_jobs)
+            if len(new_jobs) < len(page_jobs):
+                self.logger.info(f"Reached previously seen postings on page {page}")
+                break
+        
+        return jobs
+    
+    async def _fetch_page(self, query, location, radius, job_type, page, sort="M"):
+        """
+        Fetch and parse a single search results page
+        
+        Args:
+            sort (str): "M" to sort by match, "D" to sort by date (newest first)
+        
+        Returns:
+            tuple: (jobs on the page, total result count or None if not
+                shown); jobs is None if the page could not be fetched
+        """
+        # Construct search URL with parameters
+        params = {
+            "searchstring": query,
+            "location": location,
+            "page": page,
+            "sort": sort
+        }
+        
+        # Add youth-specific parameter for Canada Summer Jobs
+        if job_type == "youth":
+            params["fsrc"] = "21"  # Filter for Canada Summer Jobs
+        
+        if radius:
+            params["distance"] = min(radius, 100)  # Cap at 100km
+        
+        while True:
             try:
-                # Respect rate limiting
-                time.sleep(self.REQUEST_DELAY)
-                
                 # Get search results page
                 self.logger.info(f"Fetching page {page} for query '{query}' in {location}")
-                response = self.session.get(
-                    self.SEARCH_URL,
-                    params=params,
-                    timeout=30
-                )
-                response.raise_for_status()
+                response = await self._fetch(self.SEARCH_URL, params=params)
                 
                 # Parse jobs from page
-                page_jobs = self._parse_search_page(response.text)
-                
-                if not page_jobs:
-                    consecutive_empty_pages += 1
-                    if consecutive_empty_pages >= 2:  # Stop if 2 empty pages in a row
-                        self.logger.info("No more results found")
-                        break
-                else:
-                    consecutive_empty_pages = 0
-                    jobs.extend(page_jobs)
+                page_jobs, total = self._parse_results(response.text)
                 
                 # Log progress
                 job_type_label = "Canada Summer Jobs" if job_type == "youth" else "regular jobs"
                 self.logger.info(f"Found {len(page_jobs)} {job_type_label} on page {page}")
-                
-                page += 1
-                
-                # Stop after 5 pages to avoid excessive requests
-                if page > 5:
-                    self.logger.info("Reached maximum page limit")
-                    break
+                return page_jobs, total
                     
             except requests.exceptions.RequestException as e:
                 self.logger.error(f"Network error on page {page}: {str(e)}")
                 if "Too Many Requests" in str(e):
                     self.logger.warning("Rate limit hit, waiting longer...")
-                    time.sleep(self.RETRY_DELAY * 2)
+                    retries_total.inc(host=urlparse(self.SEARCH_URL).netloc, reason="429")
+                    self.rate_limiter.penalize(self.SEARCH_URL, self.RETRY_DELAY * 2)
                     continue
-                break
+                return None, None
                 
             except Exception as e:
                 self.logger.error(f"Unexpected error on page {page}: {str(e)}")
-                break
-        
-        return jobs
+                return None, None
     
     def _parse_search_page(self, html):
         """Parse jobs from a search results page"""
-        soup = BeautifulSoup(html, "html.parser")
+        return self._parse_results(html)[0]
+    
+    @observe_parse
+    def _parse_results(self, html):
+        """
+        Parse jobs and the total result count from a search results page
+        
+        Returns:
+            tuple: (list of jobs, total result count or None if not shown)
+        """
+        page = parse_html(html)
         jobs = []
         
         # Check for no results message
-        no_results = soup.find("div", class_="no-results")
+        no_results = page.select_one(self.NO_RESULTS)
         if no_results:
-            return jobs
+            return jobs, 0
+        
+        total = None
+        count_elem = page.select_one(self.RESULTS_COUNT)
+        if count_elem:
+            digits = re.sub(r"\D", "", count_elem.get_text())
+            total = int(digits) if digits else None
         
         # Find all job result containers
-        results = soup.find_all("article", class_="action-buttons")
+        results = page.select(self.RESULT)
         if not results:
             self.logger.warning("No job results found on page")
-            return jobs
+            return jobs, total
         
         for result in results:
             try:
                 # Get basic job info
-                title_elem = result.find("span", class_="noctitle")
-                company_elem = result.find("li", class_="business")
-                location_elem = result.find("li", class_="location")
+                title_elem = result.select_one(self.TITLE)
+                company_elem = result.select_one(self.COMPANY)
+                location_elem = result.select_one(self.LOCATION)
                 
                 if not all([title_elem, company_elem, location_elem]):
                     continue
                 
                 # Build job URL
-                job_path = result.find("a", class_="resultJobItem")
+                job_path = result.select_one(self.JOB_LINK)
                 if not job_path or not job_path.get("href"):
                     continue
                     
                 job_url = urljoin(self.BASE_URL, job_path["href"])
                 
                 # Detect if this is a Canada Summer Job
-                source_elem = result.find("span", class_="job-source-icon-21")
+                source_elem = result.select_one(self.SUMMER_JOB_ICON)
                 job_source = "Canada Summer Jobs" if source_elem else "Job Bank"
                 
                 # Create job object
-                job = {
-                    "title": self._clean_text(title_elem.get_text()),
-                    "company": self._clean_text(company_elem.get_text()),
-                    "location": self._clean_text(location_elem.get_text()),
-                    "url": job_url,
-                    "type": "job",  # Job Bank listings are formal jobs
-                    "source": job_source
-                }
+                job = Job(
+                    title=self._clean_text(title_elem.get_text()),
+                    company=self._clean_text(company_elem.get_text()),
+                    location=self._clean_text(location_elem.get_text()),
+                    url=job_url,
+                    type="job",  # Job Bank listings are formal jobs
+                    source=job_source
+                )
                 
                 # Get salary if available
-                salary_elem = result.find("li", class_="salary")
+                salary_elem = result.select_one(self.SALARY)
                 if salary_elem:
                     job["salary"] = self._clean_text(salary_elem.get_text())
                 
                 # Get posting date
-                date_elem = result.find("li", class_="date")
+                date_elem = result.select_one(self.DATE)
                 if date_elem:
                     parsed_date = self._parse_date(date_elem.get_text())
                     if parsed_date:
                         job["posted_date"] = parsed_date.strftime("%Y-%m-%d")
                 
                 # Get job description snippet
-                desc_elem = result.find("p", class_="summary")
+                desc_elem = result.select_one(self.SUMMARY)
                 if desc_elem:
                     job["description"] = self._clean_text(desc_elem.get_text())
                 
@@ -229,7 +340,7 @@ class JobBankScraper(BaseScraper):
                 self.logger.error(f"Error parsing job result: {str(e)}")
                 continue
                 
-        return jobs
+        return jobs, total
     
     def _parse_date(self, date_str):
         """Parse Job Bank date strings"""
@@ -4,16 +4,20 @@ Handles both services/gigs and job listings.
 """
 
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import re
 from urllib.parse import urljoin, urlencode
-import time
+import asyncio
 import json
 
-from .base import BaseScraper
+from .async_base import AsyncBaseScraper
+from .details import PLACEHOLDER_COMPANY
+from .html_parser import Selector, parse_html
+from .http_cache import mount_http_cache
+from .metrics import instrument_session, observe_parse
+from .job import Job
 
-class KijijiScraper(BaseScraper):
+class KijijiScraper(AsyncBaseScraper):
     """Scraper for Kijiji.ca"""
     
     BASE_URL = "https://www.kijiji.ca"
@@ -40,6 +44,15 @@ class KijijiScraper(BaseScraper):
         "web-design": "c78"
     }
     
+    # Search result page selectors
+    LISTING = Selector("div.search-item")
+    TITLE = Selector("a.title")
+    LOCATION = Selector("div.location")
+    DATE = Selector("span.date-posted")
+    PRICE = Selector("div.price")
+    DESCRIPTION = Selector("div.description")
+    BUSINESS = Selector("div.business")
+    
     def __init__(self):
         """Initialize Kijiji scraper"""
         super().__init__()
@@ -49,8 +62,10 @@ class KijijiScraper(BaseScraper):
             "Accept-Language": "en-CA,en;q=0.9",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"
         })
+        mount_http_cache(self.session)
+        instrument_session(self.session)
     
-    def search(self, query, location, radius=None):
+    async def asearch(self, query, location, radius=None, is_known=None):
         """
         Search Kijiji for jobs and services/gigs
         
@@ -58,36 +73,40 @@ class KijijiScraper(BaseScraper):
             query (str): Search query
             location (str): Location to search in
             radius (int, optional): Search radius in km
+            is_known (callable, optional): Unused; each category is a single
+                page, so known postings are dropped by JobSearch
             
         Returns:
             list: List of job dictionaries
         """
         jobs = []
         location_id = self._get_location_id(location)
+        seen = set()  # Listings often appear in several categories
         
         try:
-            # Search jobs section
-            jobs.extend(self._search_section(
-                self.JOBS_URL,
-                query,
-                location_id,
-                self.JOB_CATEGORIES,
-                "job",
-                radius
-            ))
-            
-            # Slight delay to avoid rate limiting
-            time.sleep(2)
-            
-            # Search services/gigs section
-            jobs.extend(self._search_section(
-                self.SERVICES_URL,
-                query,
-                location_id,
-                self.SERVICE_CATEGORIES,
-                "gig",
-                radius
-            ))
+            # Search jobs and services/gigs sections concurrently
+            sections = await asyncio.gather(
+                self._search_section(
+                    self.JOBS_URL,
+                    query,
+                    location_id,
+                    self.JOB_CATEGORIES,
+                    "job",
+                    radius,
+                    seen=seen
+                ),
+                self._search_section(
+                    self.SERVICES_URL,
+                    query,
+                    location_id,
+                    self.SERVICE_CATEGORIES,
+                    "gig",
+                    radius,
+                    seen=seen
+                )
+            )
+            for section_jobs in sections:
+                jobs.extend(section_jobs)
             
         except Exception as e:
             self.logger.error(f"Error during Kijiji search: {e}")
@@ -109,100 +128,116 @@ class KijijiScraper(BaseScraper):
         location_lower = location.lower().split(',')[0].strip()
         return location_map.get(location_lower, "1700272")  # Default to Brampton
     
-    def _search_section(self, base_url, query, location_id, categories, job_type, radius=None):
-        """Search a specific section (jobs or services) of Kijiji"""
-        results = []
+    async def _search_section(self, base_url, query, location_id, categories, job_type, radius=None, seen=None):
+        """
+        Search a specific section (jobs or services) of Kijiji
         
-        # Search each relevant category
-        for category_name, category_id in categories.items():
-            try:
-                # Construct search URL with parameters
-                params = {
-                    "keywords": query,
-                    "locationId": location_id,
-                    "dc": category_id,
-                    "sort": "dateDesc"
-                }
-                
-                if radius:
-                    params["radius"] = min(radius, 100)  # Kijiji max radius is 100km
-                
-                # Get search results
-                response = self.session.get(
-                    base_url,
-                    params=params,
-                    timeout=30
-                )
-                response.raise_for_status()
-                
-                # Parse results
-                page_results = self._parse_search_page(
-                    response.text,
-                    job_type,
-                    category_name
-                )
-                results.extend(page_results)
-                
-                # Slight delay between categories
-                time.sleep(1)
-                
-            except Exception as e:
-                self.logger.error(
-                    f"Error searching category {category_name}: {e}"
-                )
-                continue
+        `seen` holds the URLs collected so far, shared between sections
+        (default: a new set for this section).
+        """
+        if seen is None:
+            seen = set()
         
+        # Search every relevant category concurrently
+        pages = await asyncio.gather(*(
+            self._search_category(base_url, query, location_id, category_name, category_id, job_type, seen, radius)
+            for category_name, category_id in categories.items()
+        ))
+        
+        results = []
+        for page_results in pages:
+            results.extend(page_results)
         return results
     
+    async def _search_category(self, base_url, query, location_id, category_name, category_id, job_type,
+                               seen, radius=None):
+        """
+        Search a single category of a section
+        
+        Listings already collected from another category (URLs in `seen`)
+        are dropped as soon as the page is parsed.
+        """
+        try:
+            # Construct search URL with parameters
+            params = {
+                "keywords": query,
+                "locationId": location_id,
+                "dc": category_id,
+                "sort": "dateDesc"
+            }
+            
+            if radius:
+                params["radius"] = min(radius, 100)  # Kijiji max radius is 100km
+            
+            # Get search results
+            response = await self._fetch(base_url, params=params)
+            
+            # Parse results
+            jobs = self._parse_search_page(
+                response.text,
+                job_type,
+                category_name
+            )
+            jobs = self._take_unseen(jobs, seen)
+            self._emit_page(jobs)
+            return jobs
+            
+        except Exception as e:
+            self.logger.error(
+                f"Error searching category {category_name}: {e}"
+            )
+            return []
+    
+    @observe_parse
     def _parse_search_page(self, html, job_type, category):
         """Parse jobs/gigs from a search results page"""
-        soup = BeautifulSoup(html, "html.parser")
+        page = parse_html(html)
         results = []
         
         # Find all listing containers
-        for listing in soup.find_all("div", class_="search-item"):
+        for listing in page.select(self.LISTING):
             try:
                 # Get title and URL
-                title_elem = listing.find("a", class_="title")
+                title_elem = listing.select_one(self.TITLE)
                 if not title_elem:
                     continue
                 
                 # Build job object
-                job = {
-                    "title": self._clean_text(title_elem.get_text()),
-                    "url": urljoin(self.BASE_URL, title_elem["href"]),
-                    "type": job_type,
-                    "category": category
-                }
+                job = Job(
+                    title=self._clean_text(title_elem.get_text()),
+                    url=urljoin(self.BASE_URL, title_elem["href"]),
+                    type=job_type,
+                    category=category
+                )
                 
                 # Get location
-                location_elem = listing.find("div", class_="location")
+                location_elem = listing.select_one(self.LOCATION)
                 if location_elem:
                     job["location"] = self._clean_text(location_elem.get_text())
                 else:
                     job["location"] = "Greater Toronto Area, ON"
                 
                 # Get date
-                date_elem = listing.find("span", class_="date-posted")
+                date_elem = listing.select_one(self.DATE)
                 if date_elem:
                     job["posted_date"] = self._parse_date(date_elem.get_text())
                 
                 # Get price/compensation if available
-                price_elem = listing.find("div", class_="price")
+                price_elem = listing.select_one(self.PRICE)
                 if price_elem:
                     price_text = self._clean_text(price_elem.get_text())
                     if price_text and price_text.lower() != "free":
                         job["salary"] = price_text
                 
                 # Get description snippet
-                desc_elem = listing.find("div", class_="description")
+                desc_elem = listing.select_one(self.DESCRIPTION)
                 if desc_elem:
                     job["description"] = self._clean_text(desc_elem.get_text())
                 
                 # Set company name based on context
                 if job_type == "job":
-                    company_elem = listing.find("div", class_="business")
-                    job["company"] = self._clean_text(company_elem.get_text()) if company_elem else "See posting for details"
+                    company_elem = listing.select_one(self.BUSINESS)
+                    job["company"] = self._clean_text(company_elem.get_text()) if company_elem else PLACEHOLDER_COMPANY
                 else:
                     job["company"] = "Independent / Gig"
                 
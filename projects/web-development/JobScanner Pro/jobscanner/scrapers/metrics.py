@@ -0,0 +1,267 @@
+"""
+Process-wide metrics for scrapers and searches.
+
+Counters and histograms are kept in memory with labels (host, scraper,
+stage, ...) and exported as JSON or in the Prometheus text format, e.g. by
+the polling daemon's metrics endpoint.
+"""
+
+import bisect
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+# Bucket upper bounds in seconds for request, parse and stage timings
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Bucket upper bounds for jobs parsed from one page
+JOBS_PER_PAGE_BUCKETS = (0, 5, 10, 25, 50, 100)
+
+def _label_key(labels: Dict[str, str]) -> Tuple:
+    """Hashable, ordered form of a label set"""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _format_labels(key: Tuple, extra: Optional[Tuple] = None) -> str:
+    """Prometheus label list, e.g. {host="www.kijiji.ca"}"""
+    pairs = key + (extra or ())
+    if not pairs:
+        return ""
+    escaped = (
+        name + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+class Counter:
+    """Monotonic count per label set"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        """Add `amount` to the count for the given labels"""
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """Current count for the given labels"""
+        return self._values.get(_label_key(labels), 0)
+
+    def to_dict(self) -> list:
+        with self._lock:
+            return [{"labels": dict(key), "value": value} for key, value in self._values.items()]
+
+    def prometheus_lines(self):
+        with self._lock:
+            for key, value in self._values.items():
+                yield f"{self.name}{_format_labels(key)} {value:g}"
+
+class Histogram:
+    """Distribution of observed values per label set, in fixed buckets"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # label key -> [bucket counts..., count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """Record one observation"""
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of a `with` block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        """Number of observations for the given labels"""
+        series = self._series.get(_label_key(labels))
+        return series[-2] if series else 0
+
+    def total(self, **labels) -> float:
+        """Sum of observations for the given labels"""
+        series = self._series.get(_label_key(labels))
+        return series[-1] if series else 0.0
+
+    def _cumulative(self, series):
+        """(upper bound, cumulative count) pairs ending with +Inf"""
+        running = 0
+        for bound, bucket_count in zip(self.buckets, series):
+            running += bucket_count
+            yield bound, running
+        yield float("inf"), series[-2]
+
+    def to_dict(self) -> list:
+        with self._lock:
+            return [
+                {
+                    "labels": dict(key),
+                    "count": series[-2],
+                    "sum": series[-1],
+                    "buckets": {
+                        ("+Inf" if bound == float("inf") else f"{bound:g}"): running
+                        for bound, running in self._cumulative(series)
+                    },
+                }
+                for key, series in self._series.items()
+            ]
+
+    def prometheus_lines(self):
+        with self._lock:
+            for key, series in self._series.items():
+                for bound, running in self._cumulative(series):
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    yield f"{self.name}_bucket{_format_labels(key, (('le', le),))} {running}"
+                yield f"{self.name}_count{_format_labels(key)} {series[-2]}"
+                yield f"{self.name}_sum{_format_labels(key)} {series[-1]:g}"
+
+class MetricsRegistry:
+    """Named metrics with JSON and Prometheus text export"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        """Get or create a counter"""
+        return self._register(Counter(name, help_text))
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        """Get or create a histogram"""
+        return self._register(Histogram(name, help_text, buckets))
+
+    def reset(self):
+        """Clear all recorded values, keeping the metrics"""
+        with self._lock:
+            for metric in self._metrics.values():
+                with metric._lock:
+                    if isinstance(metric, Counter):
+                        metric._values.clear()
+                    else:
+                        metric._series.clear()
+
+    def to_dict(self) -> Dict:
+        """All metrics as {name: {"type", "help", "values"}}"""
+        return {
+            name: {"type": metric.kind, "help": metric.help, "values": metric.to_dict()}
+            for name, metric in sorted(self._metrics.items())
+        }
+
+    def to_json(self) -> str:
+        """All metrics as a JSON document"""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.prometheus_lines())
+        return "\n".join(lines) + "\n"
+
+# Shared registry so every scraper and search in the process reports to one place
+metrics = MetricsRegistry()
+
+requests_total = metrics.counter(
+    "jobscanner_requests_total", "HTTP responses by host and status code")
+cache_hits_total = metrics.counter(
+    "jobscanner_cache_hits_total", "Responses served from the HTTP cache by host")
+request_seconds = metrics.histogram(
+    "jobscanner_request_seconds", "Time to response headers by host")
+response_bytes_total = metrics.counter(
+    "jobscanner_response_bytes_total", "Response body bytes downloaded by host")
+retries_total = metrics.counter(
+    "jobscanner_retries_total", "Requests retried by host and reason")
+parse_seconds = metrics.histogram(
+    "jobscanner_parse_seconds", "Time to parse one result page by scraper")
+jobs_per_page = metrics.histogram(
+    "jobscanner_jobs_per_page", "Jobs parsed from one result page by scraper", JOBS_PER_PAGE_BUCKETS)
+scraper_seconds = metrics.histogram(
+    "jobscanner_scraper_seconds", "Time for one scraper to finish a search")
+stage_seconds = metrics.histogram(
+    "jobscanner_stage_seconds", "Time spent in each search stage (store, filter, dedup, enrich)")
+
+def _body_size(response, stream: bool) -> int:
+    """Size of a response body, without reading a body left to stream"""
+    if response._content_consumed or not stream:
+        # requests reads unstreamed bodies right after the hooks anyway
+        return len(response.content or b"")
+    try:
+        return int(response.headers.get("Content-Length") or 0)
+    except ValueError:
+        return 0
+
+def _record_response(response, *args, **kwargs):
+    """requests response hook feeding the request metrics"""
+    host = urlparse(response.url).netloc
+    if getattr(response, "from_cache", False):
+        cache_hits_total.inc(host=host)
+        return
+    requests_total.inc(host=host, status=response.status_code)
+    request_seconds.observe(response.elapsed.total_seconds(), host=host)
+    response_bytes_total.inc(_body_size(response, kwargs.get("stream", False)), host=host)
+    # Attempts urllib3 retried before this response (e.g. Job Bank's 429/5xx policy)
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    for attempt in getattr(retries, "history", None) or ():
+        retries_total.inc(host=host, reason=str(attempt.status or "error"))
+
+def instrument_session(session):
+    """
+    Record request counts, latency and bytes for every response of a session
+
+    Args:
+        session (requests.Session): Session to instrument
+    """
+    hooks = session.hooks.setdefault("response", [])
+    if _record_response not in hooks:
+        hooks.append(_record_response)
+    return session
+
+def observe_parse(method):
+    """
+    Decorator recording parse time and jobs per page for a page parser
+
+    The parser may return a list of jobs or a tuple starting with one.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        result = method(self, *args, **kwargs)
+        scraper = self.__class__.__name__
+        parse_seconds.observe(time.perf_counter() - start, scraper=scraper)
+        jobs = result[0] if isinstance(result, tuple) else result
+        jobs_per_page.observe(len(jobs), scraper=scraper)
+        return result
+    return wrapper
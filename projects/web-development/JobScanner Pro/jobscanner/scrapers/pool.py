@@ -0,0 +1,128 @@
+"""
+Process-wide pool of scraper instances.
+
+Each scraper owns a requests.Session, so reusing scrapers across searches
+keeps warm keep-alive TCP/TLS connections and per-client state such as the
+Indeed OAuth token. Scrapers are keyed by platform and the config sections
+that affect them, so a config change builds fresh ones. Scraper modules are
+imported on first use, so disabled platforms cost nothing at startup.
+"""
+
+import importlib
+import json
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+def _lazy_factory(module: str, class_name: str, with_config: bool = False):
+    """Factory that imports the scraper's module when first called"""
+    def factory(config):
+        scraper_class = getattr(importlib.import_module(f".{module}", __package__), class_name)
+        return scraper_class(config=config) if with_config else scraper_class()
+    return factory
+
+# Platform name (as in search.platforms) -> factory taking the config
+PLATFORMS = {
+    "indeed": _lazy_factory("indeed", "IndeedScraper", with_config=True),  # Needs API credentials
+    "jobbank": _lazy_factory("jobbank", "JobBankScraper"),
+    "craigslist": _lazy_factory("craigslist", "CraigslistScraper"),
+    "kijiji": _lazy_factory("kijiji", "KijijiScraper"),
+}
+
+# Connections kept per host for scrapers without their own concurrency
+# limit; blocking scrapers issue one request at a time
+DEFAULT_POOL_SIZE = 2
+
+def size_connection_pools(session, maxsize: int):
+    """
+    Keep as many idle connections per host as requests can be in flight
+
+    Each transport adapter is replaced by a fresh one built with
+    `pool_maxsize`, keeping its retry settings and, for the caching
+    adapter, its cache.
+
+    Args:
+        session (requests.Session): Session whose adapters to resize
+        maxsize (int): Connections kept per host
+    """
+    from requests.adapters import HTTPAdapter
+    from .http_cache import CachingAdapter
+
+    # One replacement per adapter, mounted on every prefix it served
+    resized = {}
+    for prefix, adapter in list(session.adapters.items()):
+        if type(adapter) not in (HTTPAdapter, CachingAdapter):
+            continue
+        if id(adapter) not in resized:
+            options = {"pool_maxsize": maxsize, "max_retries": adapter.max_retries}
+            if isinstance(adapter, CachingAdapter):
+                resized[id(adapter)] = CachingAdapter(adapter.cache, **options)
+            else:
+                resized[id(adapter)] = HTTPAdapter(**options)
+            adapter.close()
+        session.mount(prefix, resized[id(adapter)])
+
+class ScraperPool:
+    """Thread-safe cache of scraper instances shared by every JobSearch"""
+
+    def __init__(self):
+        self._scrapers: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(platform: str, config: Optional[Dict]) -> tuple:
+        """Pool key: the platform plus the config sections scrapers read"""
+        config = config or {}
+        settings = {
+            "api": (config.get("api") or {}).get(platform),
+            "cache": (config.get("search") or {}).get("cache"),
+        }
+        return platform, json.dumps(settings, sort_keys=True, default=str)
+
+    def get(self, platform: str, config: Optional[Dict] = None):
+        """
+        Get the pooled scraper for a platform, creating it on first use
+
+        Args:
+            platform (str): Platform name, e.g. "jobbank"
+            config (dict, optional): Application config
+
+        Returns:
+            BaseScraper: A scraper shared with other searches using the same
+                platform settings
+        """
+        if platform not in PLATFORMS:
+            raise ValueError(f"Unknown platform: {platform}")
+
+        key = self._key(platform, config)
+        with self._lock:
+            scraper = self._scrapers.get(key)
+            if scraper is None:
+                scraper = PLATFORMS[platform](config)
+                size_connection_pools(
+                    scraper.session,
+                    getattr(scraper, "MAX_CONCURRENCY", DEFAULT_POOL_SIZE)
+                )
+                # Drop scrapers built for settings that have since changed;
+                # a JobSearch may still be using one, so its session is left
+                # open and closes when the scraper is garbage collected
+                for stale in [k for k in self._scrapers if k[0] == platform]:
+                    del self._scrapers[stale]
+                self._scrapers[key] = scraper
+                logger.debug(f"Created pooled {platform} scraper")
+            return scraper
+
+    def clear(self):
+        """Close every pooled session and forget the scrapers"""
+        with self._lock:
+            for scraper in self._scrapers.values():
+                scraper.session.close()
+            self._scrapers.clear()
+
+    def __len__(self) -> int:
+        return len(self._scrapers)
+
+# Singleton instance
+scraper_pool = ScraperPool()
@@ -0,0 +1,160 @@
+"""
+Per-host token bucket rate limiting shared by all scrapers.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+def _check_limits(rate: float, burst: int):
+    """
+    Validate a rate and burst
+
+    Raises:
+        ValueError: If rate is not positive or burst is below 1
+    """
+    if not rate > 0:
+        raise ValueError(f"Rate limit rate must be above 0 requests per second, got {rate!r}")
+    if not burst >= 1:
+        raise ValueError(f"Rate limit burst must be at least 1 request, got {burst!r}")
+
+class TokenBucket:
+    """Thread-safe token bucket allowing short bursts at a sustained rate"""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate (float): Tokens added per second (sustained requests per second)
+            burst (int): Maximum tokens stored (requests allowed back to back)
+
+        Raises:
+            ValueError: If rate is not positive or burst is below 1
+        """
+        _check_limits(rate, burst)
+        self.rate = float(rate)
+        self.burst = int(burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens earned since the last update"""
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Take a token, going into debt if none are left
+
+        Returns:
+            float: Seconds the caller must wait before using the token
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block until a token is available"""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait for a token without blocking the event loop"""
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """Drain the bucket so the next request waits at least the given time"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def update(self, rate: float, burst: int):
+        """Change the rate and burst without losing the current token count"""
+        _check_limits(rate, burst)
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+            self.burst = int(burst)
+            self._tokens = min(self._tokens, self.burst)
+
+class RateLimiter:
+    """Registry of token buckets keyed by host"""
+
+    # Built-in limits, overridden by `search.rate_limits` in config.yml
+    DEFAULT_LIMITS = {
+        "default": {"rate": 1.0, "burst": 2},            # Any other host
+        "www.jobbank.gc.ca": {"rate": 0.5, "burst": 2},  # One request per 2s sustained
+    }
+
+    def __init__(self, limits: Optional[Dict] = None):
+        """
+        Args:
+            limits (dict, optional): Mapping of host (or "default") to
+                {"rate": requests per second, "burst": back-to-back requests}
+        """
+        self._limits = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.configure(limits)
+
+    def configure(self, limits: Optional[Dict]):
+        """
+        Apply limits from config, keeping the state of existing buckets
+
+        Args:
+            limits (dict, optional): The `search.rate_limits` config section
+
+        Raises:
+            ValueError: If a host's rate is not positive or its burst is below 1
+        """
+        merged = {**self.DEFAULT_LIMITS, **(limits or {})}
+        for host in merged:
+            _check_limits(*self._limits_for(host, merged))
+        with self._lock:
+            self._limits = merged
+            for host, bucket in self._buckets.items():
+                bucket.update(*self._limits_for(host))
+
+    def _limits_for(self, host: str, configured: Optional[Dict] = None):
+        """Get (rate, burst) for a host, falling back to the default limits"""
+        configured = self._limits if configured is None else configured
+        default = {**self.DEFAULT_LIMITS["default"], **(configured.get("default") or {})}
+        limits = {**default, **(configured.get(host) or {})}
+        return limits["rate"], limits["burst"]
+
+    def bucket(self, url: str) -> TokenBucket:
+        """
+        Get the bucket for a URL's host, creating it on first use
+
+        Args:
+            url (str): Full URL or bare host name
+        """
+        host = urlparse(url).netloc or url
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(*self._limits_for(host))
+            return self._buckets[host]
+
+    def acquire(self, url: str):
+        """Block until a request to the URL's host is allowed"""
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str):
+        """Wait until a request to the URL's host is allowed"""
+        await self.bucket(url).acquire_async()
+
+    def penalize(self, url: str, seconds: float):
+        """Hold back all requests to the URL's host, e.g. after a 429"""
+        self.bucket(url).penalize(seconds)
+
+# Shared instance so every search in the process draws from one budget
+rate_limiter = RateLimiter()
@@ -70,6 +70,22 @@ def test_search_export(test_config, tmp_path):
     search.export_results(results, str(json_file), format="json")
     assert json_file.exists()
 
+def test_search_many_integration(test_config):
+    """Test searching several queries at once"""
+    search = JobSearch(test_config)
+    
+    queries = ["graphic designer", "illustrator"]
+    results = search.search_many(queries, location="Brampton, ON", radius=25)
+    
+    # Each job lists the queries that found it
+    for job in results:
+        assert job["matched_queries"]
+        assert set(job["matched_queries"]) <= set(queries)
+    
+    # Postings found by both queries are returned once
+    urls = [job["url"] for job in results]
+    assert len(urls) == len(set(urls))
+
 def test_search_error_handling(test_config):
     """Test search error handling"""
     search = JobSearch(test_config)
@@ -0,0 +1,70 @@
+"""
+Unit tests for the Parquet search archive.
+"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from core.archive import JobArchive
+
+YESTERDAY = time.time() - 86400
+TODAY = datetime.now().strftime("%Y-%m-%d")
+
+JOBS = [
+    {"url": "https://example.com/1", "title": "Designer", "source": "Job Bank", "salary": "$25.00 hourly"},
+    {"url": "https://example.com/2", "title": "Designer", "source": "Kijiji", "salary": "$60,000 per year"},
+    {"url": "https://example.com/3", "title": "Tutor", "source": "Kijiji"},
+]
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = JobArchive(tmp_path / "archive")
+    archive.append(JOBS, query="designer", searched_at=YESTERDAY)
+    archive.append(JOBS[:2], query="designer")
+    return archive
+
+def test_partitioned_by_date_and_source(archive):
+    """Each search writes one file per date and source partition"""
+    parts = sorted(path.relative_to(archive.path).parent.as_posix() for path in archive.path.rglob("*.parquet"))
+    assert parts == [
+        f"date={(datetime.now() - timedelta(days=1)):%Y-%m-%d}/source=Job%20Bank",
+        f"date={(datetime.now() - timedelta(days=1)):%Y-%m-%d}/source=Kijiji",
+        f"date={TODAY}/source=Job%20Bank",
+        f"date={TODAY}/source=Kijiji",
+    ]
+
+def test_scan_filters_partitions(archive):
+    """Scans can be limited to dates and sources"""
+    table = archive.scan(["url", "source", "query"], since=TODAY, sources=["Kijiji"])
+    assert table.to_pylist() == [{"url": "https://example.com/2", "source": "Kijiji", "query": "designer"}]
+
+def test_postings_per_day(archive):
+    """Distinct postings are counted per search date and source"""
+    counts = {(row["date"], row["source"]): row["postings"] for row in archive.postings_per_day()}
+    assert counts[(TODAY, "Kijiji")] == 1
+    assert sum(counts.values()) == 5
+
+def test_salary_distribution(archive):
+    """Annual salaries are summarized per title, counting each posting once"""
+    rows = archive.salary_distribution(by="title")
+    assert rows == [{
+        "title": "Designer", "postings": 2, "min": 52000.0,
+        "median": pytest.approx(56000.0, rel=0.1), "mean": 56000.0, "max": 60000.0,
+    }]
+
+def test_per_job_queries(tmp_path):
+    """Streams may pass one query per job"""
+    archive = JobArchive(tmp_path)
+    archive.append(JOBS[1:], query=["designer", "tutor"])
+    assert sorted(archive.scan(["query"]).column("query").to_pylist()) == ["designer", "tutor"]
+
+def test_compact(archive):
+    """Compaction leaves one file per partition with the same rows"""
+    archive.append(JOBS[2:])
+    assert archive.compact() == 1
+    assert len(list(archive.path.glob(f"date={TODAY}/source=Kijiji/*.parquet"))) == 1
+    assert archive.scan().num_rows == 6
@@ -0,0 +1,103 @@
+"""
+Unit tests for the asynchronous base scraper.
+"""
+
+import threading
+import time
+
+import pytest
+from unittest.mock import MagicMock
+from scrapers.async_base import AsyncBaseScraper, page_sink
+from scrapers.rate_limiter import RateLimiter
+
+class SlowSession:
+    """Session stub whose requests take a fixed time and track concurrency"""
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        response = MagicMock()
+        response.text = f"{url}?page={params['page']}"
+        return response
+
+class PagedScraper(AsyncBaseScraper):
+    """Test implementation fetching several pages from one host"""
+    MAX_CONCURRENCY = 3
+    PAGES = 6
+
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+        # Keep the shared limiter out of timing-sensitive tests
+        self.rate_limiter = RateLimiter({"default": {"rate": 1000, "burst": 100}})
+
+    async def asearch(self, query, location, radius=None):
+        import asyncio
+        responses = await asyncio.gather(*(
+            self._fetch("https://example.com/search", params={"page": page})
+            for page in range(1, self.PAGES + 1)
+        ))
+        jobs = [{"title": response.text} for response in responses]
+        for job in jobs:
+            self._emit_page([job])
+        return jobs
+
+def test_pages_fetched_concurrently():
+    """Pages should overlap instead of running back to back"""
+    session = SlowSession(delay=0.1)
+    scraper = PagedScraper(session)
+
+    start = time.perf_counter()
+    jobs = scraper.search("designer", "Brampton, ON")
+    elapsed = time.perf_counter() - start
+
+    assert len(jobs) == 6
+    assert elapsed < 0.6 * 0.9  # Serial would take 6 * 0.1s
+    assert session.max_in_flight > 1
+
+def test_per_host_concurrency_limit():
+    """No more than MAX_CONCURRENCY requests should hit a host at once"""
+    session = SlowSession(delay=0.05)
+    scraper = PagedScraper(session)
+
+    scraper.search("designer", "Brampton, ON")
+    assert session.max_in_flight <= PagedScraper.MAX_CONCURRENCY
+
+def test_results_keep_page_order():
+    """Concurrent fetching should not reorder results"""
+    scraper = PagedScraper(SlowSession(delay=0.01))
+    jobs = scraper.search("designer", "Brampton, ON")
+    assert [job["title"][-1] for job in jobs] == ["1", "2", "3", "4", "5", "6"]
+
+def test_abstract_asearch():
+    """AsyncBaseScraper cannot be instantiated without asearch"""
+    with pytest.raises(TypeError):
+        AsyncBaseScraper()
+
+def test_pages_reach_active_stream():
+    """Parsed pages are handed to the page sink of the running stream"""
+    import asyncio
+    scraper = PagedScraper(SlowSession(delay=0.01))
+    received = []
+
+    async def run():
+        page_sink.set(lambda source, jobs: received.append((source, jobs)))
+        return await scraper.asearch("designer", "Brampton, ON")
+
+    jobs = asyncio.run(run())
+    assert [page for _, page in received] == [[job] for job in jobs]
+    assert all(source is scraper for source, _ in received)
+
+def test_pages_ignored_without_stream():
+    """Emitting pages is a no-op outside a stream"""
+    jobs = PagedScraper(SlowSession(delay=0.01)).search("designer", "Brampton, ON")
+    assert len(jobs) == 6
@@ -0,0 +1,93 @@
+"""
+Unit tests for the indexed deduplication engines.
+"""
+
+import random
+
+import pytest
+from utils.dedup import DedupIndex, SimilarityIndex
+from utils.filters import _is_duplicate, deduplicate_jobs
+
+TITLES = ["designer", "graphic designer", "senior graphic designer", "ux designer",
+          "photographer", "photo editor", "de", "web developer", "web designer"]
+COMPANIES = ["studio", "studio inc", "acme", "acme media", "", "pixel lab"]
+
+def pairwise_containment(jobs):
+    """Reference O(n^2) deduplication with the core.filters rules"""
+    unique = []
+    for job in jobs:
+        if not job.get("url") or any(job["url"] == kept["url"] for kept in unique):
+            continue
+        title, company = job["title"].lower(), job["company"].lower()
+        duplicate = False
+        for kept in unique:
+            kept_title, kept_company = kept["title"].lower(), kept["company"].lower()
+            if not (title and kept_title):
+                continue
+            if title == kept_title:
+                duplicate = True
+            elif (title in kept_title or kept_title in title) and company and kept_company and (
+                company == kept_company or company in kept_company or kept_company in company
+            ):
+                duplicate = True
+            if duplicate:
+                break
+        if not duplicate:
+            unique.append(job)
+    return unique
+
+def random_jobs(n, seed):
+    """Random jobs drawn from overlapping titles and companies"""
+    rng = random.Random(seed)
+    return [
+        {
+            "title": rng.choice(TITLES) + rng.choice(["", "", " ii", " (contract)"]),
+            "company": rng.choice(COMPANIES),
+            "url": f"https://example.com/{rng.randrange(n)}"
+        }
+        for _ in range(n)
+    ]
+
+@pytest.mark.parametrize("seed", range(5))
+def test_containment_index_matches_pairwise(seed):
+    """DedupIndex keeps exactly the jobs the pairwise comparison keeps"""
+    jobs = random_jobs(200, seed)
+    index = DedupIndex()
+    kept = [job for job in jobs if job.get("url") and index.add_if_new(job)]
+    assert kept == pairwise_containment(jobs)
+
+def test_containment_needs_company():
+    """Contained titles are only duplicates when the companies overlap"""
+    index = DedupIndex()
+    index.add({"title": "Graphic Designer", "company": "Acme Media", "url": "a"})
+
+    assert index.is_duplicate({"title": "Designer", "company": "Acme", "url": "b"})
+    assert not index.is_duplicate({"title": "Designer", "company": "Pixel Lab", "url": "c"})
+    assert not index.is_duplicate({"title": "Designer", "company": "", "url": "d"})
+    assert index.is_duplicate({"title": "graphic designer", "company": "", "url": "e"})
+
+def test_short_title_skips_untitled_jobs():
+    """Short titles are not contained in kept jobs without a title"""
+    index = DedupIndex()
+    index.add({"title": "", "company": "Acme", "url": "a"})
+    index.add({"title": "UX Designer", "company": "Acme", "url": "b"})
+
+    assert not index.is_duplicate({"title": "PM", "company": "Acme", "url": "c"})
+    assert index.is_duplicate({"title": "UX", "company": "Acme", "url": "d"})
+
+@pytest.mark.parametrize("seed", range(3))
+def test_similarity_index_matches_pairwise(seed):
+    """utils.filters.deduplicate_jobs keeps the pairwise SequenceMatcher result"""
+    jobs = random_jobs(150, seed)
+    expected = []
+    for job in jobs:
+        if not any(_is_duplicate(job, kept) for kept in expected):
+            expected.append(job)
+    assert deduplicate_jobs(jobs) == expected
+
+def test_similarity_index_length_window():
+    """Titles of very different lengths are never compared"""
+    index = SimilarityIndex()
+    index.add({"title": "Designer", "company": "Studio", "url": "a"})
+    assert index.is_duplicate({"title": "Designers", "company": "Studio", "url": "b"})
+    assert not index.is_duplicate({"title": "Senior Designer", "company": "Studio", "url": "c"})
@@ -0,0 +1,94 @@
+"""
+Unit tests for detail page parsing and enrichment.
+"""
+
+import asyncio
+import json
+
+from unittest.mock import MagicMock
+from scrapers.async_base import AsyncBaseScraper
+from scrapers.details import PLACEHOLDER_COMPANY, merge_details, parse_job_posting
+from scrapers.rate_limiter import RateLimiter
+from utils.salary_parser import SalaryParser
+
+JSON_LD_PAGE = """
+<html><head><script type="application/ld+json">{}</script></head>
+<body><h1>Illustrator</h1></body></html>
+""".format(json.dumps({
+    "@context": "https://schema.org",
+    "@type": "JobPosting",
+    "title": "Illustrator",
+    "hiringOrganization": {"@type": "Organization", "name": "Maple Studio"},
+    "description": "<p>Create artwork.</p><p>Remote work is possible.</p>",
+    "baseSalary": {
+        "@type": "MonetaryAmount",
+        "currency": "CAD",
+        "value": {"@type": "QuantitativeValue", "minValue": 25, "maxValue": 30, "unitText": "HOUR"}
+    }
+}))
+
+RDFA_PAGE = """
+<div typeof="JobPosting">
+  <span property="hiringOrganization" typeof="Organization">
+    <span property="name"><strong>Brampton Print Co.</strong></span>
+  </span>
+  <span property="baseSalary">$52,000 annually</span>
+  <div property="description">Design print layouts for local clients.</div>
+</div>
+"""
+
+def test_json_ld_posting():
+    """JSON-LD JobPosting fields are read and the salary formatted for parsing"""
+    assert parse_job_posting(JSON_LD_PAGE) == {
+        "company": "Maple Studio",
+        "description": "Create artwork. Remote work is possible.",
+        "salary": "$25.00 to $30.00 hourly"
+    }
+
+def test_rdfa_posting():
+    """RDFa attributes (as on Job Bank) are read when there's no JSON-LD"""
+    assert parse_job_posting(RDFA_PAGE) == {
+        "company": "Brampton Print Co.",
+        "description": "Design print layouts for local clients.",
+        "salary": "$52,000 annually"
+    }
+
+def test_weekly_salary_annualized():
+    """A weekly baseSalary from enrichment is annualized as weekly pay"""
+    page = JSON_LD_PAGE.replace('"minValue": 25, "maxValue": 30, "unitText": "HOUR"', '"value": 1200, "unitText": "WEEK"')
+    job = {"salary": ""}
+    merge_details(job, parse_job_posting(page))
+    assert job["salary"] == "$1,200.00 weekly"
+    assert SalaryParser().salary_columns([job])["min_annual"][0] == 1200 * 52
+
+def test_merge_fills_only_missing_details():
+    """Placeholders and snippets are replaced, known values kept"""
+    job = {"company": PLACEHOLDER_COMPANY, "salary": "$20/hr", "description": "Short"}
+    merge_details(job, {"company": "Maple Studio", "salary": "$30/hr", "description": "Much longer text"})
+    assert job["company"] == "Maple Studio"
+    assert job["salary"] == "$20/hr"
+    assert job["description"] == "Much longer text"
+
+class DetailScraper(AsyncBaseScraper):
+    """Scraper whose detail pages come from a stub session"""
+    def __init__(self):
+        super().__init__()
+        self.session = MagicMock()
+        self.session.get.return_value.text = JSON_LD_PAGE
+        self.rate_limiter = RateLimiter({"default": {"rate": 1000, "burst": 100}})
+
+    async def asearch(self, query, location, radius=None, is_known=None):
+        return []
+
+def test_detail_pages_cached_by_url():
+    """A posting's page is fetched once and its details copied per call"""
+    scraper = DetailScraper()
+
+    async def fetch_twice():
+        first = await scraper.afetch_details("https://example.com/job/1")
+        first["company"] = "Changed"
+        return await scraper.afetch_details("https://example.com/job/1")
+
+    details = asyncio.run(fetch_twice())
+    assert details["company"] == "Maple Studio"
+    assert scraper.session.get.call_count == 1
@@ -0,0 +1,106 @@
+"""
+Unit tests for the streaming exporters.
+"""
+
+import csv
+import gzip
+import json
+
+import pytest
+from scrapers.job import Job
+from utils import export
+from utils.export import JobWriter, export_jobs, infer_format
+
+JOBS = [
+    {
+        "title": "Graphic Designer",
+        "company": "Maple Studios",
+        "location": "Brampton, ON",
+        "type": "job",
+        "url": "https://example.com/1",
+        "salary": "$25.00 hourly",
+        "matched_queries": ["graphic designer"],
+    },
+    Job(title="Photographer", company="Pixel Media", type="gig", url="https://example.com/2"),
+]
+
+def test_csv(tmp_path):
+    """CSV has the standard columns, with extra keys dropped"""
+    path = tmp_path / "jobs.csv"
+    assert export_jobs(JOBS, path) == 2
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == list(export.EXPORT_FIELDS)
+    assert rows[0]["title"] == "Graphic Designer"
+    assert rows[1]["salary"] == ""
+
+def test_csv_custom_fields(tmp_path):
+    """Callers can choose the columns"""
+    path = tmp_path / "jobs.csv"
+    export_jobs(({"title": job["title"], "score": 1} for job in JOBS), path, fields=["title", "score"])
+    assert path.read_text(encoding="utf-8").splitlines() == ["title,score", "Graphic Designer,1", "Photographer,1"]
+
+def test_jsonl_gzip(tmp_path):
+    """JSON Lines keep every key and are gzipped for a .gz suffix"""
+    path = tmp_path / "jobs.jsonl.gz"
+    export_jobs(iter(JOBS), path)
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert records[0]["matched_queries"] == ["graphic designer"]
+    assert records[1] == {
+        "title": "Photographer", "company": "Pixel Media", "type": "gig", "url": "https://example.com/2"
+    }
+
+@pytest.mark.parametrize("jobs", [JOBS, []])
+def test_json_array(tmp_path, jobs):
+    """JSON output is one valid array, also when empty"""
+    path = tmp_path / "jobs.json"
+    export_jobs(jobs, path)
+    assert [record["title"] for record in json.loads(path.read_text(encoding="utf-8"))] == [
+        job["title"] for job in jobs
+    ]
+
+def test_infer_format():
+    """Format and compression come from the file name"""
+    assert infer_format("outputs/jobs.csv") == ("csv", None)
+    assert infer_format("outputs/jobs.jsonl.gz") == ("jsonl", "gzip")
+    assert infer_format("outputs/jobs.json.zst") == ("json", "zstd")
+    assert infer_format("outputs/jobs.txt") == (None, None)
+
+def test_unknown_format(tmp_path):
+    """Unknown formats are rejected"""
+    with pytest.raises(ValueError):
+        export_jobs(JOBS, tmp_path / "jobs.txt")
+
+def test_incomplete_writer_rejected(tmp_path):
+    """Writers missing write() or close() can't be instantiated"""
+    class PartialWriter(JobWriter):
+        def write(self, job):
+            self.count += 1
+
+    with pytest.raises(TypeError):
+        PartialWriter(tmp_path / "jobs.txt")
+
+def test_zstd(tmp_path):
+    """zstd output round-trips, or asks for zstandard when it is missing"""
+    path = tmp_path / "jobs.jsonl.zst"
+    if export.zstandard is None:
+        with pytest.raises(ImportError):
+            export_jobs(JOBS, path)
+        return
+
+    export_jobs(JOBS, path)
+    with export.zstandard.open(path, "rt", encoding="utf-8") as f:
+        assert len(f.readlines()) == 2
+
+def test_parquet(tmp_path):
+    """Parquet output has one string column per field"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "jobs.parquet"
+    export_jobs(JOBS, path)
+
+    table = pq.read_table(path)
+    assert table.column_names == list(export.EXPORT_FIELDS)
+    assert table.column("title").to_pylist() == ["Graphic Designer", "Photographer"]
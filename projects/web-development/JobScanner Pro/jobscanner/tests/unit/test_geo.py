@@ -0,0 +1,88 @@
+"""
+Unit tests for gazetteer lookups and radius filtering.
+"""
+
+import pytest
+from utils.geo import filter_by_radius, haversine_km, normalize_location, resolve_location
+
+def locations(jobs):
+    """Locations of a list of jobs"""
+    return [job["location"] for job in jobs]
+
+def test_normalize_location():
+    """Accents, apostrophes and punctuation are normalized"""
+    assert normalize_location("St. John's, NL") == "st johns nl"
+    assert normalize_location("Montréal (QC)") == "montreal qc"
+
+def test_resolve_most_specific_place():
+    """Neighbourhoods win over the city that contains them"""
+    assert resolve_location("Toronto (North York), ON") == resolve_location("North York")
+    assert resolve_location("Richmond Hill, ON") != resolve_location("Richmond, BC")
+    assert resolve_location("York Region") is None
+    assert resolve_location("Somewhere unknown") is None
+
+def test_resolve_checks_province():
+    """A province or state after a place must match it"""
+    assert resolve_location("York, ON") == resolve_location("York")
+    assert resolve_location("Richmond, VA") is None
+    assert resolve_location("New York, NY") is None
+    assert resolve_location("London, UK") is None
+    assert resolve_location("Toronto, Ontario") == resolve_location("Toronto")
+
+def test_haversine_known_distance():
+    """Toronto to Ottawa is roughly 350 km"""
+    toronto = resolve_location("Toronto")
+    ottawa = resolve_location("Ottawa")
+    distance = float(haversine_km(ottawa[0], ottawa[1], toronto[0], toronto[1]))
+    assert distance == pytest.approx(352, abs=5)
+
+def test_filter_by_radius_from_brampton():
+    """Nearby cities are kept and far ones dropped"""
+    jobs = [{"location": location} for location in [
+        "Brampton, ON", "Mississauga, ON", "Ottawa, ON", "Vancouver, BC"
+    ]]
+    assert locations(filter_by_radius(jobs, "Brampton, ON", max_radius=25)) == [
+        "Brampton, ON", "Mississauga, ON"
+    ]
+
+def test_filter_by_radius_bare_city_names():
+    """Bare city names, as Craigslist lists them, are located too"""
+    jobs = [{"location": location} for location in [
+        "Brampton", "Toronto, ON", "Mississauga", "Ottawa", "Vaughan"
+    ]]
+    assert locations(filter_by_radius(jobs, "Brampton", max_radius=20)) == [
+        "Brampton", "Toronto, ON", "Mississauga", "Vaughan"
+    ]
+
+def test_filter_by_radius_any_base_location():
+    """Radius filtering works outside the GTA"""
+    jobs = [{"location": "Burnaby, BC"}, {"location": "Toronto, ON"}]
+    assert locations(filter_by_radius(jobs, "Vancouver", max_radius=25)) == ["Burnaby, BC"]
+
+def test_filter_by_radius_keeps_unspecific_locations():
+    """Remote, region-wide and unknown short locations are kept"""
+    jobs = [{"location": location} for location in [
+        "Remote - Vancouver, BC", "Ontario, Canada", "", "Unit 5, 123 Industrial Parkway North"
+    ]]
+    assert locations(filter_by_radius(jobs, "Brampton", max_radius=10)) == [
+        "Remote - Vancouver, BC", "Ontario, Canada", ""
+    ]
+
+def test_filter_by_radius_drops_places_abroad():
+    """Unknown US and foreign places are outside the radius"""
+    jobs = [{"location": location} for location in [
+        "New York, NY", "Buffalo, NY 14201", "Seattle, WA", "London, England", "Remote - USA", "York, ON"
+    ]]
+    assert locations(filter_by_radius(jobs, "Toronto", max_radius=10)) == ["Remote - USA", "York, ON"]
+
+def test_filter_by_radius_drops_short_foreign_locations():
+    """Unknown cities are kept only when no country is named"""
+    jobs = [{"location": location} for location in [
+        "Paris, France", "London, UK", "Berlin, Germany", "Port Hope"
+    ]]
+    assert locations(filter_by_radius(jobs, "Brampton", max_radius=20)) == ["Port Hope"]
+
+def test_unknown_base_location_skips_filter():
+    """Jobs are returned unfiltered when the base can't be located"""
+    jobs = [{"location": "Ottawa, ON"}]
+    assert filter_by_radius(jobs, "Atlantis", max_radius=5) == jobs
@@ -0,0 +1,74 @@
+"""
+Unit tests for the pluggable HTML parsing backends.
+"""
+
+from pathlib import Path
+
+import pytest
+from scrapers.html_parser import BACKENDS, ParserBackend, Selector, configure_parser, parse_html
+from scrapers.jobbank import JobBankScraper
+from scrapers.kijiji import KijijiScraper
+
+FIXTURES = Path(__file__).resolve().parents[3] / "debug_html"
+
+PAGE = """
+<div class="search-item featured">
+  <a class="title" href="/v-art/job/1">Graphic <b>Designer</b></a>
+  <div class="location">Brampton</div>
+</div>
+<div class="search-item"><a class="title-link" href="/v-art/job/2">Not a title</a></div>
+"""
+
+@pytest.fixture(params=sorted(BACKENDS))
+def backend(request):
+    """Run a test with each installed backend, restoring the default after"""
+    yield request.param
+    configure_parser("auto")
+
+def test_select_by_tag_and_class(backend):
+    """Selectors match whole class names on descendants"""
+    page = parse_html(PAGE, backend=backend)
+    listings = page.select(Selector("div.search-item"))
+    assert len(listings) == 2
+    title = listings[0].select_one(Selector("a.title"))
+    assert " ".join(title.get_text().split()) == "Graphic Designer"
+    assert title["href"] == "/v-art/job/1"
+    assert title.get("missing", "default") == "default"
+    assert listings[1].select_one(Selector("a.title")) is None
+
+def test_backends_parse_scraper_pages_alike(backend):
+    """Every backend yields the same jobs as BeautifulSoup"""
+    configure_parser("bs4")
+    expected = KijijiScraper()._parse_search_page(PAGE, "job", "art")
+    configure_parser(backend)
+    assert KijijiScraper()._parse_search_page(PAGE, "job", "art") == expected
+
+@pytest.mark.skipif(not (FIXTURES / "jobbank.html").exists(), reason="saved pages not available")
+def test_backends_agree_on_saved_jobbank_page(backend):
+    """Saved Job Bank results parse identically with each backend"""
+    html = (FIXTURES / "jobbank.html").read_text(encoding="utf-8")
+    configure_parser("bs4")
+    expected = JobBankScraper()._parse_search_page(html)
+    configure_parser(backend)
+    assert expected
+    assert JobBankScraper()._parse_search_page(html) == expected
+
+def test_empty_page_falls_back():
+    """Pages a fast engine rejects are parsed by BeautifulSoup"""
+    assert parse_html("").select(Selector("div")) == []
+
+def test_unsupported_selector():
+    """Only tag, class and tag.class selectors are supported"""
+    with pytest.raises(ValueError):
+        Selector("div > a.title")
+
+def test_incomplete_backend_rejected():
+    """Backends missing part of the interface can't be instantiated"""
+    class PartialBackend(ParserBackend):
+        name = "partial"
+
+        def parse(self, html):
+            return html
+
+    with pytest.raises(TypeError):
+        PartialBackend()
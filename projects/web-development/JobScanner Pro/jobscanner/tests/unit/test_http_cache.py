@@ -0,0 +1,137 @@
+"""
+Unit tests for the persistent HTTP response cache.
+"""
+
+import time
+
+import pytest
+import requests
+from unittest.mock import patch
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from scrapers.http_cache import HTTPCache, CachingAdapter
+
+def make_response(request, status=200, body=b"<html>results</html>", headers=None):
+    """Build a response as the network would return it"""
+    response = Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = body
+    response.url = request.url
+    response.request = request
+    return response
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache backed by a temporary database"""
+    return HTTPCache(tmp_path / "http_cache.db", ttl=60)
+
+@pytest.fixture
+def session(cache):
+    """Session routed through the caching adapter"""
+    session = requests.Session()
+    session.mount("https://", CachingAdapter(cache))
+    return session
+
+def test_fresh_response_served_from_disk(session):
+    """A repeated GET within the TTL should not reach the network"""
+    with patch("requests.adapters.HTTPAdapter.send",
+               side_effect=lambda request, **kwargs: make_response(request)) as send:
+        first = session.get("https://example.com/search", params={"q": "designer"})
+        second = session.get("https://example.com/search", params={"q": "designer"})
+
+    assert send.call_count == 1
+    assert second.text == first.text == "<html>results</html>"
+    assert getattr(second, "from_cache", False)
+
+def test_params_are_part_of_the_key(session):
+    """Different query parameters are cached separately"""
+    with patch("requests.adapters.HTTPAdapter.send",
+               side_effect=lambda request, **kwargs: make_response(request)) as send:
+        session.get("https://example.com/search", params={"q": "designer"})
+        session.get("https://example.com/search", params={"q": "photographer"})
+
+    assert send.call_count == 2
+
+def test_stale_response_revalidated_with_etag(session, cache):
+    """Stale entries are revalidated and a 304 reuses the stored body"""
+    cache.ttl = 0
+    sent_headers = []
+
+    def send(request, **kwargs):
+        sent_headers.append(dict(request.headers))
+        if len(sent_headers) == 1:
+            return make_response(request, headers={"ETag": '"v1"'})
+        return make_response(request, status=304, body=b"")
+
+    with patch("requests.adapters.HTTPAdapter.send", side_effect=send):
+        session.get("https://example.com/search")
+        revalidated = session.get("https://example.com/search")
+
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert revalidated.status_code == 200
+    assert revalidated.text == "<html>results</html>"
+
+def test_errors_are_not_cached(session):
+    """Only successful responses are stored"""
+    with patch("requests.adapters.HTTPAdapter.send",
+               side_effect=lambda request, **kwargs: make_response(request, status=503)) as send:
+        session.get("https://example.com/search")
+        session.get("https://example.com/search")
+
+    assert send.call_count == 2
+
+def test_authorized_requests_bypass_cache(session):
+    """Responses to requests with credentials are neither served nor stored"""
+    with patch("requests.adapters.HTTPAdapter.send",
+               side_effect=lambda request, **kwargs: make_response(request)) as send:
+        session.get("https://example.com/search")
+        session.get("https://example.com/search", headers={"Authorization": "Bearer token"})
+        session.get("https://example.com/account", headers={"Authorization": "Bearer token"})
+        session.get("https://example.com/account")
+
+    assert send.call_count == 4
+
+def test_vary_star_is_not_cached(session):
+    """A response that varies on every request is not stored"""
+    with patch("requests.adapters.HTTPAdapter.send",
+               side_effect=lambda request, **kwargs: make_response(request, headers={"Vary": "*"})) as send:
+        session.get("https://example.com/search")
+        session.get("https://example.com/search")
+
+    assert send.call_count == 2
+
+def test_lru_eviction_bounds_size(tmp_path):
+    """The least recently used entries are evicted past max_size"""
+    cache = HTTPCache(tmp_path / "http_cache.db", ttl=60, max_size=250)
+    cache.set("a", 200, {}, b"x" * 100)
+    time.sleep(0.01)
+    cache.set("b", 200, {}, b"x" * 100)
+    time.sleep(0.01)
+    cache.get("a")  # "a" is now more recently used than "b"
+    time.sleep(0.01)
+    cache.set("c", 200, {}, b"x" * 100)
+
+    assert cache.size() <= 250
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+def test_cache_persists_across_instances(tmp_path):
+    """Entries survive reopening the database"""
+    HTTPCache(tmp_path / "http_cache.db").set("key", 200, {"ETag": "abc"}, b"body")
+    entry = HTTPCache(tmp_path / "http_cache.db").get("key")
+    assert entry["body"] == b"body"
+    assert entry["etag"] == "abc"
+
+def test_is_fresh_is_read_only(cache):
+    """Freshness checks before a fetch don't write to the database"""
+    cache.set("key", 200, {}, b"body")
+    writes = cache._conn.total_changes
+
+    assert cache.is_fresh("key")
+    assert not cache.is_fresh("missing")
+    assert cache._conn.total_changes == writes
+
+    cache.ttl = 0
+    assert not cache.is_fresh("key")
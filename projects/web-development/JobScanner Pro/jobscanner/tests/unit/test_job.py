@@ -0,0 +1,46 @@
+"""
+Unit tests for the Job record.
+"""
+
+import pytest
+from core.filters import is_remote_job
+from scrapers.job import Job
+
+def test_job_behaves_like_dict():
+    """Slots and overflow keys read and write like dict keys"""
+    job = Job(title="Designer", url="https://example.com/1", type="job")
+    job["match_score"] = 80
+
+    assert job["title"] == "Designer"
+    assert job.get("salary", "Not specified") == "Not specified"
+    assert "salary" not in job and "match_score" in job
+    assert job == {"title": "Designer", "url": "https://example.com/1", "type": "job", "match_score": 80}
+
+    with pytest.raises(KeyError):
+        job["company"]
+
+def test_job_delete_and_copy():
+    """Deleted fields become missing again and copies are independent"""
+    job = Job({"title": "Designer", "company": "Studio"})
+    copy = job.copy()
+    del job["company"]
+
+    assert "company" not in job and len(job) == 1
+    assert copy["company"] == "Studio"
+
+def test_job_has_no_instance_dict():
+    """Jobs are slotted, without a per-instance __dict__"""
+    assert not hasattr(Job(), "__dict__")
+
+def test_remote_verdict_kept_out_of_record():
+    """The remote check is cached off the record and redone after edits"""
+    job = Job(title="Designer", location="Brampton, ON")
+    assert not is_remote_job(job)
+    assert job.to_dict() == {"title": "Designer", "location": "Brampton, ON"}
+
+    job["description"] = "Work from home"
+    assert is_remote_job(job)
+    assert "is_remote" not in job
+
+    plain = {"title": "Remote designer"}
+    assert is_remote_job(plain) and plain == {"title": "Remote designer"}
@@ -0,0 +1,133 @@
+"""
+Unit tests for the job store and incremental searching.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock, patch
+from core.store import JobStore
+from scrapers.jobbank import JobBankScraper
+from scrapers.rate_limiter import RateLimiter
+
+def make_job(n, **fields):
+    """Build a minimal job dictionary"""
+    job = {
+        "title": f"Designer {n}",
+        "company": "Studio",
+        "location": "Brampton, ON",
+        "url": f"https://example.com/job/{n}",
+        "type": "job",
+        "source": "jobbank"
+    }
+    job.update(fields)
+    return job
+
+def jobbank_page(numbers):
+    """Build a Job Bank results page containing the given posting numbers"""
+    articles = "".join(f"""
+        <article class="action-buttons">
+            <a class="resultJobItem" href="/jobsearch/jobposting/{n}">
+                <span class="noctitle">Designer {n}</span>
+            </a>
+            <ul>
+                <li class="business">Studio</li>
+                <li class="location">Brampton (ON)</li>
+            </ul>
+        </article>""" for n in numbers)
+    return f"<html><body>{articles}</body></html>"
+
+@pytest.fixture
+def store(tmp_path):
+    """Store backed by a temporary database"""
+    return JobStore(tmp_path / "jobs.db")
+
+def test_add_jobs_returns_only_new(store):
+    """Re-adding postings should report only unseen ones as new"""
+    assert len(store.add_jobs([make_job(1), make_job(2)])) == 2
+    new_jobs = store.add_jobs([make_job(2), make_job(3)])
+    assert [job["url"] for job in new_jobs] == ["https://example.com/job/3"]
+    assert len(store) == 3
+
+def test_known_urls(store):
+    """known_urls should return the stored subset"""
+    store.add_jobs([make_job(1)])
+    known = store.known_urls(["https://example.com/job/1", "https://example.com/job/9"])
+    assert known == {"https://example.com/job/1"}
+    assert "https://example.com/job/1" in store
+
+def test_duplicates_within_batch(store):
+    """A URL repeated in one batch is only new once"""
+    assert len(store.add_jobs([make_job(1), make_job(1)])) == 1
+
+def test_stored_jobs_round_trip(store):
+    """Stored postings keep their fields"""
+    store.add_jobs([make_job(1, salary="$20 hourly")])
+    jobs = store.get_jobs(source="jobbank")
+    assert jobs[0]["salary"] == "$20 hourly"
+    assert store.get_jobs(source="kijiji") == []
+
+@patch("requests.Session")
+def test_jobbank_incremental_stops_at_known_posting(mock_session):
+    """Incremental Job Bank searches stop paginating at stored postings"""
+    pages = {1: jobbank_page([10, 9]), 2: jobbank_page([8, 7]), 3: jobbank_page([6, 5])}
+
+    def get(url, params=None, timeout=None):
+        response = MagicMock()
+        response.text = pages.get(params["page"], "<html></html>")
+        return response
+
+    mock_session.return_value.get.side_effect = get
+    scraper = JobBankScraper()
+    scraper.rate_limiter = RateLimiter({"www.jobbank.gc.ca": {"rate": 1000, "burst": 100}})
+
+    known = {"https://www.jobbank.gc.ca/jobsearch/jobposting/7"}
+    jobs = asyncio.run(scraper.asearch("designer", "Brampton", is_known=lambda url: url in known))
+
+    # Pages 1-2 for both regular and youth jobs, never page 3
+    requested = [call.kwargs["params"] for call in mock_session.return_value.get.call_args_list]
+    assert max(params["page"] for params in requested) == 2
+    assert all(params["sort"] == "D" for params in requested)
+    assert len(jobs) == 6  # 10, 9, 8 for each job type
+
+def test_full_text_search(store):
+    """Stored postings are found by words in any text column, best first"""
+    store.add_jobs([
+        make_job(1, title="Motion Graphics Designer", description="Remote friendly studio"),
+        make_job(2, title="Barista", description="Coffee shop near motion graphics studio"),
+        make_job(3, title="Tutor", location="Toronto, ON"),
+    ])
+    results = store.search("motion graphic remote brampton")
+    assert [job["title"] for job in results] == ["Motion Graphics Designer"]
+    assert [job["title"] for job in store.search("motion graphics")] == ["Motion Graphics Designer", "Barista"]
+    assert store.search("design", source="kijiji") == []
+
+def test_full_text_search_any_word_fallback(store):
+    """Without a posting matching every word, any word matches"""
+    store.add_jobs([make_job(1, title="Photographer"), make_job(2, title="Videographer")])
+    assert {job["title"] for job in store.search("photographer videographer")} == {"Photographer", "Videographer"}
+    assert store.search("!!!") == []
+
+def test_full_text_index_follows_updates(store):
+    """Re-stored postings are re-indexed with their new text"""
+    store.add_jobs([make_job(1, title="Illustrator")])
+    store.add_jobs([make_job(1, title="Animator")])
+    assert store.search("illustrator") == []
+    assert [job["title"] for job in store.search("animator")] == ["Animator"]
+
+def test_full_text_index_built_for_existing_database(tmp_path):
+    """Postings stored before the index existed are indexed on open"""
+    import sqlite3
+    path = tmp_path / "jobs.db"
+    JobStore(path).add_jobs([make_job(1, title="Muralist")])
+    conn = sqlite3.connect(path)
+    conn.executescript("DROP TRIGGER postings_fts_insert; DROP TRIGGER postings_fts_delete; "
+                       "DROP TRIGGER postings_fts_update; DROP TABLE postings_fts;")
+    conn.close()
+    assert [job["title"] for job in JobStore(path).search("muralist")] == ["Muralist"]
+
+def test_substring_search_without_fts(store):
+    """Without FTS5, search falls back to matching every word as a substring"""
+    store.add_jobs([make_job(1, title="Motion Designer"), make_job(2, title="Designer")])
+    store.full_text = False
+    assert [job["title"] for job in store.search("motion design")] == ["Motion Designer"]
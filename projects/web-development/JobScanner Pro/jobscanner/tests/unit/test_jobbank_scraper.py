@@ -0,0 +1,65 @@
+"""
+Unit tests for Job Bank pagination planning.
+"""
+
+import threading
+
+from unittest.mock import MagicMock
+from scrapers.jobbank import JobBankScraper
+from scrapers.rate_limiter import RateLimiter
+
+def results_page(page, total, count=2):
+    """Search results page with `count` postings and a result count"""
+    articles = "".join(f"""
+        <article class="action-buttons">
+          <a class="resultJobItem" href="/jobsearch/jobposting/{page}{i}">
+            <span class="noctitle">Designer {page}-{i}</span>
+          </a>
+          <ul><li class="business">Studio</li><li class="location">Brampton (ON)</li></ul>
+        </article>""" for i in range(count))
+    return f'<h2><span class="found" id="results-count">{total}</span> results</h2>{articles}'
+
+class PagedSession:
+    """Session stub serving numbered result pages and recording requests"""
+    def __init__(self, total):
+        self.total = total
+        self.requested = []
+        self.lock = threading.Lock()
+        self.headers = {}
+
+    def get(self, url, params=None, timeout=None):
+        with self.lock:
+            self.requested.append((params.get("fsrc"), params["page"]))
+        response = MagicMock()
+        response.text = results_page(params["page"], self.total)
+        return response
+
+def make_scraper(total):
+    """Job Bank scraper talking to a PagedSession"""
+    scraper = JobBankScraper()
+    scraper.session = PagedSession(total)
+    # Keep the Job Bank politeness limit out of the tests
+    scraper.rate_limiter = RateLimiter({"www.jobbank.gc.ca": {"rate": 1000, "burst": 100}})
+    return scraper
+
+def test_single_page_of_results_needs_one_request():
+    """A result count that fits on page 1 stops there"""
+    scraper = make_scraper(total=2)
+    jobs = scraper.search("designer", "Brampton, ON")
+    assert set(scraper.session.requested) == {(None, 1), ("21", 1)}
+    assert len(jobs) == 4
+
+def test_only_existing_pages_are_prefetched():
+    """Pages beyond the result count are never requested"""
+    scraper = make_scraper(total=60)
+    jobs = scraper.search("designer", "Brampton, ON")
+    assert sorted(page for fsrc, page in scraper.session.requested if fsrc is None) == [1, 2, 3]
+    assert [job["title"] for job in jobs[:6]] == [
+        "Designer 1-0", "Designer 1-1", "Designer 2-0", "Designer 2-1", "Designer 3-0", "Designer 3-1"
+    ]
+
+def test_page_count_capped():
+    """Large result counts still stop at MAX_PAGES"""
+    scraper = make_scraper(total=10000)
+    scraper.search("designer", "Brampton, ON")
+    assert max(page for _, page in scraper.session.requested) == JobBankScraper.MAX_PAGES
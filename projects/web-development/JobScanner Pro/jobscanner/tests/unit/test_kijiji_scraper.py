@@ -0,0 +1,64 @@
+"""
+Unit tests for Kijiji category fan-out.
+"""
+
+import threading
+import time
+
+from unittest.mock import MagicMock
+from scrapers.kijiji import KijijiScraper
+from scrapers.rate_limiter import RateLimiter
+
+LISTING = """
+<div class="search-item">
+  <a class="title" href="/v-art/brampton/{slug}/1">{title}</a>
+  <div class="location">Brampton</div>
+</div>
+"""
+
+class CategorySession:
+    """Session stub where every category lists one shared and one own posting"""
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.headers = {}
+
+    def get(self, url, params=None, timeout=None):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        response = MagicMock()
+        response.text = (
+            LISTING.format(slug="shared", title="Shared illustrator posting")
+            + LISTING.format(slug=params["dc"], title=f"Illustrator {params['dc']}")
+        )
+        return response
+
+def make_scraper(session):
+    """Kijiji scraper talking to a stub session"""
+    scraper = KijijiScraper()
+    scraper.session = session
+    scraper.rate_limiter = RateLimiter({"default": {"rate": 1000, "burst": 100}})
+    return scraper
+
+def test_listing_in_several_categories_returned_once():
+    """Cross-category duplicates are dropped as pages arrive"""
+    scraper = make_scraper(CategorySession())
+    jobs = scraper.search("illustrator", "Brampton, ON")
+    
+    urls = [job["url"] for job in jobs]
+    assert len(urls) == len(set(urls))
+    assert sum("shared" in url for url in urls) == 1
+    categories = len(KijijiScraper.JOB_CATEGORIES) + len(KijijiScraper.SERVICE_CATEGORIES)
+    assert len(jobs) == categories + 1
+
+def test_categories_fetched_concurrently_within_host_limit():
+    """Categories overlap but respect the per-host concurrency limit"""
+    session = CategorySession(delay=0.05)
+    make_scraper(session).search("illustrator", "Brampton, ON")
+    assert 1 < session.max_in_flight <= KijijiScraper.MAX_CONCURRENCY
@@ -0,0 +1,156 @@
+"""
+Unit tests for scraper and search metrics.
+"""
+
+import io
+import json
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import requests
+from scrapers.metrics import (
+    MetricsRegistry, instrument_session, observe_parse,
+    cache_hits_total, jobs_per_page, parse_seconds, request_seconds,
+    requests_total, response_bytes_total, retries_total
+)
+
+def test_counter_labels():
+    """Counts are kept per label set"""
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test counter")
+    counter.inc(host="a")
+    counter.inc(2, host="a")
+    counter.inc(host="b")
+
+    assert counter.value(host="a") == 3
+    assert counter.value(host="b") == 1
+    assert counter.value(host="c") == 0
+
+def test_registry_returns_existing_metric():
+    """Registering a name twice gives back the first metric"""
+    registry = MetricsRegistry()
+    assert registry.counter("test_total", "a") is registry.counter("test_total", "b")
+
+def test_histogram_buckets():
+    """Observations land in cumulative buckets with count and sum"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "Test histogram", buckets=(0.1, 1))
+    for value in (0.05, 0.5, 5):
+        histogram.observe(value, stage="filter")
+
+    assert histogram.count(stage="filter") == 3
+    assert histogram.total(stage="filter") == 5.55
+    series = histogram.to_dict()[0]
+    assert series["buckets"] == {"0.1": 1, "1": 2, "+Inf": 3}
+
+def test_histogram_time():
+    """time() records the block's duration even when it raises"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_seconds", "Test histogram")
+    with histogram.time(stage="dedup"):
+        pass
+    try:
+        with histogram.time(stage="dedup"):
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert histogram.count(stage="dedup") == 2
+
+def test_prometheus_format():
+    """Text export has HELP/TYPE headers, buckets and escaped labels"""
+    registry = MetricsRegistry()
+    registry.counter("test_total", "Requests").inc(host='say "hi"')
+    registry.histogram("test_seconds", "Latency", buckets=(1,)).observe(0.5, host="a")
+    text = registry.to_prometheus()
+
+    assert "# HELP test_total Requests" in text
+    assert "# TYPE test_seconds histogram" in text
+    assert 'test_total{host="say \\"hi\\""} 1' in text
+    assert 'test_seconds_bucket{host="a",le="1"} 1' in text
+    assert 'test_seconds_bucket{host="a",le="+Inf"} 1' in text
+    assert 'test_seconds_count{host="a"} 1' in text
+
+def test_json_export_and_reset():
+    """JSON export lists every metric; reset clears values"""
+    registry = MetricsRegistry()
+    registry.counter("test_total", "Requests").inc(host="a")
+    data = json.loads(registry.to_json())
+    assert data["test_total"]["values"] == [{"labels": {"host": "a"}, "value": 1}]
+
+    registry.reset()
+    assert json.loads(registry.to_json())["test_total"]["values"] == []
+
+def make_response(url, status=200, content=b"<html></html>", from_cache=False):
+    response = MagicMock()
+    response.url = url
+    response.status_code = status
+    response.content = content
+    response.elapsed = timedelta(milliseconds=120)
+    response.from_cache = from_cache
+    return response
+
+def test_instrument_session():
+    """Responses are counted per host; cached ones only as cache hits"""
+    session = instrument_session(requests.Session())
+    instrument_session(session)
+    hooks = session.hooks["response"]
+    assert len(hooks) == 1
+
+    host = "metrics-test.example.com"
+    hooks[0](make_response(f"https://{host}/jobs", content=b"x" * 100))
+    hooks[0](make_response(f"https://{host}/jobs", status=429))
+    hooks[0](make_response(f"https://{host}/jobs", from_cache=True))
+
+    assert requests_total.value(host=host, status=200) == 1
+    assert requests_total.value(host=host, status=429) == 1
+    assert request_seconds.count(host=host) == 2
+    assert response_bytes_total.value(host=host) == 100 + len(b"<html></html>")
+    assert cache_hits_total.value(host=host) == 1
+
+def test_retries_counted_from_urllib3_history():
+    """Attempts retried by the adapter are counted by reason"""
+    from urllib3.util.retry import RequestHistory
+    host = "retry-test.example.com"
+    response = make_response(f"https://{host}/jobs")
+    response.raw.retries.history = (
+        RequestHistory("GET", "/jobs", None, 429, None),
+        RequestHistory("GET", "/jobs", ConnectionError(), None, None),
+    )
+    instrument_session(requests.Session()).hooks["response"][0](response)
+
+    assert retries_total.value(host=host, reason="429") == 1
+    assert retries_total.value(host=host, reason="error") == 1
+
+def test_streamed_body_is_not_read():
+    """Streamed responses are sized from Content-Length and left unread"""
+    host = "stream-test.example.com"
+    response = requests.Response()
+    response.url = f"https://{host}/feed"
+    response.status_code = 200
+    response.elapsed = timedelta(milliseconds=10)
+    response.headers["Content-Length"] = "5"
+    response.raw = io.BytesIO(b"hello")
+    instrument_session(requests.Session()).hooks["response"][0](response, stream=True)
+
+    assert response.raw.tell() == 0
+    assert response_bytes_total.value(host=host) == 5
+    assert response.text == "hello"
+
+class MetricsTestParser:
+    @observe_parse
+    def parse(self, count):
+        return [{"title": str(i)} for i in range(count)]
+
+    @observe_parse
+    def parse_with_total(self, count):
+        return self.parse.__wrapped__(self, count), 100
+
+def test_observe_parse():
+    """Parse time and job counts are recorded per scraper class"""
+    parser = MetricsTestParser()
+    before = jobs_per_page.total(scraper="MetricsTestParser")
+    assert len(parser.parse(3)) == 3
+    assert parser.parse_with_total(4)[1] == 100
+
+    assert parse_seconds.count(scraper="MetricsTestParser") >= 2
+    assert jobs_per_page.total(scraper="MetricsTestParser") == before + 7
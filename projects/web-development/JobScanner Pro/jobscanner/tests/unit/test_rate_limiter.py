@@ -0,0 +1,86 @@
+"""
+Unit tests for the per-host token bucket rate limiter.
+"""
+
+import asyncio
+import time
+
+import pytest
+from scrapers.rate_limiter import TokenBucket, RateLimiter
+
+def test_burst_is_immediate():
+    """An idle bucket should serve a full burst without waiting"""
+    bucket = TokenBucket(rate=1, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+def test_sustained_rate_after_burst():
+    """Once the burst is spent, requests are spaced by 1/rate"""
+    bucket = TokenBucket(rate=2, burst=1)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.05)
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+
+def test_tokens_refill_over_time():
+    """Waiting should earn tokens back"""
+    bucket = TokenBucket(rate=20, burst=1)
+    bucket.reserve()
+    time.sleep(0.06)
+    assert bucket.reserve() == 0.0
+
+def test_penalize_delays_next_request():
+    """A 429 penalty should hold back the next request"""
+    bucket = TokenBucket(rate=1, burst=5)
+    bucket.penalize(3)
+    assert bucket.reserve() >= 3
+
+def test_hosts_have_separate_buckets():
+    """Each host draws from its own budget"""
+    limiter = RateLimiter({"default": {"rate": 1, "burst": 1}})
+    limiter.bucket("https://a.example.com/search").reserve()
+    assert limiter.bucket("https://b.example.com/search").reserve() == 0.0
+    assert limiter.bucket("https://a.example.com/other").reserve() > 0
+
+def test_configured_host_limits():
+    """Host limits come from config, falling back to the default section"""
+    limiter = RateLimiter({
+        "default": {"rate": 2, "burst": 5},
+        "www.kijiji.ca": {"burst": 4}
+    })
+    kijiji = limiter.bucket("https://www.kijiji.ca/b-jobs")
+    other = limiter.bucket("https://example.com")
+    assert (kijiji.rate, kijiji.burst) == (2, 4)
+    assert (other.rate, other.burst) == (2, 5)
+
+def test_reconfigure_keeps_existing_bucket():
+    """Reconfiguring should update limits but keep the shared bucket"""
+    limiter = RateLimiter()
+    bucket = limiter.bucket("https://www.jobbank.gc.ca/jobsearch")
+    limiter.configure({"www.jobbank.gc.ca": {"rate": 0.25, "burst": 1}})
+    assert limiter.bucket("https://www.jobbank.gc.ca/jobsearch") is bucket
+    assert bucket.rate == 0.25
+
+@pytest.mark.parametrize("rate, burst", [(0, 2), (-1, 2), (1, 0)])
+def test_invalid_limits_rejected(rate, burst):
+    """A zero or negative rate, or a burst below 1, is a config error"""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=rate, burst=burst)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=2).update(rate, burst)
+
+    limiter = RateLimiter()
+    bucket = limiter.bucket("https://www.jobbank.gc.ca/jobsearch")
+    with pytest.raises(ValueError):
+        limiter.configure({"www.jobbank.gc.ca": {"rate": rate, "burst": burst}})
+    assert bucket.rate == 0.5
+
+def test_acquire_async_waits():
+    """The async path should wait out the token debt"""
+    limiter = RateLimiter({"default": {"rate": 10, "burst": 1}})
+
+    async def two_requests():
+        await limiter.acquire_async("https://example.com")
+        await limiter.acquire_async("https://example.com")
+
+    start = time.perf_counter()
+    asyncio.run(two_requests())
+    assert time.perf_counter() - start >= 0.08
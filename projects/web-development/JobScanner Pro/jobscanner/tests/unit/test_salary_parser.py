@@ -0,0 +1,94 @@
+"""
+Unit tests for salary parsing.
+"""
+
+import pytest
+from utils.salary_parser import SalaryParser
+
+@pytest.fixture
+def parser():
+    """Fresh parser with an empty memo"""
+    return SalaryParser()
+
+@pytest.mark.parametrize("text, min_amount, max_amount, period", [
+    ("$17.20 hourly", 17.2, 17.2, "hourly"),
+    ("$25.00 to $30.00 hourly", 25.0, 30.0, "hourly"),
+    ("$50,000 to $60,000 annually", 50000.0, 60000.0, "annually"),
+    ("$50000 per year", 50000.0, 50000.0, "annually"),
+    ("$3,000 monthly", 3000.0, 3000.0, "monthly"),
+    ("$20/hr", 20.0, 20.0, "hourly"),
+    ("$200 daily", 200.0, 200.0, "daily"),
+    ("$1,200 per week", 1200.0, 1200.0, "weekly"),
+    ("Pays $900, five shifts a week", 900.0, 900.0, "weekly"),
+    ("Salary: $18 an hour", 18.0, 18.0, "hourly"),
+    ("$40K-60K", 40000.0, 60000.0, "annually"),
+    ("$40-60k", 40000.0, 60000.0, "annually"),
+    ("$80,000 to $99,999", 80000.0, 99999.0, "annually"),
+    ("$50.00 +", 50.0, 50.0, "hourly"),
+])
+def test_parse_salary_formats(parser, text, min_amount, max_amount, period):
+    """Common salary formats parse to amounts and a period"""
+    result = parser.parse_salary(text)
+    assert result["min_amount"] == min_amount
+    assert result["max_amount"] == max_amount
+    assert result["period"] == period
+    assert result["is_range"] == (min_amount != max_amount)
+
+def test_parse_negotiable(parser):
+    """Text without amounts is flagged as negotiable"""
+    result = parser.parse_salary("Competitive, depending on experience")
+    assert result["is_negotiable"]
+    assert result["min_amount"] is None
+    assert parser.parse_salary("") == {}
+
+def test_parse_salary_is_memoized(parser):
+    """Repeated salary text is parsed once and returned as a copy"""
+    first = parser.parse_salary("$17.20 hourly")
+    first["min_amount"] = 0
+    second = parser.parse_salary("$17.20 hourly")
+
+    assert second["min_amount"] == 17.2
+    assert parser._parse_cached.cache_info().hits == 1
+
+@pytest.mark.parametrize("text, annual", [
+    ("$200 daily", 200 * 5 * 52),
+    ("$1,200 per week", 1200 * 52),
+    ("$20/hr", 20 * 40 * 52),
+])
+def test_normalize_to_annual(parser, text, annual):
+    """Every period is annualized with the shared multipliers"""
+    assert parser.normalize_to_annual(parser.parse_salary(text))["min_annual"] == annual
+
+@pytest.fixture
+def salary_jobs():
+    """Jobs with hourly, annual, missing and unparseable salaries"""
+    return [
+        {"title": "A", "salary": "$17.20 hourly"},
+        {"title": "B", "salary": "$50,000 to $60,000 annually"},
+        {"title": "C", "salary": "Not specified"},
+        {"title": "D", "salary": "Competitive"},
+        {"title": "E", "salary": "$17.20 hourly"},
+        {"title": "F", "salary": "$90,000 per year"},
+    ]
+
+def test_salary_columns(parser, salary_jobs):
+    """Each job gets annual amounts; repeated text is parsed once"""
+    columns = parser.salary_columns(salary_jobs)
+    assert columns["min_annual"][0] == pytest.approx(17.2 * 2080)
+    assert columns["max_annual"][1] == 60000
+    assert list(columns["has_salary"]) == [True, True, False, True, True, True]
+    assert len(columns["parsed"]) == 5
+
+def test_filter_by_annual_bounds(parser, salary_jobs):
+    """Ranges overlapping the bounds are kept; missing salaries pass one-sided bounds"""
+    titles = [job["title"] for job in parser.filter_jobs_by_salary(salary_jobs, min_salary=40000)]
+    assert titles == ["B", "C", "F"]
+
+    titles = [job["title"] for job in parser.filter_jobs_by_salary(salary_jobs, 30000, 70000)]
+    assert titles == ["A", "B", "E"]
+    assert salary_jobs[0]["parsed_salary"]["period"] == "hourly"
+
+def test_filter_by_hourly_bounds(parser, salary_jobs):
+    """Hourly bounds apply to every job, whatever its own period"""
+    titles = [job["title"] for job in parser.filter_jobs_by_salary(salary_jobs, 20, 35, "hourly")]
+    assert titles == ["B"]
@@ -0,0 +1,66 @@
+"""
+Unit tests for the saved search scheduler.
+"""
+
+import pytest
+from auto.scheduler import SavedSearch, SearchScheduler
+
+def test_searches_are_staggered():
+    """Start times are spread across the shortest interval"""
+    searches = [SavedSearch(f"query {i}", "Brampton, ON", interval=60) for i in range(3)]
+    scheduler = SearchScheduler(searches, start=0)
+
+    assert scheduler.pop_due(0) == [searches[0]]
+    assert scheduler.pop_due(1199) == []
+    assert scheduler.pop_due(1200) == [searches[1]]
+    assert scheduler.pop_due(2400) == [searches[2]]
+
+def test_search_repeats_on_its_interval():
+    """Each search is rescheduled one interval after its slot"""
+    search = SavedSearch("designer", "Brampton, ON", interval=10)
+    scheduler = SearchScheduler([search], start=0)
+
+    assert scheduler.pop_due(0) == [search]
+    assert scheduler.seconds_until_next(0) == 600
+    assert scheduler.pop_due(600) == [search]
+
+def test_missed_runs_are_not_replayed():
+    """A search far behind schedule runs once, then restarts from now"""
+    search = SavedSearch("designer", "Brampton, ON", interval=1)
+    scheduler = SearchScheduler([search], start=0)
+
+    assert scheduler.pop_due(1000) == [search]
+    assert scheduler.seconds_until_next(1000) == 60
+
+def test_from_config_defaults():
+    """Missing fields fall back to the search and user config"""
+    config = {
+        "user": {"location": "Toronto, ON"},
+        "search": {"refresh_interval": 30, "default_radius": 25}
+    }
+    search = SavedSearch.from_config({"query": "photographer", "gigs_only": True}, config)
+
+    assert search.location == "Toronto, ON"
+    assert search.interval == 30
+    assert search.search_kwargs() == {
+        "query": "photographer",
+        "location": "Toronto, ON",
+        "radius": 25,
+        "gigs_only": True,
+        "remote_only": False,
+        "on_site_only": False
+    }
+
+@pytest.mark.parametrize("interval", [0, -5])
+def test_non_positive_interval_rejected(interval):
+    """A zero or negative interval would make pop_due loop forever"""
+    with pytest.raises(ValueError):
+        SavedSearch("designer", "Brampton, ON", interval)
+    with pytest.raises(ValueError):
+        SavedSearch.from_config({"query": "designer", "interval": interval}, {})
+
+def test_empty_scheduler():
+    """Nothing is due when there are no searches"""
+    scheduler = SearchScheduler([], start=0)
+    assert scheduler.pop_due(100) == []
+    assert scheduler.seconds_until_next(100) is None
@@ -0,0 +1,65 @@
+"""
+Unit tests for BM25 match scoring.
+"""
+
+import numpy as np
+from core.scoring import NEUTRAL_SCORE, TermMatrix, score_jobs, tokenize
+from scrapers.job import Job
+
+JOBS = [
+    {"title": "Graphic Designer", "company": "Maple Studios", "description": "Photoshop and print work."},
+    {"title": "Delivery Driver", "company": "Peel Logistics", "description": "G licence required."},
+    {"title": "Web Designer", "company": "Pixel Media", "description": "Design sites in Photoshop."},
+    Job(title="Senior Graphic Designer", description="Lead graphic design projects in Photoshop."),
+]
+
+def test_tokenize_keeps_skill_names():
+    """Skills like C++ and Node.js stay single tokens"""
+    assert tokenize("C++, C# and Node.js developer") == ["c++", "c#", "and", "node.js", "developer"]
+    assert tokenize(None) == []
+
+def test_term_matrix():
+    """Entries hold field-weighted counts per job and term"""
+    matrix = TermMatrix(JOBS)
+    entries = {
+        (int(row), matrix.vocabulary[column]): count
+        for row, column, count in zip(matrix.rows, matrix.columns, matrix.counts)
+    }
+    assert entries[(0, "designer")] == 3.0
+    assert entries[(3, "graphic")] == 4.0
+    assert entries[(2, "photoshop")] == 1.0
+    assert matrix.document_frequency[matrix.term_ids(["designer"])[0]] == 3
+    assert matrix.term_ids(["designer", "welder"])[1] == -1
+
+def test_dot_matches_dense_product():
+    """The sparse product equals the dense matrix-vector product"""
+    matrix = TermMatrix(JOBS)
+    weights = matrix.bm25()
+    dense = np.zeros((matrix.size, len(matrix.vocabulary)))
+    dense[matrix.rows, matrix.columns] = weights
+    vector = np.arange(len(matrix.vocabulary), dtype=float)
+    assert np.allclose(matrix.dot(weights, vector), dense @ vector)
+
+def test_ranking():
+    """Title matches outrank description matches; unrelated jobs score 0"""
+    jobs = [dict(job) for job in JOBS]
+    scores = score_jobs(jobs, ["graphic designer", "photoshop"], [2.0, 1.0])
+
+    assert [job["match_score"] for job in jobs] == np.rint(scores).astype(int).tolist()
+    assert scores[1] == 0
+    assert min(scores[0], scores[3]) > scores[2] > 0
+    assert all(0 <= score <= 100 for score in scores)
+
+def test_title_match_scores_full():
+    """A full title match scores 100, whatever keywords no result contains"""
+    jobs = [{"title": "Graphic Designer"}, {"title": "Delivery Driver"}]
+    scores = score_jobs(jobs, ["graphic designer", "photoshop", "figma"])
+    assert [job["match_score"] for job in jobs] == [100, 0]
+    assert scores.max() == 100
+
+def test_no_terms_is_neutral():
+    """Without search terms every job gets the neutral score"""
+    jobs = [dict(job) for job in JOBS]
+    score_jobs(jobs, [" ", ""])
+    assert {job["match_score"] for job in jobs} == {NEUTRAL_SCORE}
+    assert len(score_jobs([], ["designer"])) == 0
@@ -0,0 +1,48 @@
+"""
+Unit tests for the process-wide scraper pool.
+"""
+
+import pytest
+from scrapers.pool import ScraperPool
+
+CONFIG = {"search": {"platforms": {"jobbank": True, "kijiji": True}}}
+
+def test_scrapers_reused_across_searches():
+    """The same platform and settings share one scraper and session"""
+    pool = ScraperPool()
+    first = pool.get("jobbank", CONFIG)
+    assert pool.get("jobbank", dict(CONFIG)) is first
+    assert pool.get("kijiji", CONFIG) is not first
+    assert len(pool) == 2
+
+def test_changed_settings_replace_scraper():
+    """A different cache or API config builds a fresh scraper"""
+    pool = ScraperPool()
+    first = pool.get("jobbank", CONFIG)
+    config = {"search": {"cache": {"enabled": False}}}
+    assert pool.get("jobbank", config) is not first
+    assert len(pool) == 1
+
+def test_connection_pool_sized_to_concurrency():
+    """Sessions keep one connection per request allowed in flight"""
+    pool = ScraperPool()
+    scraper = pool.get("jobbank", CONFIG)
+    adapter = scraper.session.get_adapter("https://www.jobbank.gc.ca")
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == scraper.MAX_CONCURRENCY
+    # Job Bank's retry strategy survives the resize
+    assert adapter.max_retries.total == scraper.MAX_RETRIES
+    assert scraper.session.get_adapter("http://www.jobbank.gc.ca") is adapter
+
+def test_replaced_scraper_session_stays_open():
+    """A search still holding a replaced scraper can keep using its session"""
+    pool = ScraperPool()
+    first = pool.get("jobbank", CONFIG)
+    adapter = first.session.get_adapter("https://www.jobbank.gc.ca")
+    pool.get("jobbank", {"search": {"cache": {"enabled": False}}})
+    assert first.session.get_adapter("https://www.jobbank.gc.ca") is adapter
+    assert adapter.poolmanager.pools is not None
+
+def test_unknown_platform():
+    """Unknown platforms are rejected"""
+    with pytest.raises(ValueError):
+        ScraperPool().get("monster", CONFIG)
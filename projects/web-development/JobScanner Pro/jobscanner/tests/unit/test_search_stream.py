@@ -0,0 +1,56 @@
+"""
+Unit tests for streaming searches.
+"""
+
+import asyncio
+import time
+
+from core.search import JobSearch
+from scrapers.async_base import AsyncBaseScraper
+
+class PagingScraper(AsyncBaseScraper):
+    """Fetches pages one after another; only `job_pages` have a posting"""
+    PAGES = 20
+
+    def __init__(self, job_pages=(0,)):
+        super().__init__()
+        self.job_pages = job_pages
+        self.fetches = 0
+
+    async def asearch(self, query, location, radius=None, is_known=None):
+        jobs = []
+        for page in range(self.PAGES):
+            await asyncio.sleep(0.02)
+            self.fetches += 1
+            page_jobs = []
+            if page in self.job_pages:
+                page_jobs.append({"title": f"Designer {page}", "url": f"https://example.com/{page}"})
+            self._emit_page(page_jobs)
+            jobs.extend(page_jobs)
+        return jobs
+
+    async def afetch_details(self, url):
+        return {"description": f"Full posting at {url}"}
+
+def make_search(scraper, **search_config):
+    search = JobSearch({"search": dict(search_config, platforms={})})
+    search.scrapers = [scraper]
+    return search
+
+def test_closing_stream_cancels_requests():
+    """Closing the generator stops the scraper without waiting for a job"""
+    scraper = PagingScraper()
+    stream = make_search(scraper).stream("designer", "Brampton, ON")
+    assert next(stream)["title"] == "Designer 0"
+    stream.close()
+
+    time.sleep(0.1)
+    fetched = scraper.fetches
+    time.sleep(0.2)
+    assert scraper.fetches == fetched < PagingScraper.PAGES
+
+def test_stream_enriches_top_jobs():
+    """Streams enrich the first top_n jobs like search() does"""
+    search = make_search(PagingScraper(job_pages=(0, 1)), enrich={"enabled": True, "top_n": 1})
+    jobs = list(search.stream("designer", "Brampton, ON"))
+    assert [job.get("description") for job in jobs] == ["Full posting at https://example.com/0", None]
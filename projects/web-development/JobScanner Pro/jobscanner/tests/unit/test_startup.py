@@ -0,0 +1,99 @@
+"""
+Unit tests for CLI startup cost.
+
+Each check runs in a fresh interpreter, since this test session has already
+imported everything.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Directory containing the jobscanner package
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Cumulative import time allowed for jobscanner.main
+IMPORT_BUDGET_MS = 100
+
+# Time allowed to import the search module and build a JobSearch with every
+# platform, store and archive disabled (asyncio alone is a good part of it)
+SEARCH_BUDGET_MS = 200
+
+# Modules that only searches and output need
+HEAVY_MODULES = ["yaml", "rich", "requests", "bs4", "lxml", "numpy", "pandas", "jobscanner.core.search"]
+
+def run_python(code, *flags):
+    """Run code in a fresh interpreter from the project root"""
+    result = subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return result
+
+def loaded_after(code):
+    """Heavy modules imported by running `code`"""
+    result = run_python(
+        "import json, sys\n" + code + "\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def test_main_import_is_light():
+    """Importing the CLI module loads none of the search stack"""
+    assert loaded_after("import jobscanner.main") == []
+
+def test_help_is_light():
+    """--help exits before config, rich or the scrapers are loaded"""
+    code = (
+        "sys.argv = ['jobscanner', '--help']\n"
+        "from jobscanner.main import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert loaded_after(code) == []
+
+def test_import_time_budget():
+    """The CLI module imports within the startup budget"""
+    result = run_python("import jobscanner.main", "-X", "importtime")
+    line = next(
+        line for line in result.stderr.splitlines()
+        if line.rstrip().endswith("| jobscanner.main")
+    )
+    cumulative_us = int(line.split("|")[1])
+    assert cumulative_us / 1000 < IMPORT_BUDGET_MS
+
+def test_search_setup_is_light():
+    """Building a JobSearch loads no scraping, filtering or storage backends"""
+    code = (
+        "from jobscanner.core.search import JobSearch\n"
+        "JobSearch({'search': {'platforms': {}}})"
+    )
+    assert loaded_after(code) == ["jobscanner.core.search"]
+
+def test_search_setup_time_budget():
+    """Importing the search module and building a JobSearch stays within budget"""
+    result = run_python(
+        "import time\n"
+        "start = time.perf_counter()\n"
+        "from jobscanner.core.search import JobSearch\n"
+        "JobSearch({'search': {'platforms': {}}})\n"
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    assert float(result.stdout.strip().splitlines()[-1]) < SEARCH_BUDGET_MS
+
+def test_only_enabled_scrapers_loaded():
+    """Scraper modules of disabled platforms are never imported"""
+    result = run_python(
+        "import json, sys\n"
+        "from jobscanner.core.search import JobSearch\n"
+        "JobSearch({'search': {'platforms': {'jobbank': True, 'kijiji': False}}})\n"
+        "print(json.dumps(sorted(m for m in sys.modules if m.startswith('jobscanner.scrapers.'))))"
+    )
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    assert "jobscanner.scrapers.jobbank" in loaded
+    for platform in ("indeed", "kijiji", "craigslist"):
+        assert f"jobscanner.scrapers.{platform}" not in loaded
@@ -0,0 +1,210 @@
+"""
+Incremental duplicate detection indexes for job listings.
+
+Both indexes keep the exact duplicate rules of the pairwise comparisons they
+replace, but only compare a new job against a small set of candidates found
+through blocking keys instead of against every job kept so far.
+"""
+
+import logging
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+def _trigrams(text: str) -> set:
+    """Distinct character trigrams of a string"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class DedupIndex:
+    """
+    Duplicate index with the rules of core.filters._is_duplicate_job
+
+    Two jobs are duplicates if they share a URL, have the same title, or one
+    title contains the other and one company contains the other.
+
+    Containment candidates are found with a character trigram index: a title
+    that contains the new title must contain its rarest trigram, and a title
+    contained in the new title must contain the trigram it was anchored on.
+    """
+
+    def __init__(self):
+        self._urls = set()
+        self._titles = set()                # Exact lowercase titles
+        self._kept = []                     # (title, company) per kept job
+        self._titled = []                   # Kept ids with a title
+        self._grams = defaultdict(list)     # Trigram -> kept ids with that trigram
+        self._anchors = defaultdict(list)   # Trigram -> kept ids anchored on it
+        self._short = []                    # Kept ids with titles under 3 chars
+
+    def __len__(self):
+        return len(self._kept)
+
+    @staticmethod
+    def _key(job: Dict):
+        """Normalized (url, title, company) of a job"""
+        return (
+            job.get("url"),
+            (job.get("title") or "").lower(),
+            (job.get("company") or "").lower()
+        )
+
+    def _candidates(self, title: str) -> Iterator[int]:
+        """Kept ids whose title may contain, or be contained in, the title"""
+        if len(title) < 3:
+            # Too short to index; any kept title could contain it. Empty
+            # titles never match, though "" is in every title
+            yield from self._titled
+            return
+
+        grams = _trigrams(title)
+
+        # Kept titles containing this title contain its rarest trigram
+        rarest = min(grams, key=lambda gram: len(self._grams.get(gram, ())))
+        yield from self._grams.get(rarest, ())
+
+        # Kept titles inside this title contain their anchor trigram
+        for gram in grams:
+            yield from self._anchors.get(gram, ())
+        yield from self._short
+
+    def is_duplicate(self, job: Dict) -> bool:
+        """Check whether a job duplicates any job already in the index"""
+        url, title, company = self._key(job)
+        if url in self._urls:
+            return True
+        if not title:
+            return False
+        if title in self._titles:
+            return True
+        if not company:
+            # Containment matches also need both companies
+            return False
+
+        for kept_id in set(self._candidates(title)):
+            kept_title, kept_company = self._kept[kept_id]
+            if not (title in kept_title or kept_title in title):
+                continue
+            if kept_company and (
+                company == kept_company or
+                company in kept_company or
+                kept_company in company
+            ):
+                return True
+        return False
+
+    def add(self, job: Dict):
+        """Add a job to the index without checking it"""
+        url, title, company = self._key(job)
+        kept_id = len(self._kept)
+        self._kept.append((title, company))
+        if url:
+            self._urls.add(url)
+        if not title:
+            return
+
+        self._titles.add(title)
+        self._titled.append(kept_id)
+        if len(title) < 3:
+            self._short.append(kept_id)
+            return
+
+        grams = _trigrams(title)
+        anchor = min(grams, key=lambda gram: len(self._grams.get(gram, ())))
+        self._anchors[anchor].append(kept_id)
+        for gram in grams:
+            self._grams[gram].append(kept_id)
+
+    def add_if_new(self, job: Dict) -> bool:
+        """
+        Add a job unless it duplicates one already in the index
+
+        Returns:
+            bool: True if the job was added
+        """
+        if self.is_duplicate(job):
+            return False
+        self.add(job)
+        return True
+
+class SimilarityIndex:
+    """
+    Duplicate index with the rules of utils.filters._is_duplicate
+
+    Two jobs are duplicates if they share a URL, or both their titles and
+    their companies have a SequenceMatcher ratio above the threshold.
+
+    A ratio above the threshold bounds how different two lengths can be, so
+    kept jobs are blocked by title length and only jobs within that window
+    are compared, cheapest checks first.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.85):
+        self.similarity_threshold = similarity_threshold
+        self._urls = set()
+        self._by_length = defaultdict(list)  # Title length -> (title, company, job)
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _length_window(self, length: int) -> range:
+        """Title lengths whose best possible ratio with `length` beats the threshold"""
+        # ratio <= 2 * min(a, b) / (a + b)
+        ratio = self.similarity_threshold
+        low = int(length * ratio / (2 - ratio))
+        high = int(length * (2 - ratio) / ratio) + 1
+        return range(max(1, low), high + 1)
+
+    def _similar(self, text1: str, text2: str) -> bool:
+        """Same test as _text_similarity(text1, text2) > threshold"""
+        matcher = SequenceMatcher(None, text1, text2)
+        return (
+            matcher.real_quick_ratio() > self.similarity_threshold and
+            matcher.quick_ratio() > self.similarity_threshold and
+            matcher.ratio() > self.similarity_threshold
+        )
+
+    def is_duplicate(self, job: Dict) -> bool:
+        """Check whether a job duplicates any job already in the index"""
+        if job["url"] in self._urls:
+            return True
+
+        title = (job["title"] or "").lower()
+        company = (job.get("company") or "").lower()
+        if not title or not company:
+            # An empty string has zero similarity
+            return False
+
+        for length in self._length_window(len(title)):
+            for kept_title, kept_company, kept_job in self._by_length.get(length, ()):
+                if not kept_company:
+                    continue
+                if self._similar(title, kept_title) and self._similar(company, kept_company):
+                    logger.debug(
+                        f"Found duplicate: {job['title']} at {job.get('company', 'Unknown')}"
+                        f" (matches {kept_job['title']} at {kept_job.get('company', 'Unknown')})"
+                    )
+                    return True
+        return False
+
+    def add(self, job: Dict):
+        """Add a job to the index without checking it"""
+        self._urls.add(job["url"])
+        title = (job["title"] or "").lower()
+        company = (job.get("company") or "").lower()
+        self._by_length[len(title)].append((title, company, job))
+        self._count += 1
+
+    def add_if_new(self, job: Dict) -> bool:
+        """
+        Add a job unless it duplicates one already in the index
+
+        Returns:
+            bool: True if the job was added
+        """
+        if self.is_duplicate(job):
+            return False
+        self.add(job)
+        return True
@@ -0,0 +1,241 @@
+"""
+Streaming exporters for job results.
+
+Writers consume jobs one at a time and write through a large buffer, so
+exporting a big scan never holds more than one row's output in memory.
+CSV, JSON, JSON Lines and (with pyarrow) Parquet are supported, with
+optional gzip or zstd (with zstandard) compression.
+"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Columns written to CSV and Parquet unless the caller picks its own
+EXPORT_FIELDS = (
+    "title", "company", "location", "type", "source", "salary",
+    "posted_date", "url", "description", "category", "id"
+)
+
+# Output buffer between the formatter and the file or compressor
+BUFFER_SIZE = 1024 * 1024
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Parquet rows buffered per row group
+PARQUET_BATCH_SIZE = 10000
+
+# File suffix -> compression
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+def _json_default(value):
+    """JSON encoding for values json can't handle, e.g. NumPy scalars"""
+    item = getattr(value, "item", None)
+    if callable(item):
+        return item()
+    return str(value)
+
+def _open_text(path: Path, compression: Optional[str]):
+    """Buffered text stream writing to `path`, compressed if requested"""
+    if compression == "gzip":
+        binary = gzip.GzipFile(path, "wb", compresslevel=GZIP_LEVEL)
+    elif compression == "zstd":
+        if zstandard is None:
+            raise ImportError("zstd compression needs the zstandard package (pip install zstandard)")
+        binary = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(
+            open(path, "wb"), closefd=True, write_return_read=True
+        )
+    elif compression is None:
+        binary = open(path, "wb", buffering=0)
+    else:
+        raise ValueError(f"Unsupported compression: {compression}")
+    return io.TextIOWrapper(io.BufferedWriter(binary, BUFFER_SIZE), encoding="utf-8", newline="")
+
+class JobWriter(ABC):
+    """Base class for streaming writers; use as a context manager"""
+
+    def __init__(self, path: Union[str, Path], compression: Optional[str] = None,
+                 fields: Optional[Sequence[str]] = None):
+        """
+        Args:
+            path (str | Path): Output file
+            compression (str, optional): "gzip" or "zstd"
+            fields (Sequence[str], optional): Columns for tabular formats
+        """
+        self.path = Path(path)
+        self.compression = compression
+        self.fields = tuple(fields or EXPORT_FIELDS)
+        self.count = 0
+
+    @abstractmethod
+    def write(self, job: Dict):
+        """Write one job"""
+        pass
+
+    def write_all(self, jobs: Iterable[Dict]) -> int:
+        """Write every job from an iterable, returning the number written"""
+        for job in jobs:
+            self.write(job)
+        return self.count
+
+    @abstractmethod
+    def close(self):
+        """Flush buffered output and close the file"""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class CsvWriter(JobWriter):
+    """CSV with a header row; keys outside `fields` are dropped"""
+
+    def __init__(self, path, compression=None, fields=None):
+        super().__init__(path, compression, fields)
+        self._stream = _open_text(self.path, compression)
+        self._writer = csv.DictWriter(self._stream, fieldnames=self.fields, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def write(self, job):
+        self._writer.writerow(job)
+        self.count += 1
+
+    def close(self):
+        self._stream.close()
+
+class JsonLinesWriter(JobWriter):
+    """One JSON object per line with every key of the job"""
+
+    def __init__(self, path, compression=None, fields=None):
+        super().__init__(path, compression, fields)
+        self._stream = _open_text(self.path, compression)
+
+    def write(self, job):
+        self._stream.write(json.dumps(dict(job), ensure_ascii=False, default=_json_default))
+        self._stream.write("\n")
+        self.count += 1
+
+    def close(self):
+        self._stream.close()
+
+class JsonWriter(JsonLinesWriter):
+    """A JSON array of job objects, written element by element"""
+
+    def __init__(self, path, compression=None, fields=None):
+        super().__init__(path, compression, fields)
+        self._stream.write("[")
+
+    def write(self, job):
+        self._stream.write(",\n  " if self.count else "\n  ")
+        self._stream.write(json.dumps(dict(job), ensure_ascii=False, default=_json_default))
+        self.count += 1
+
+    def close(self):
+        self._stream.write("\n]\n" if self.count else "]\n")
+        self._stream.close()
+
+class ParquetWriter(JobWriter):
+    """
+    Parquet with one string column per field, written in row groups
+
+    Compression is applied by Parquet itself per column chunk.
+    """
+
+    def __init__(self, path, compression=None, fields=None):
+        super().__init__(path, compression, fields)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export needs the pyarrow package (pip install pyarrow)") from None
+        self._pa = pa
+        self._schema = pa.schema([(field, pa.string()) for field in self.fields])
+        self._writer = pq.ParquetWriter(str(self.path), self._schema, compression=compression or "snappy")
+        self._columns = {field: [] for field in self.fields}
+
+    def write(self, job):
+        for field, column in self._columns.items():
+            value = job.get(field)
+            column.append(None if value is None else str(value))
+        self.count += 1
+        if self.count % PARQUET_BATCH_SIZE == 0:
+            self._flush()
+
+    def _flush(self):
+        if self._columns[self.fields[0]]:
+            self._writer.write_table(self._pa.table(self._columns, schema=self._schema))
+            self._columns = {field: [] for field in self.fields}
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+# Format name -> writer class
+WRITERS = {
+    "csv": CsvWriter,
+    "json": JsonWriter,
+    "jsonl": JsonLinesWriter,
+    "parquet": ParquetWriter,
+}
+
+def infer_format(path: Union[str, Path]):
+    """
+    Guess the format and compression from a file name
+
+    Args:
+        path (str | Path): e.g. "outputs/jobs.jsonl.gz"
+
+    Returns:
+        tuple: (format or None, compression or None)
+    """
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+    compression = COMPRESSION_SUFFIXES.get(suffixes[-1]) if suffixes else None
+    if compression:
+        suffixes = suffixes[:-1]
+    format = suffixes[-1].lstrip(".") if suffixes else None
+    return (format if format in WRITERS else None), compression
+
+def export_jobs(jobs: Iterable[Dict], path: Union[str, Path], format: Optional[str] = None,
+                compression: Optional[str] = None, fields: Optional[Sequence[str]] = None) -> int:
+    """
+    Stream jobs to a file
+
+    Args:
+        jobs (Iterable[Dict]): Jobs or job dicts, e.g. a JobSearch.stream()
+        path (str | Path): Output file; missing directories are created
+        format (str, optional): "csv", "json", "jsonl" or "parquet"
+            (default: from the file name)
+        compression (str, optional): "gzip" or "zstd" (default: from a
+            .gz/.zst suffix)
+        fields (Sequence[str], optional): Columns for CSV and Parquet
+
+    Returns:
+        int: Number of jobs written
+    """
+    inferred_format, inferred_compression = infer_format(path)
+    format = format or inferred_format
+    compression = compression or inferred_compression
+    if format not in WRITERS:
+        raise ValueError(f"Unsupported export format: {format}")
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with WRITERS[format](path, compression=compression, fields=fields) as writer:
+        count = writer.write_all(jobs)
+
+    logger.info(f"Exported {count} jobs to {path}")
+    return count
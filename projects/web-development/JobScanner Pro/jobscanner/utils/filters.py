@@ -6,6 +6,8 @@ import logging
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 
+from .dedup import SimilarityIndex
+
 logger = logging.getLogger(__name__)
 
 def filter_jobs(jobs, gigs_only=False, new_only=False):
@@ -97,16 +99,12 @@ def deduplicate_jobs(jobs):
     Returns:
         list: Deduplicated list of jobs
     """
+    index = SimilarityIndex()
     unique_jobs = []
     
     for job in jobs:
-        # Check against all existing unique jobs
-        is_duplicate = any(
-            _is_duplicate(job, existing_job) 
-            for existing_job in unique_jobs
-        )
-        
-        if not is_duplicate:
+        # Only jobs within the title length window are compared
+        if index.add_if_new(job):
             unique_jobs.append(job)
     
     duplicates_removed = len(jobs) - len(unique_jobs)
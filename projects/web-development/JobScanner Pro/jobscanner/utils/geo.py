@@ -0,0 +1,349 @@
+"""
+Offline geocoding and radius filtering for job locations.
+
+Locations are resolved against a small built-in gazetteer of Canadian
+places, so radius filtering works for any base location without a
+geocoding service.
+"""
+
+import logging
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+# (name, province, latitude, longitude, extent in km from the centre to the
+# edge of the built-up area). Names are normalized: lowercase ASCII, no
+# punctuation. Distances are measured to the nearest edge, so a posting
+# anywhere in Toronto counts as in range of a base within `extent` km.
+PLACES = [
+    # Greater Toronto Area
+    ("toronto", "ON", 43.6532, -79.3832, 15),
+    ("north york", "ON", 43.7615, -79.4111, 6),
+    ("scarborough", "ON", 43.7764, -79.2318, 7),
+    ("etobicoke", "ON", 43.6435, -79.5650, 6),
+    ("east york", "ON", 43.6910, -79.3280, 3),
+    ("york", "ON", 43.6896, -79.4792, 3),
+    ("brampton", "ON", 43.7315, -79.7624, 8),
+    ("bramalea", "ON", 43.7155, -79.7270, 3),
+    ("mississauga", "ON", 43.5890, -79.6441, 10),
+    ("malton", "ON", 43.7087, -79.6386, 2),
+    ("vaughan", "ON", 43.8361, -79.4983, 8),
+    ("woodbridge", "ON", 43.7826, -79.5950, 3),
+    ("concord", "ON", 43.7990, -79.4823, 2),
+    ("thornhill", "ON", 43.8150, -79.4240, 3),
+    ("markham", "ON", 43.8561, -79.3370, 8),
+    ("richmond hill", "ON", 43.8828, -79.4403, 5),
+    ("king city", "ON", 43.9290, -79.5280, 2),
+    ("aurora", "ON", 44.0065, -79.4504, 3),
+    ("newmarket", "ON", 44.0592, -79.4613, 4),
+    ("stouffville", "ON", 43.9706, -79.2440, 3),
+    ("caledon", "ON", 43.8668, -79.8585, 10),
+    ("bolton", "ON", 43.8751, -79.7349, 2),
+    ("georgetown", "ON", 43.6526, -79.9180, 3),
+    ("halton hills", "ON", 43.6300, -79.9500, 6),
+    ("milton", "ON", 43.5183, -79.8774, 6),
+    ("oakville", "ON", 43.4675, -79.6877, 7),
+    ("burlington", "ON", 43.3255, -79.7990, 7),
+    ("hamilton", "ON", 43.2557, -79.8711, 10),
+    ("pickering", "ON", 43.8384, -79.0868, 6),
+    ("ajax", "ON", 43.8509, -79.0204, 4),
+    ("whitby", "ON", 43.8975, -78.9429, 5),
+    ("oshawa", "ON", 43.8971, -78.8658, 6),
+    ("bowmanville", "ON", 43.9126, -78.6878, 3),
+    ("uxbridge", "ON", 44.1090, -79.1200, 2),
+    # Rest of Ontario
+    ("orangeville", "ON", 43.9200, -80.0943, 3),
+    ("guelph", "ON", 43.5448, -80.2482, 5),
+    ("kitchener", "ON", 43.4516, -80.4925, 6),
+    ("waterloo", "ON", 43.4643, -80.5204, 5),
+    ("cambridge", "ON", 43.3616, -80.3144, 5),
+    ("brantford", "ON", 43.1394, -80.2644, 4),
+    ("grimsby", "ON", 43.2001, -79.5663, 2),
+    ("st catharines", "ON", 43.1594, -79.2469, 5),
+    ("niagara falls", "ON", 43.0896, -79.0849, 5),
+    ("welland", "ON", 42.9922, -79.2483, 3),
+    ("barrie", "ON", 44.3894, -79.6903, 6),
+    ("bradford", "ON", 44.1140, -79.5600, 2),
+    ("innisfil", "ON", 44.3000, -79.5833, 4),
+    ("orillia", "ON", 44.6082, -79.4197, 3),
+    ("collingwood", "ON", 44.5008, -80.2169, 3),
+    ("peterborough", "ON", 44.3091, -78.3197, 5),
+    ("woodstock", "ON", 43.1306, -80.7467, 3),
+    ("stratford", "ON", 43.3700, -80.9822, 3),
+    ("london", "ON", 42.9849, -81.2453, 8),
+    ("sarnia", "ON", 42.9745, -82.4066, 4),
+    ("chatham", "ON", 42.4048, -82.1910, 3),
+    ("windsor", "ON", 42.3149, -83.0364, 7),
+    ("kingston", "ON", 44.2312, -76.4860, 5),
+    ("belleville", "ON", 44.1628, -77.3832, 3),
+    ("ottawa", "ON", 45.4215, -75.6972, 15),
+    ("cornwall", "ON", 45.0213, -74.7303, 3),
+    ("north bay", "ON", 46.3091, -79.4608, 3),
+    ("sudbury", "ON", 46.4917, -80.9930, 6),
+    ("sault ste marie", "ON", 46.5136, -84.3358, 4),
+    ("timmins", "ON", 48.4758, -81.3305, 3),
+    ("thunder bay", "ON", 48.3809, -89.2477, 5),
+    # Quebec
+    ("montreal", "QC", 45.5019, -73.5674, 12),
+    ("laval", "QC", 45.6066, -73.7124, 8),
+    ("longueuil", "QC", 45.5312, -73.5181, 5),
+    ("gatineau", "QC", 45.4765, -75.7013, 8),
+    ("quebec city", "QC", 46.8139, -71.2080, 10),
+    ("levis", "QC", 46.8033, -71.1779, 5),
+    ("sherbrooke", "QC", 45.4042, -71.8929, 5),
+    ("trois rivieres", "QC", 46.3432, -72.5421, 5),
+    ("saguenay", "QC", 48.4284, -71.0686, 6),
+    # Atlantic Canada
+    ("halifax", "NS", 44.6488, -63.5752, 8),
+    ("dartmouth", "NS", 44.6713, -63.5772, 4),
+    ("sydney", "NS", 46.1368, -60.1942, 3),
+    ("moncton", "NB", 46.0878, -64.7782, 4),
+    ("saint john", "NB", 45.2733, -66.0633, 4),
+    ("fredericton", "NB", 45.9636, -66.6431, 4),
+    ("charlottetown", "PE", 46.2382, -63.1311, 3),
+    ("st johns", "NL", 47.5615, -52.7126, 5),
+    # Prairies
+    ("winnipeg", "MB", 49.8951, -97.1384, 10),
+    ("brandon", "MB", 49.8485, -99.9501, 3),
+    ("regina", "SK", 50.4452, -104.6189, 7),
+    ("saskatoon", "SK", 52.1332, -106.6700, 8),
+    ("calgary", "AB", 51.0447, -114.0719, 15),
+    ("edmonton", "AB", 53.5461, -113.4938, 12),
+    ("red deer", "AB", 52.2690, -113.8116, 4),
+    ("lethbridge", "AB", 49.6956, -112.8451, 4),
+    ("medicine hat", "AB", 50.0405, -110.6766, 4),
+    ("fort mcmurray", "AB", 56.7268, -111.3790, 4),
+    # British Columbia
+    ("vancouver", "BC", 49.2827, -123.1207, 7),
+    ("burnaby", "BC", 49.2488, -122.9805, 5),
+    ("richmond", "BC", 49.1666, -123.1336, 5),
+    ("surrey", "BC", 49.1913, -122.8490, 8),
+    ("coquitlam", "BC", 49.2838, -122.7932, 4),
+    ("langley", "BC", 49.1044, -122.6604, 5),
+    ("abbotsford", "BC", 49.0504, -122.3045, 5),
+    ("victoria", "BC", 48.4284, -123.3656, 5),
+    ("nanaimo", "BC", 49.1659, -123.9401, 4),
+    ("kelowna", "BC", 49.8880, -119.4960, 5),
+    ("kamloops", "BC", 50.6745, -120.3273, 4),
+    ("prince george", "BC", 53.9171, -122.7497, 4),
+    # Territories
+    ("whitehorse", "YT", 60.7212, -135.0568, 3),
+    ("yellowknife", "NT", 62.4540, -114.3718, 3),
+    ("iqaluit", "NU", 63.7467, -68.5170, 2),
+]
+
+# Names that cover a whole region; postings there are kept since they are
+# often remote or unspecific
+REGIONS = [
+    "canada", "ontario", "british columbia", "alberta",
+    "saskatchewan", "manitoba", "nova scotia", "new brunswick",
+    "newfoundland", "prince edward island", "gta", "greater toronto",
+    "peel region", "york region", "durham region", "halton region"
+]
+
+# Keywords for postings that are kept regardless of distance
+REMOTE_KEYWORDS = ["remote", "work from home", "wfh", "virtual"]
+
+# Province and territory names, normalized, by code
+PROVINCES = {
+    "ON": "ontario", "QC": "quebec", "NS": "nova scotia", "NB": "new brunswick",
+    "PE": "prince edward island", "NL": "newfoundland", "MB": "manitoba",
+    "SK": "saskatchewan", "AB": "alberta", "BC": "british columbia",
+    "YT": "yukon", "NT": "northwest territories", "NU": "nunavut",
+}
+
+# US state codes. "CA" is left out since it often stands for Canada
+US_STATES = [
+    "al", "ak", "az", "ar", "co", "ct", "de", "dc", "fl", "ga", "hi", "id",
+    "il", "in", "ia", "ks", "ky", "la", "me", "md", "ma", "mi", "mn", "ms",
+    "mo", "mt", "ne", "nv", "nh", "nj", "nm", "ny", "nc", "nd", "oh", "ok",
+    "or", "pa", "ri", "sc", "sd", "tn", "tx", "ut", "vt", "va", "wa", "wv",
+    "wi", "wy",
+]
+
+# Countries, and cities named after Canadian places, marking a posting
+# outside Canada
+FOREIGN_PLACES = [
+    "usa", "united states", "united kingdom", "uk", "england", "scotland",
+    "wales", "ireland", "france", "germany", "spain", "portugal", "italy",
+    "netherlands", "belgium", "switzerland", "austria", "sweden", "norway",
+    "denmark", "finland", "poland", "greece", "turkey", "israel", "uae",
+    "united arab emirates", "saudi arabia", "qatar", "egypt", "nigeria",
+    "ghana", "kenya", "south africa", "australia", "new zealand", "india",
+    "pakistan", "bangladesh", "sri lanka", "china", "hong kong", "japan",
+    "korea", "singapore", "malaysia", "indonesia", "vietnam", "thailand",
+    "philippines", "mexico", "brazil", "argentina", "chile", "colombia",
+    "peru", "new york", "new london",
+]
+
+_PLACES = {name: (lat, lon, extent) for name, _, lat, lon, extent in PLACES}
+_PLACE_PROVINCES = {name: province for name, province, _, _, _ in PLACES}
+
+# Province or state named right after a place, e.g. "york on" or "york ny"
+_SUFFIXES = {code.lower(): code for code in PROVINCES}
+_SUFFIXES.update({name: code for code, name in PROVINCES.items()})
+_SUFFIXES.update({state: state.upper() for state in US_STATES})
+
+def _alternation(names: List[str]) -> "re.Pattern":
+    """Whole-word regex matching any of the names, longest first"""
+    names = sorted(names, key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(re.escape(name) for name in names) + r")\b")
+
+_PLACE_RE = re.compile(
+    _alternation(list(_PLACES)).pattern +
+    r"(?:\s+(?P<suffix>" + _alternation(list(_SUFFIXES)).pattern + r"))?"
+)
+_REGION_RE = _alternation(REGIONS)
+# Regions that aren't provinces, dropped before place lookups
+_SUBREGION_RE = _alternation([name for name in REGIONS if name not in _SUFFIXES])
+_REMOTE_RE = _alternation(REMOTE_KEYWORDS)
+# A foreign place name anywhere, or a state code (and ZIP code) at the end
+_FOREIGN_RE = re.compile(
+    _alternation(FOREIGN_PLACES).pattern + "|" +
+    _alternation(US_STATES).pattern + r"(?:\s+\d{5})?$"
+)
+
+def normalize_location(location: str) -> str:
+    """
+    Normalize a location string for gazetteer lookups
+
+    Lowercases, strips accents and apostrophes, and turns other punctuation
+    into spaces, e.g. "St. John's, NL" -> "st johns nl".
+    """
+    text = unicodedata.normalize("NFKD", location or "")
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    text = text.lower().replace("'", "").replace("’", "")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+@lru_cache(maxsize=4096)
+def _resolve_normalized(location: str) -> Optional[Tuple[float, float, float]]:
+    """Coordinates of the most specific place named in a normalized location"""
+    # Places abroad share names with Canadian ones, e.g. London, UK
+    if _FOREIGN_RE.search(location):
+        return None
+    # Drop region names first so "York Region" doesn't resolve to York
+    location = _SUBREGION_RE.sub(" ", location)
+    matches = []
+    for match in _PLACE_RE.finditer(location):
+        name, suffix = match.group(0), match.group("suffix")
+        if suffix:
+            name = name[:-len(suffix)].rstrip()
+        # A different province or state names another place, e.g. the York
+        # in "New York, NY" is not York, ON
+        if suffix and _SUFFIXES[suffix] != _PLACE_PROVINCES[name]:
+            continue
+        matches.append(_PLACES[name])
+    if not matches:
+        return None
+    # "Toronto (North York)" resolves to North York
+    return min(matches, key=lambda place: place[2])
+
+def resolve_location(location: str) -> Optional[Tuple[float, float, float]]:
+    """
+    Look up a location in the gazetteer
+
+    Args:
+        location (str): Free-form location, e.g. "Brampton (ON)"
+
+    Returns:
+        Optional[Tuple[float, float, float]]: (latitude, longitude, extent_km),
+            or None if no known place is named or the location is abroad
+    """
+    return _resolve_normalized(normalize_location(location))
+
+def haversine_km(lat, lon, base_lat: float, base_lon: float) -> np.ndarray:
+    """
+    Great-circle distance in km from a base point to arrays of points
+
+    Args:
+        lat, lon: Latitudes and longitudes in degrees (scalars or arrays)
+        base_lat (float): Base latitude in degrees
+        base_lon (float): Base longitude in degrees
+
+    Returns:
+        np.ndarray: Distances in km
+    """
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    base_lat = np.radians(base_lat)
+    base_lon = np.radians(base_lon)
+    a = (np.sin((lat - base_lat) / 2) ** 2 +
+         np.cos(lat) * np.cos(base_lat) * np.sin((lon - base_lon) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+def _keep_unresolved(location: str) -> bool:
+    """Whether to keep a posting whose location names no known place"""
+    if _REMOTE_RE.search(location):
+        return True
+    # Places in the US or abroad are outside any radius
+    if _FOREIGN_RE.search(location):
+        return False
+    return bool(
+        _REGION_RE.search(location) or
+        # Many job sites don't specify an exact city
+        len(location.split()) <= 2
+    )
+
+def filter_by_radius(jobs: List[Dict],
+                     base_location: str,
+                     min_radius: Optional[float] = None,
+                     max_radius: Optional[float] = None) -> List[Dict]:
+    """
+    Filter jobs by distance from a base location
+
+    All resolved postings are measured in one vectorized pass. Remote
+    postings, region-wide postings and postings without a recognizable
+    city are kept; unknown places in the US or abroad are dropped.
+
+    Args:
+        jobs (List[Dict]): List of job dictionaries
+        base_location (str): Base location to filter from
+        min_radius (float, optional): Minimum radius in km
+        max_radius (float, optional): Maximum radius in km
+
+    Returns:
+        List[Dict]: Filtered list of jobs
+    """
+    base = resolve_location(base_location)
+    if base is None:
+        logger.warning(f"Unknown base location '{base_location}'; skipping radius filter")
+        return list(jobs)
+
+    keep = np.zeros(len(jobs), dtype=bool)
+    resolved_index = []
+    coordinates = []
+    for i, job in enumerate(jobs):
+        location = normalize_location(job.get("location", ""))
+        if _REMOTE_RE.search(location):
+            keep[i] = True
+            continue
+        place = _resolve_normalized(location)
+        if place is None:
+            keep[i] = _keep_unresolved(location)
+        else:
+            resolved_index.append(i)
+            coordinates.append(place)
+
+    if coordinates:
+        lat, lon, extent = np.array(coordinates, dtype=float).T
+        distances = np.maximum(haversine_km(lat, lon, base[0], base[1]) - extent, 0.0)
+        in_range = np.ones(len(distances), dtype=bool)
+        if min_radius is not None:
+            in_range &= distances >= min_radius
+        if max_radius is not None:
+            in_range &= distances <= max_radius
+        keep[resolved_index] = in_range
+
+    filtered = [job for job, kept in zip(jobs, keep) if kept]
+    logger.info(
+        f"Location filter: {len(jobs)} → {len(filtered)} jobs "
+        f"(base: {base_location}, radius: {max_radius}km)"
+    )
+    return filtered
@@ -5,60 +5,85 @@ Handles various salary formats and provides filtering capabilities
 
 import re
 import logging
-from typing import Optional, Tuple, Dict, List
+from functools import lru_cache
+from typing import Optional, Dict, List
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# A dollar amount: "50,000", "17.20", "45"
+_AMOUNT = r'\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?'
+
+# One pattern for every supported format, e.g. "$17.20 hourly",
+# "$25.00 to $30.00 hourly", "$50,000 per year", "$40K-60K", "$20/hr",
+# "$200 daily", "$1,200 per week"
+SALARY_PATTERN = re.compile(
+    r'\$\s*(?P<min>' + _AMOUNT + r')\s*(?P<min_k>k\b)?'
+    r'(?:\s*(?:to|-|–|—)\s*\$?\s*(?P<max>' + _AMOUNT + r')\s*(?P<max_k>k\b)?)?'
+    r'(?:\s*(?:/|per\b|an\b|a\b)?\s*'
+    r'(?:(?P<hourly>hourly|hour|hr)|(?P<daily>daily|day)|(?P<weekly>weekly|week|wk)'
+    r'|(?P<annually>annually|annual|year|yr)|(?P<monthly>monthly|month))\b)?',
+    re.IGNORECASE
+)
+
+# Period words anywhere in the text, used when none follows the amount
+PERIOD_PATTERN = re.compile(
+    r'(?P<hourly>hour|hr)|(?P<daily>daily|(?:per|a|/)\s*day\b)|(?P<weekly>weekly|(?:per|a|/)\s*week\b)'
+    r'|(?P<annually>year|annual)|(?P<monthly>month)',
+    re.IGNORECASE
+)
+
+# Words that indicate negotiable/flexible salary
+NEGOTIABLE_KEYWORDS = [
+    'negotiable', 'competitive', 'commensurate', 'dependent on experience',
+    'doe', 'tbd', 'to be determined', 'flexible', 'open'
+]
+
+NEGOTIABLE_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in NEGOTIABLE_KEYWORDS))
+
+# Salary text that means no salary was given
+MISSING_SALARY = {'', 'not specified', 'n/a'}
+
+# Multipliers to annual amounts (8 hours/day, 5 days/week, 52 weeks/year)
+PERIOD_TO_ANNUAL = {
+    'hourly': 40 * 52,
+    'daily': 5 * 52,
+    'weekly': 52,
+    'monthly': 12,
+    'annually': 1
+}
+
 class SalaryParser:
     """Parse and normalize salary information from job postings"""
     
+    # Distinct salary strings remembered by parse_salary
+    CACHE_SIZE = 4096
+    
     def __init__(self):
-        # Salary patterns for different formats
-        self.salary_patterns = [
-            # Hourly rates
-            r'\$(\d+(?:\.\d{2})?)\s*(?:to|-)?\s*\$?(\d+(?:\.\d{2})?)\s*(?:per\s*)?(?:hour|hr|hourly)',
-            r'\$(\d+(?:\.\d{2})?)\s*(?:per\s*)?(?:hour|hr|hourly)',
-            
-            # Annual salaries
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:to|-)?\s*\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s*)?(?:year|annual|annually)',
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s*)?(?:year|annual|annually)',
-            
-            # K format (e.g., $50K, $40K-60K)
-            r'\$(\d+)k?\s*(?:to|-)?\s*\$?(\d+)k\s*(?:per\s*)?(?:year|annual|annually)?',
-            r'\$(\d+)k\s*(?:per\s*)?(?:year|annual|annually)?',
-            
-            # Range without specific period
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:to|-)?\s*\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',
-            
-            # Monthly
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:to|-)?\s*\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s*)?(?:month|monthly)',
-            r'\$(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\s*(?:per\s*)?(?:month|monthly)',
-        ]
-        
-        # Words that indicate negotiable/flexible salary
-        self.negotiable_keywords = [
-            'negotiable', 'competitive', 'commensurate', 'dependent on experience',
-            'doe', 'tbd', 'to be determined', 'flexible', 'open'
-        ]
+        # Many postings share the same salary text ("$17.20 hourly")
+        self._parse_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._parse_salary_text)
     
     def parse_salary(self, salary_text: str) -> Dict:
         """
         Parse salary text and return normalized information
         
+        Results are memoized on the raw text; each call returns a fresh copy.
+        
         Returns:
             Dict with keys: min_amount, max_amount, period, currency, is_range, is_negotiable, raw_text
         """
         if not salary_text:
             return {}
-        
+        return dict(self._parse_cached(salary_text))
+    
+    def _parse_salary_text(self, salary_text: str) -> Dict:
+        """Parse salary text with a single pass of the compiled pattern"""
         salary_text = salary_text.lower().strip()
         
-        # Check if salary is negotiable
-        is_negotiable = any(keyword in salary_text for keyword in self.negotiable_keywords)
-        
         result = {
             'raw_text': salary_text,
-            'is_negotiable': is_negotiable,
+            'is_negotiable': bool(NEGOTIABLE_PATTERN.search(salary_text)),
             'currency': 'CAD',  # Assume CAD for Canadian job sites
             'min_amount': None,
             'max_amount': None,
@@ -66,63 +91,48 @@ class SalaryParser:
             'is_range': False
         }
         
-        # Try to extract salary amounts
-        for pattern in self.salary_patterns:
-            match = re.search(pattern, salary_text, re.IGNORECASE)
-            if match:
-                try:
-                    groups = match.groups()
-                    
-                    # Determine period from pattern
-                    if 'hour' in pattern or 'hr' in pattern:
-                        result['period'] = 'hourly'
-                    elif 'year' in pattern or 'annual' in pattern:
-                        result['period'] = 'annually'
-                    elif 'month' in pattern:
-                        result['period'] = 'monthly'
-                    else:
-                        # Try to infer from the text context
-                        if any(word in salary_text for word in ['hour', 'hr', 'hourly']):
-                            result['period'] = 'hourly'
-                        elif any(word in salary_text for word in ['year', 'annual', 'annually']):
-                            result['period'] = 'annually'
-                        elif any(word in salary_text for word in ['month', 'monthly']):
-                            result['period'] = 'monthly'
-                        else:
-                            # Default assumption based on amount
-                            amount1 = self._parse_amount(groups[0])
-                            if amount1 and amount1 < 100:
-                                result['period'] = 'hourly'
-                            elif amount1 and amount1 > 1000:
-                                result['period'] = 'annually'
-                            else:
-                                result['period'] = 'hourly'  # Default
-                    
-                    # Parse amounts
-                    if len(groups) >= 1 and groups[0]:
-                        result['min_amount'] = self._parse_amount(groups[0])
-                        
-                        if len(groups) >= 2 and groups[1]:
-                            result['max_amount'] = self._parse_amount(groups[1])
-                            result['is_range'] = True
-                        else:
-                            result['max_amount'] = result['min_amount']
-                    
-                    # Handle K format
-                    if 'k' in pattern.lower():
-                        if result['min_amount']:
-                            result['min_amount'] *= 1000
-                        if result['max_amount']:
-                            result['max_amount'] *= 1000
-                    
-                    break
-                    
-                except (ValueError, AttributeError) as e:
-                    logger.debug(f"Error parsing salary pattern: {e}")
-                    continue
+        match = SALARY_PATTERN.search(salary_text)
+        if not match:
+            return result
+        
+        min_amount = self._parse_amount(match.group('min'))
+        max_amount = self._parse_amount(match.group('max'))
+        
+        # Handle K format; "$40-60k" applies the k to both ends
+        if match.group('max_k') and max_amount is not None:
+            max_amount *= 1000
+            if not match.group('min_k') and min_amount is not None and min_amount < 1000:
+                min_amount *= 1000
+        if match.group('min_k') and min_amount is not None:
+            min_amount *= 1000
         
+        result['min_amount'] = min_amount
+        if max_amount is not None:
+            result['max_amount'] = max_amount
+            result['is_range'] = True
+        else:
+            result['max_amount'] = min_amount
+        
+        result['period'] = self._match_period(match) or self._infer_period(salary_text, min_amount)
         return result
     
+    @staticmethod
+    def _match_period(match) -> Optional[str]:
+        """Name of the period group that matched, if any"""
+        for period in PERIOD_TO_ANNUAL:
+            if match.group(period):
+                return period
+        return None
+    
+    def _infer_period(self, salary_text: str, amount: Optional[float]) -> str:
+        """Infer the period from the rest of the text, or from the amount"""
+        match = PERIOD_PATTERN.search(salary_text)
+        if match:
+            return self._match_period(match)
+        if amount and amount > 1000:
+            return 'annually'
+        return 'hourly'  # Default
+    
     def _parse_amount(self, amount_str: str) -> Optional[float]:
         """Parse amount string to float"""
         if not amount_str:
@@ -143,15 +153,8 @@ class SalaryParser:
         result = salary_data.copy()
         period = salary_data.get('period', 'annually')
         
-        if period == 'hourly':
-            # Assume 40 hours/week, 52 weeks/year
-            multiplier = 40 * 52
-            if result['min_amount']:
-                result['min_annual'] = result['min_amount'] * multiplier
-            if result['max_amount']:
-                result['max_annual'] = result['max_amount'] * multiplier
-        elif period == 'monthly':
-            multiplier = 12
+        if period in PERIOD_TO_ANNUAL and period != 'annually':
+            multiplier = PERIOD_TO_ANNUAL[period]
             if result['min_amount']:
                 result['min_annual'] = result['min_amount'] * multiplier
             if result['max_amount']:
@@ -162,16 +165,72 @@ class SalaryParser:
         
         return result
     
+    def salary_columns(self, jobs: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Parse job salaries into columnar arrays
+        
+        Each distinct salary string is parsed once; jobs share its row
+        through an index array.
+        
+        Args:
+            jobs: List of job dictionaries
+        
+        Returns:
+            Dict of equal-length arrays: has_salary (bool), min_annual and
+            max_annual (float, NaN when unknown), period (object), and
+            parsed_index (row of each job in `parsed`), plus the list of
+            distinct parsed salaries as `parsed`
+        """
+        distinct = {}
+        parsed_index = np.fromiter(
+            (distinct.setdefault(job.get('salary') or '', len(distinct)) for job in jobs),
+            dtype=np.intp,
+            count=len(jobs)
+        )
+        
+        parsed = []
+        has_salary = np.zeros(len(distinct), dtype=bool)
+        min_annual = np.full(len(distinct), np.nan)
+        max_annual = np.full(len(distinct), np.nan)
+        period = np.empty(len(distinct), dtype=object)
+        
+        for row, salary_text in enumerate(distinct):
+            if salary_text.lower() in MISSING_SALARY:
+                parsed.append({})
+                continue
+            salary_data = self.parse_salary(salary_text)
+            parsed.append(salary_data)
+            has_salary[row] = True
+            period[row] = salary_data.get('period')
+            multiplier = PERIOD_TO_ANNUAL.get(salary_data.get('period'), 1)
+            if salary_data.get('min_amount'):
+                min_annual[row] = salary_data['min_amount'] * multiplier
+            if salary_data.get('max_amount'):
+                max_annual[row] = salary_data['max_amount'] * multiplier
+        
+        return {
+            'has_salary': has_salary[parsed_index],
+            'min_annual': min_annual[parsed_index],
+            'max_annual': max_annual[parsed_index],
+            'period': period[parsed_index],
+            'parsed_index': parsed_index,
+            'parsed': parsed
+        }
+    
     def filter_jobs_by_salary(self, jobs: List[Dict], min_salary: Optional[float] = None, 
                              max_salary: Optional[float] = None, salary_period: str = 'annually') -> List[Dict]:
         """
         Filter jobs based on salary criteria
         
+        Salaries are compared as annual amounts with array masks over
+        salary_columns(), so the bounds are applied to every job at once.
+        
         Args:
             jobs: List of job dictionaries
             min_salary: Minimum salary requirement
             max_salary: Maximum salary limit
-            salary_period: Period for comparison ('hourly', 'annually', 'monthly')
+            salary_period: Period for comparison ('hourly', 'daily', 'weekly',
+                'monthly' or 'annually')
         
         Returns:
             Filtered list of jobs
@@ -179,68 +238,33 @@ class SalaryParser:
         if not min_salary and not max_salary:
             return jobs
         
-        filtered_jobs = []
+        columns = self.salary_columns(jobs)
+        has_salary = columns['has_salary']
+        min_annual = columns['min_annual']
+        max_annual = columns['max_annual']
+        multiplier = PERIOD_TO_ANNUAL.get(salary_period, 1)
         
-        for job in jobs:
-            salary_text = job.get('salary', '')
-            if not salary_text or salary_text.lower() in ['not specified', 'n/a', '']:
-                # Include jobs without salary info if no strict filtering
-                if not min_salary or not max_salary:
-                    filtered_jobs.append(job)
-                continue
-            
-            # Parse job salary
-            salary_data = self.parse_salary(salary_text)
-            if not salary_data or not salary_data.get('min_amount'):
-                continue
-            
-            # Normalize to comparison period
-            if salary_period == 'annually':
-                normalized = self.normalize_to_annual(salary_data)
-                job_min = normalized.get('min_annual')
-                job_max = normalized.get('max_annual')
-            else:
-                # Convert user criteria to job's period for comparison
-                job_period = salary_data.get('period', 'annually')
-                if job_period == salary_period:
-                    job_min = salary_data.get('min_amount')
-                    job_max = salary_data.get('max_amount')
-                else:
-                    # Different periods, normalize both to annual
-                    normalized = self.normalize_to_annual(salary_data)
-                    job_min = normalized.get('min_annual')
-                    job_max = normalized.get('max_annual')
-                    
-                    # Convert user criteria to annual
-                    if salary_period == 'hourly':
-                        user_min = min_salary * 40 * 52 if min_salary else None
-                        user_max = max_salary * 40 * 52 if max_salary else None
-                    elif salary_period == 'monthly':
-                        user_min = min_salary * 12 if min_salary else None
-                        user_max = max_salary * 12 if max_salary else None
-                    else:
-                        user_min = min_salary
-                        user_max = max_salary
-                    
-                    min_salary = user_min
-                    max_salary = user_max
-            
-            if not job_min:
-                continue
-            
-            # Check if job salary meets criteria
-            meets_criteria = True
-            
-            if min_salary and job_max and job_max < min_salary:
-                meets_criteria = False
-            
-            if max_salary and job_min and job_min > max_salary:
-                meets_criteria = False
-            
-            if meets_criteria:
+        # Jobs need a parsed amount; NaN comparisons are False, so an
+        # unknown maximum never excludes a job
+        meets_criteria = has_salary & (min_annual > 0)
+        if min_salary:
+            meets_criteria &= ~(max_annual < min_salary * multiplier)
+        if max_salary:
+            meets_criteria &= ~(min_annual > max_salary * multiplier)
+        
+        # Include jobs without salary info if no strict filtering
+        if not min_salary or not max_salary:
+            keep = meets_criteria | ~has_salary
+        else:
+            keep = meets_criteria
+        
+        filtered_jobs = []
+        for i in np.flatnonzero(keep):
+            job = jobs[i]
+            if meets_criteria[i]:
                 # Add parsed salary info to job for display
-                job['parsed_salary'] = salary_data
-                filtered_jobs.append(job)
+                job['parsed_salary'] = dict(columns['parsed'][columns['parsed_index'][i]])
+            filtered_jobs.append(job)
         
         logger.info(f"Salary filtering: {len(jobs)} -> {len(filtered_jobs)} jobs")
         return filtered_jobs
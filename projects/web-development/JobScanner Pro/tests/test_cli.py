@@ -148,7 +148,7 @@ def test_cli_export_json(sample_jobs, tmp_path, mock_config):
     output_file = output_dir / "jobs.json"
     
     # Run CLI with export
-    with patch("jobscanner.main.JobSearch", return_value=mock_search), \
+    with patch("jobscanner.core.search.JobSearch", return_value=mock_search), \
          patch("jobscanner.main.load_config", return_value=mock_config), \
          patch.object(sys, "argv", ["jobscanner", "test query", "--export", "json"]):
         main()
@@ -168,7 +168,7 @@ def test_cli_source_filter(sample_jobs, mock_config):
     mock_search.search.return_value = sample_jobs
     
     # Run CLI with source filter
-    with patch("jobscanner.main.JobSearch", return_value=mock_search), \
+    with patch("jobscanner.core.search.JobSearch", return_value=mock_search), \
          patch("jobscanner.main.load_config", return_value=mock_config), \
          patch.object(sys, "argv", ["jobscanner", "test query", "--source", "indeed"]):
         with patch("sys.stdout", new=StringIO()) as fake_out:
@@ -188,7 +188,7 @@ def test_cli_error_handling(mock_config):
     mock_search.search.side_effect = Exception("Test error")
     
     # Run CLI and check error handling
-    with patch("jobscanner.main.JobSearch", return_value=mock_search), \
+    with patch("jobscanner.core.search.JobSearch", return_value=mock_search), \
          patch("jobscanner.main.load_config", return_value=mock_config), \
          patch.object(sys, "argv", ["jobscanner", "test query"]):
         with pytest.raises(SystemExit):
@@ -201,7 +201,7 @@ def test_cli_keyboard_interrupt(mock_config):
     mock_search.search.side_effect = KeyboardInterrupt()
     
     # Run CLI and check interrupt handling
-    with patch("jobscanner.main.JobSearch", return_value=mock_search), \
+    with patch("jobscanner.core.search.JobSearch", return_value=mock_search), \
          patch("jobscanner.main.load_config", return_value=mock_config), \
          patch.object(sys, "argv", ["jobscanner", "test query"]):
         with pytest.raises(SystemExit) as exc_info:
@@ -2,12 +2,14 @@
 Tests for Kijiji scraper implementation.
 """
 
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import requests
 from jobscanner.scrapers.kijiji import KijijiScraper
+from jobscanner.scrapers.rate_limiter import RateLimiter
 
 @pytest.fixture
 def mock_html():
@@ -91,13 +93,13 @@ def test_get_location_id():
 def test_search_jobs_section(mock_session):
     """Test searching jobs section"""
     scraper = KijijiScraper()
-    jobs = scraper._search_section(
+    jobs = asyncio.run(scraper._search_section(
         scraper.JOBS_URL,
         "designer",
         "1700272",
         {"art-media-design": "c45"},
         "job"
-    )
+    ))
     
     assert len(jobs) == 3
     
@@ -149,14 +151,15 @@ def test_parse_date():
     # Test invalid date
     assert scraper._parse_date("invalid date") is None
 
-@patch('time.sleep')  # Mock sleep to speed up tests
-def test_rate_limiting(mock_sleep, mock_session):
+@patch.object(RateLimiter, 'acquire_async', new_callable=AsyncMock)  # Skip waiting for tokens
+def test_rate_limiting(mock_acquire, mock_session):
     """Test rate limiting behavior"""
     scraper = KijijiScraper()
     scraper.search("designer", "Toronto")
     
-    # Verify delays were added between requests
-    assert mock_sleep.call_count >= 1
+    # Verify every request drew a token from its host's bucket
+    assert mock_acquire.await_count == mock_session.return_value.get.call_count >= 1
+    assert all(args[0].startswith(scraper.BASE_URL) for args, _ in mock_acquire.await_args_list)
 
 def test_error_handling(mock_session):
     """Test error handling for failed requests"""